@@ -12,7 +12,7 @@ sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from app.configs.database import get_database_url, get_configs, AppEnv, Base
 
 # 모든 모델 임포트 (테이블 생성을 위해)
-from app.models import user, bookmark, url
+from app.models import user, bookmark, url, category, url_metadata
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,44 @@
+"""사용자별 북마크 수
+
+Revision ID: 1.10
+Revises: 1.9
+Create Date: 2026-10-18 19:05:48.561207
+
+필터 없는 북마크 목록의 total을 COUNT 없이 제공하도록 삭제되지 않은 북마크 수를
+users.bookmark_count에 저장하고 기존 데이터로 채웁니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1.10'
+down_revision: Union[str, Sequence[str], None] = '1.9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('bookmark_count', sa.Integer(), server_default='0', nullable=False))
+
+    # 기존 북마크 수 백필 (ix_bookmark_notes_user_active_created 인덱스로 사용자별 집계)
+    users = sa.table('users', sa.column('id'), sa.column('bookmark_count'))
+    bookmark_notes = sa.table('bookmark_notes', sa.column('user_id'), sa.column('is_deleted'))
+    op.execute(
+        users.update().values(
+            bookmark_count=sa.select(sa.func.count())
+            .where(
+                bookmark_notes.c.user_id == users.c.id,
+                bookmark_notes.c.is_deleted == sa.false(),
+            )
+            .scalar_subquery()
+        )
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'bookmark_count')
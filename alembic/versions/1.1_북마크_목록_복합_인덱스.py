@@ -0,0 +1,68 @@
+"""북마크 목록 조회용 복합 인덱스
+
+Revision ID: 1.1
+Revises: 1.0
+Create Date: 2026-10-17 10:12:40.118204
+
+사용자별 목록 조회(user_id = ? AND is_deleted = false ORDER BY created_at DESC)와
+카테고리 목록 조회가 파일 정렬 없이 인덱스만으로 처리되도록 복합 인덱스를 추가하고,
+단독으로는 선택도가 낮아 INSERT 비용만 늘리던 단일 컬럼 인덱스를 제거합니다.
+SQLite에서는 삭제되지 않은 행만 담는 부분 인덱스로 생성합니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1.1'
+down_revision: Union[str, Sequence[str], None] = '1.0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# SQLite 부분 인덱스 조건 (MySQL에서는 무시됨)
+ACTIVE_ONLY = sa.text('is_deleted = 0')
+
+COMPOSITE_INDEXES = {
+    'ix_bookmark_notes_user_active_created': ['user_id', 'is_deleted', 'created_at', 'id'],
+    'ix_bookmark_notes_user_active_category1': ['user_id', 'is_deleted', 'category1'],
+    'ix_bookmark_notes_user_active_category2': ['user_id', 'is_deleted', 'category2'],
+    'ix_bookmark_notes_user_active_category3': ['user_id', 'is_deleted', 'category3'],
+}
+
+# 복합 인덱스로 대체되는 단일 컬럼 인덱스
+# (user_id는 복합 인덱스의 선두 컬럼이므로 외래 키 인덱스 역할도 대신함)
+SINGLE_COLUMN_INDEXES = {
+    'ix_bookmark_notes_user_id': 'user_id',
+    'ix_bookmark_notes_is_deleted': 'is_deleted',
+    'ix_bookmark_notes_category1': 'category1',
+    'ix_bookmark_notes_category2': 'category2',
+    'ix_bookmark_notes_category3': 'category3',
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 외래 키 인덱스가 사라지지 않도록 복합 인덱스를 먼저 만든 뒤 단일 인덱스 제거
+    with op.batch_alter_table('bookmark_notes', schema=None) as batch_op:
+        for index_name, columns in COMPOSITE_INDEXES.items():
+            batch_op.create_index(
+                index_name, columns, unique=False, sqlite_where=ACTIVE_ONLY
+            )
+
+    with op.batch_alter_table('bookmark_notes', schema=None) as batch_op:
+        for index_name in SINGLE_COLUMN_INDEXES:
+            batch_op.drop_index(index_name)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('bookmark_notes', schema=None) as batch_op:
+        for index_name, column in SINGLE_COLUMN_INDEXES.items():
+            batch_op.create_index(index_name, [column], unique=False)
+
+    with op.batch_alter_table('bookmark_notes', schema=None) as batch_op:
+        for index_name in COMPOSITE_INDEXES:
+            batch_op.drop_index(index_name)
@@ -0,0 +1,100 @@
+"""북마크 전문 검색 인덱스
+
+Revision ID: 1.2
+Revises: 1.1
+Create Date: 2026-10-17 11:03:27.540391
+
+제목/설명 검색을 선행 와일드카드 LIKE 대신 전문 검색 인덱스로 처리합니다.
+- MySQL: ngram 파서를 사용하는 FULLTEXT 인덱스 (한국어 제목 대응)
+- SQLite: FTS5 섀도 테이블 + 동기화 트리거 (trigram 토크나이저)
+검색에 쓰이지 않던 title 단일 컬럼 인덱스는 제거합니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1.2'
+down_revision: Union[str, Sequence[str], None] = '1.1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SQLITE_FTS_CREATE_STATEMENTS = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS bookmark_notes_fts USING fts5(
+        title, description,
+        content='bookmark_notes', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS bookmark_notes_fts_ai AFTER INSERT ON bookmark_notes
+    BEGIN
+        INSERT INTO bookmark_notes_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS bookmark_notes_fts_ad AFTER DELETE ON bookmark_notes
+    BEGIN
+        INSERT INTO bookmark_notes_fts(bookmark_notes_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS bookmark_notes_fts_au
+    AFTER UPDATE OF title, description ON bookmark_notes
+    BEGIN
+        INSERT INTO bookmark_notes_fts(bookmark_notes_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO bookmark_notes_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    # 기존 데이터로 색인 채우기
+    "INSERT INTO bookmark_notes_fts(bookmark_notes_fts) VALUES ('rebuild')",
+]
+
+SQLITE_FTS_DROP_STATEMENTS = [
+    "DROP TRIGGER IF EXISTS bookmark_notes_fts_au",
+    "DROP TRIGGER IF EXISTS bookmark_notes_fts_ad",
+    "DROP TRIGGER IF EXISTS bookmark_notes_fts_ai",
+    "DROP TABLE IF EXISTS bookmark_notes_fts",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect_name = op.get_bind().dialect.name
+
+    if dialect_name == 'mysql':
+        op.create_index(
+            'ft_bookmark_notes_title_description',
+            'bookmark_notes',
+            ['title', 'description'],
+            mysql_prefix='FULLTEXT',
+            mysql_with_parser='ngram',
+        )
+    elif dialect_name == 'sqlite':
+        for statement in SQLITE_FTS_CREATE_STATEMENTS:
+            op.execute(statement)
+
+    with op.batch_alter_table('bookmark_notes', schema=None) as batch_op:
+        batch_op.drop_index('ix_bookmark_notes_title')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect_name = op.get_bind().dialect.name
+
+    with op.batch_alter_table('bookmark_notes', schema=None) as batch_op:
+        batch_op.create_index('ix_bookmark_notes_title', ['title'], unique=False)
+
+    if dialect_name == 'mysql':
+        op.drop_index(
+            'ft_bookmark_notes_title_description', table_name='bookmark_notes'
+        )
+    elif dialect_name == 'sqlite':
+        for statement in SQLITE_FTS_DROP_STATEMENTS:
+            op.execute(statement)
@@ -0,0 +1,163 @@
+"""카테고리 정규화
+
+Revision ID: 1.3
+Revises: 1.2
+Create Date: 2026-10-17 13:41:09.266517
+
+category1~3 컬럼을 사용자별 categories 테이블과 bookmark_categories 연결 테이블로
+정규화합니다. 기존 값은 배치 단위로 옮기며, category1~3 컬럼은 API 응답 호환을 위해
+남겨둡니다. 카테고리 조회가 연결 테이블로 옮겨가므로 1.1의 카테고리 복합 인덱스는 제거합니다.
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1.3'
+down_revision: Union[str, Sequence[str], None] = '1.2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BACKFILL_BATCH_SIZE = 1000
+
+CATEGORY_COLUMN_POSITIONS = {'category1': 1, 'category2': 2, 'category3': 3}
+
+ACTIVE_ONLY = sa.text('is_deleted = 0')
+
+bookmark_notes = sa.table(
+    'bookmark_notes',
+    sa.column('id', sa.Integer),
+    sa.column('user_id', sa.Integer),
+    sa.column('category1', sa.String),
+    sa.column('category2', sa.String),
+    sa.column('category3', sa.String),
+)
+categories = sa.table(
+    'categories',
+    sa.column('id', sa.Integer),
+    sa.column('user_id', sa.Integer),
+    sa.column('name', sa.String),
+)
+bookmark_categories = sa.table(
+    'bookmark_categories',
+    sa.column('bookmark_id', sa.Integer),
+    sa.column('position', sa.Integer),
+    sa.column('category_id', sa.Integer),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('categories',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('categories', schema=None) as batch_op:
+        batch_op.create_index('ix_categories_user_id_name', ['user_id', 'name'], unique=True)
+
+    op.create_table('bookmark_categories',
+    sa.Column('bookmark_id', sa.Integer(), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('category_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['bookmark_id'], ['bookmark_notes.id'], ),
+    sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ),
+    sa.PrimaryKeyConstraint('bookmark_id', 'position')
+    )
+    with op.batch_alter_table('bookmark_categories', schema=None) as batch_op:
+        batch_op.create_index('ix_bookmark_categories_category_bookmark', ['category_id', 'bookmark_id'], unique=False)
+
+    # 오프라인(--sql) 모드에서는 데이터를 읽을 수 없으므로 백필을 건너뜀
+    if not context.is_offline_mode():
+        _backfill_bookmark_categories(op.get_bind())
+
+    with op.batch_alter_table('bookmark_notes', schema=None) as batch_op:
+        for column in CATEGORY_COLUMN_POSITIONS:
+            batch_op.drop_index(f'ix_bookmark_notes_user_active_{column}')
+
+
+def _backfill_bookmark_categories(connection) -> None:
+    """기존 category1~3 값을 id 순서대로 배치 단위로 옮깁니다."""
+    category_ids = {}
+    last_bookmark_id = 0
+
+    while True:
+        rows = connection.execute(
+            sa.select(bookmark_notes)
+            .where(bookmark_notes.c.id > last_bookmark_id)
+            .order_by(bookmark_notes.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        last_bookmark_id = rows[-1].id
+
+        # 배치에 등장한 카테고리 중 아직 없는 것만 한 번에 생성
+        names_by_user = {}
+        for row in rows:
+            for column in CATEGORY_COLUMN_POSITIONS:
+                name = getattr(row, column)
+                if name and (row.user_id, name) not in category_ids:
+                    names_by_user.setdefault(row.user_id, set()).add(name)
+
+        for user_id, names in names_by_user.items():
+            existing = connection.execute(
+                sa.select(categories.c.id, categories.c.name).where(
+                    categories.c.user_id == user_id,
+                    categories.c.name.in_(names),
+                )
+            ).all()
+            missing = names - {row.name for row in existing}
+            if missing:
+                connection.execute(
+                    categories.insert(),
+                    [{'user_id': user_id, 'name': name} for name in missing],
+                )
+                existing = connection.execute(
+                    sa.select(categories.c.id, categories.c.name).where(
+                        categories.c.user_id == user_id,
+                        categories.c.name.in_(names),
+                    )
+                ).all()
+            for row in existing:
+                category_ids[(user_id, row.name)] = row.id
+
+        links = [
+            {
+                'bookmark_id': row.id,
+                'position': position,
+                'category_id': category_ids[(row.user_id, getattr(row, column))],
+            }
+            for row in rows
+            for column, position in CATEGORY_COLUMN_POSITIONS.items()
+            if getattr(row, column)
+        ]
+        if links:
+            connection.execute(bookmark_categories.insert(), links)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('bookmark_notes', schema=None) as batch_op:
+        for column in CATEGORY_COLUMN_POSITIONS:
+            batch_op.create_index(
+                f'ix_bookmark_notes_user_active_{column}',
+                ['user_id', 'is_deleted', column],
+                unique=False,
+                sqlite_where=ACTIVE_ONLY,
+            )
+
+    with op.batch_alter_table('bookmark_categories', schema=None) as batch_op:
+        batch_op.drop_index('ix_bookmark_categories_category_bookmark')
+
+    op.drop_table('bookmark_categories')
+    with op.batch_alter_table('categories', schema=None) as batch_op:
+        batch_op.drop_index('ix_categories_user_id_name')
+
+    op.drop_table('categories')
@@ -0,0 +1,114 @@
+"""카테고리 트리
+
+Revision ID: 1.4
+Revises: 1.3
+Create Date: 2026-10-17 21:12:40.518204
+
+사용자별 category1 > category2 > category3 트리와 노드별 북마크 수를 담는
+category_tree_nodes 테이블을 추가하고, 기존 북마크로 초기 카운트를 채웁니다.
+이후 카운트는 북마크 생성/카테고리 변경/삭제 트랜잭션에서 증감으로 유지됩니다.
+"""
+from collections import Counter
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1.4'
+down_revision: Union[str, Sequence[str], None] = '1.3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BACKFILL_BATCH_SIZE = 1000
+
+PATH_COLUMNS = ('category1', 'category2', 'category3')
+
+bookmark_notes = sa.table(
+    'bookmark_notes',
+    sa.column('user_id', sa.Integer),
+    sa.column('is_deleted', sa.Boolean),
+    sa.column('category1', sa.String),
+    sa.column('category2', sa.String),
+    sa.column('category3', sa.String),
+)
+category_tree_nodes = sa.table(
+    'category_tree_nodes',
+    sa.column('user_id', sa.Integer),
+    sa.column('category1', sa.String),
+    sa.column('category2', sa.String),
+    sa.column('category3', sa.String),
+    sa.column('depth', sa.Integer),
+    sa.column('bookmark_count', sa.Integer),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('category_tree_nodes',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('category1', sa.String(length=100), server_default='', nullable=False),
+    sa.Column('category2', sa.String(length=100), server_default='', nullable=False),
+    sa.Column('category3', sa.String(length=100), server_default='', nullable=False),
+    sa.Column('depth', sa.Integer(), nullable=False),
+    sa.Column('bookmark_count', sa.Integer(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('category_tree_nodes', schema=None) as batch_op:
+        batch_op.create_index('ix_category_tree_nodes_user_path', ['user_id', 'category1', 'category2', 'category3'], unique=True)
+
+    # 오프라인(--sql) 모드에서는 데이터를 읽을 수 없으므로 백필을 건너뜀
+    if not context.is_offline_mode():
+        _backfill_category_tree(op.get_bind())
+
+
+def _backfill_category_tree(connection) -> None:
+    """사용자별 경로 집계를 읽어 트리 노드를 배치 단위로 생성합니다."""
+    counts = Counter()
+    result = connection.execute(
+        sa.select(
+            bookmark_notes.c.user_id,
+            bookmark_notes.c.category1,
+            bookmark_notes.c.category2,
+            bookmark_notes.c.category3,
+            sa.func.count(),
+        )
+        .where(bookmark_notes.c.is_deleted == sa.false())
+        .group_by(
+            bookmark_notes.c.user_id,
+            bookmark_notes.c.category1,
+            bookmark_notes.c.category2,
+            bookmark_notes.c.category3,
+        )
+    )
+    for user_id, category1, category2, category3, bookmark_count in result:
+        # 비어 있는 단계는 건너뛰고 상위 노드부터 모두 카운트
+        path = tuple(name for name in (category1, category2, category3) if name)
+        for depth in range(1, len(path) + 1):
+            counts[(user_id, path[:depth])] += bookmark_count
+
+    rows = [
+        {
+            'user_id': user_id,
+            'depth': len(path),
+            'bookmark_count': bookmark_count,
+            **dict(zip(PATH_COLUMNS, path + ('',) * (len(PATH_COLUMNS) - len(path)))),
+        }
+        for (user_id, path), bookmark_count in counts.items()
+    ]
+    for start in range(0, len(rows), BACKFILL_BATCH_SIZE):
+        connection.execute(
+            category_tree_nodes.insert(), rows[start:start + BACKFILL_BATCH_SIZE]
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('category_tree_nodes', schema=None) as batch_op:
+        batch_op.drop_index('ix_category_tree_nodes_user_path')
+
+    op.drop_table('category_tree_nodes')
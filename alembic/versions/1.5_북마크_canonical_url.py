@@ -0,0 +1,31 @@
+"""북마크 canonical_url
+
+Revision ID: 1.5
+Revises: 1.4
+Create Date: 2026-10-17 22:05:31.772940
+
+백그라운드 메타데이터 보강에서 페이지의 <link rel="canonical"> 값을 저장할
+bookmark_notes.canonical_url 컬럼을 추가합니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1.5'
+down_revision: Union[str, Sequence[str], None] = '1.4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite에서 테이블을 다시 만들면 FTS 트리거가 사라지므로 batch 모드 대신 ALTER TABLE 사용
+    op.add_column('bookmark_notes', sa.Column('canonical_url', sa.String(length=2048), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('bookmark_notes', 'canonical_url')
@@ -0,0 +1,214 @@
+"""북마크 url_hash
+
+Revision ID: 1.6
+Revises: 1.5
+Create Date: 2026-10-18 09:41:07.215384
+
+정규화 URL의 SHA-256을 담는 bookmark_notes.url_hash 컬럼과 사용자별 고유 인덱스를
+추가합니다. 삭제되지 않은 기존 북마크는 배치 단위로 해시를 채우며, 같은 사용자가 같은
+페이지를 여러 번 저장해 둔 경우 가장 먼저 저장한 노트에만 해시를 채우고 나머지는 그대로 둡니다.
+포트가 잘못된 URL처럼 해석할 수 없는 노트도 해시 없이 둡니다.
+"""
+import hashlib
+import logging
+from typing import Sequence, Union
+from urllib.parse import parse_qsl, urlsplit
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1.6'
+down_revision: Union[str, Sequence[str], None] = '1.5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BACKFILL_BATCH_SIZE = 1000
+
+# url_hash 컬럼 길이 (SHA-256 다이제스트 바이트 수)
+URL_HASH_LENGTH = 32
+
+# 아래는 이 리비전 시점의 app.utils.url_canonicalizer 사본입니다.
+# 이후 정규화 규칙이 바뀌어도 이 마이그레이션이 채우는 값은 달라지지 않도록 고정해 둡니다.
+_TRACKING_PARAMS = frozenset(
+    {
+        "fbclid",
+        "gclid",
+        "dclid",
+        "gbraid",
+        "wbraid",
+        "msclkid",
+        "yclid",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "_hsenc",
+        "_hsmi",
+        "ref_src",
+        "spm",
+    }
+)
+_TRACKING_PARAM_PREFIXES = ("utm_",)
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_YOUTUBE_HOSTS = frozenset(
+    {"youtube.com", "www.youtube.com", "m.youtube.com", "music.youtube.com"}
+)
+_YOUTUBE_SHORT_HOST = "youtu.be"
+_YOUTUBE_PATH_PREFIXES = ("/shorts/", "/embed/", "/live/", "/v/")
+_YOUTUBE_CANONICAL_PREFIX = "https://www.youtube.com/watch?v="
+
+
+def _is_tracking_param(name):
+    name = name.lower()
+    return name in _TRACKING_PARAMS or name.startswith(_TRACKING_PARAM_PREFIXES)
+
+
+def _youtube_video_id(host, path, query):
+    if host == _YOUTUBE_SHORT_HOST:
+        video_id = path.strip("/").split("/")[0]
+        return video_id or None
+    if host not in _YOUTUBE_HOSTS:
+        return None
+    if path.rstrip("/") == "/watch":
+        return dict(parse_qsl(query)).get("v") or None
+    for prefix in _YOUTUBE_PATH_PREFIXES:
+        if path.startswith(prefix):
+            return path[len(prefix) :].split("/")[0] or None
+    return None
+
+
+def _split_url(url):
+    scheme, separator, rest = url.partition("://")
+    if not separator:
+        return tuple(urlsplit(url))
+    rest, _, fragment = rest.partition("#")
+    rest, _, query = rest.partition("?")
+    netloc, slash, path = rest.partition("/")
+    return scheme, netloc, slash + path, query, fragment
+
+
+def _canonicalize_url(url):
+    scheme, netloc, path, query, fragment = _split_url(url.strip())
+    scheme = scheme.lower()
+    if "@" in netloc or ":" in netloc:
+        parts = urlsplit(f"{scheme}://{netloc}")
+        host = (parts.hostname or "").lower()
+        if ":" in host:
+            host = f"[{host}]"
+        netloc = host
+        port = parts.port
+        if port and port != _DEFAULT_PORTS.get(scheme):
+            netloc = f"{host}:{port}"
+        if parts.username:
+            userinfo = parts.username
+            if parts.password:
+                userinfo = f"{userinfo}:{parts.password}"
+            netloc = f"{userinfo}@{netloc}"
+    else:
+        host = netloc = netloc.lower()
+
+    video_id = _youtube_video_id(host, path, query)
+    if video_id:
+        return f"{_YOUTUBE_CANONICAL_PREFIX}{video_id}"
+
+    path = path.rstrip("/") or "/"
+    query = "&".join(
+        sorted(
+            pair
+            for pair in query.split("&")
+            if pair and not _is_tracking_param(pair.partition("=")[0])
+        )
+    )
+    canonical = f"{scheme}://{netloc}{path}"
+    if query:
+        canonical = f"{canonical}?{query}"
+    if fragment.startswith(("!", "/")):
+        canonical = f"{canonical}#{fragment}"
+    return canonical
+
+
+def _url_hash(url):
+    return hashlib.sha256(_canonicalize_url(url).encode()).digest()
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+bookmark_notes = sa.table(
+    'bookmark_notes',
+    sa.column('id', sa.Integer),
+    sa.column('user_id', sa.Integer),
+    sa.column('url', sa.String),
+    sa.column('url_hash', sa.LargeBinary),
+    sa.column('is_deleted', sa.Boolean),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite에서 테이블을 다시 만들면 FTS 트리거가 사라지므로 batch 모드 대신 ALTER TABLE 사용
+    op.add_column('bookmark_notes', sa.Column('url_hash', sa.BINARY(length=URL_HASH_LENGTH), nullable=True))
+
+    # 오프라인(--sql) 모드에서는 데이터를 읽을 수 없으므로 백필을 건너뜀
+    if not context.is_offline_mode():
+        _backfill_url_hash(op.get_bind())
+
+    op.create_index('ux_bookmark_notes_user_url_hash', 'bookmark_notes', ['user_id', 'url_hash'], unique=True)
+
+
+def _backfill_url_hash(connection) -> None:
+    """(user_id, id) 순으로 배치 단위로 읽으며 사용자별 첫 노트에 해시를 채웁니다."""
+    last_key = None
+    current_user_id = None
+    seen = set()
+    duplicates = 0
+    unparsable = 0
+    while True:
+        query = (
+            sa.select(bookmark_notes.c.user_id, bookmark_notes.c.id, bookmark_notes.c.url)
+            .where(bookmark_notes.c.is_deleted == sa.false())
+            .order_by(bookmark_notes.c.user_id, bookmark_notes.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        )
+        if last_key is not None:
+            query = query.where(
+                sa.tuple_(bookmark_notes.c.user_id, bookmark_notes.c.id) > sa.tuple_(*last_key)
+            )
+        rows = connection.execute(query).all()
+        if not rows:
+            break
+
+        updates = []
+        for user_id, bookmark_id, url in rows:
+            if user_id != current_user_id:
+                current_user_id, seen = user_id, set()
+            try:
+                digest = _url_hash(url)
+            except ValueError:
+                # 포트가 잘못된 URL 등은 해석할 수 없으므로 url_hash 없이 유지
+                unparsable += 1
+                continue
+            if digest in seen:
+                duplicates += 1
+                continue
+            seen.add(digest)
+            updates.append({'bookmark_id': bookmark_id, 'new_url_hash': digest})
+        if updates:
+            connection.execute(
+                bookmark_notes.update()
+                .where(bookmark_notes.c.id == sa.bindparam('bookmark_id'))
+                .values(url_hash=sa.bindparam('new_url_hash')),
+                updates,
+            )
+        last_key = rows[-1][:2]
+
+    if duplicates:
+        logger.info(f"정규화 URL이 같은 기존 북마크 {duplicates}건은 url_hash 없이 유지")
+    if unparsable:
+        logger.warning(f"URL을 해석할 수 없는 기존 북마크 {unparsable}건은 url_hash 없이 유지")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ux_bookmark_notes_user_url_hash', table_name='bookmark_notes')
+    op.drop_column('bookmark_notes', 'url_hash')
@@ -0,0 +1,57 @@
+"""공유 URL 메타데이터
+
+Revision ID: 1.7
+Revises: 1.6
+Create Date: 2026-10-18 11:03:52.604117
+
+정규화 URL 해시별로 한 번만 가져온 페이지 메타데이터를 모든 사용자가 공유하는
+url_metadata 테이블과 북마크에서 참조하는 bookmark_notes.url_metadata_id 컬럼을 추가합니다.
+기존 북마크의 제목은 사용자별로 달라질 수 있어 백필하지 않고, 이후 보강 작업에서 채워집니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1.7'
+down_revision: Union[str, Sequence[str], None] = '1.6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('url_metadata',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('url_hash', sa.BINARY(length=32), nullable=False),
+    sa.Column('url', sa.String(length=2048), nullable=False),
+    sa.Column('title', sa.String(length=500), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('thumbnail_url', sa.String(length=2048), nullable=True),
+    sa.Column('canonical_url', sa.String(length=2048), nullable=True),
+    sa.Column('content_type', sa.String(length=100), nullable=True),
+    sa.Column('fetch_status', sa.Enum('OK', 'FAILED', name='urlfetchstatus'), nullable=False),
+    sa.Column('fetched_at', sa.DateTime(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('url_hash')
+    )
+
+    # SQLite에서 테이블을 다시 만들면 FTS 트리거가 사라지므로 batch 모드 대신 ALTER TABLE 사용
+    # (SQLite는 ALTER TABLE로 외래 키를 추가할 수 없어 다른 DB에서만 생성)
+    op.add_column('bookmark_notes', sa.Column('url_metadata_id', sa.Integer(), nullable=True))
+    if op.get_context().dialect.name != 'sqlite':
+        op.create_foreign_key('fk_bookmark_notes_url_metadata_id', 'bookmark_notes', 'url_metadata', ['url_metadata_id'], ['id'])
+    op.create_index(op.f('ix_bookmark_notes_url_metadata_id'), 'bookmark_notes', ['url_metadata_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_context().dialect.name != 'sqlite':
+        op.drop_constraint('fk_bookmark_notes_url_metadata_id', 'bookmark_notes', type_='foreignkey')
+    op.drop_index(op.f('ix_bookmark_notes_url_metadata_id'), table_name='bookmark_notes')
+    op.drop_column('bookmark_notes', 'url_metadata_id')
+    op.drop_table('url_metadata')
@@ -0,0 +1,30 @@
+"""북마크 컬렉션 버전
+
+Revision ID: 1.8
+Revises: 1.7
+Create Date: 2026-10-18 14:21:07.318245
+
+북마크를 바꿀 때마다 증가시키고 조회 API의 ETag를 만드는 users.bookmark_version 컬럼을 추가합니다.
+기존 사용자는 0에서 시작합니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1.8'
+down_revision: Union[str, Sequence[str], None] = '1.7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('bookmark_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'bookmark_version')
@@ -0,0 +1,34 @@
+"""북마크 변경 순번
+
+Revision ID: 1.9
+Revises: 1.8
+Create Date: 2026-10-18 16:42:35.120934
+
+변경 피드(GET /api/bookmark/changes)에서 커서 이후에 바뀐 노트만 읽도록
+bookmark_notes.change_seq 컬럼과 (user_id, change_seq, id) 인덱스를 추가합니다.
+기존 노트는 0에서 시작하므로 첫 동기화에서 id 순으로 모두 전달됩니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1.9'
+down_revision: Union[str, Sequence[str], None] = '1.8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite에서 테이블을 다시 만들면 FTS 트리거가 사라지므로 batch 모드 대신 ALTER TABLE 사용
+    op.add_column('bookmark_notes', sa.Column('change_seq', sa.Integer(), server_default='0', nullable=False))
+    op.create_index('ix_bookmark_notes_user_change_seq', 'bookmark_notes', ['user_id', 'change_seq', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_bookmark_notes_user_change_seq', table_name='bookmark_notes')
+    op.drop_column('bookmark_notes', 'change_seq')
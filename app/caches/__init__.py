@@ -0,0 +1,25 @@
+from .expiring_lru import ExpiringLRUCache
+from .response_cache import (
+    ResponseCache,
+    ResponseCacheBackend,
+    LocalResponseCacheBackend,
+    SharedResponseCacheBackend,
+    InMemorySharedClient,
+    bookmark_list_cache,
+)
+from .token_cache import TokenCache, token_cache
+from .user_cache import UserCache, user_cache
+
+__all__ = [
+    "ExpiringLRUCache",
+    "ResponseCache",
+    "ResponseCacheBackend",
+    "LocalResponseCacheBackend",
+    "SharedResponseCacheBackend",
+    "InMemorySharedClient",
+    "bookmark_list_cache",
+    "TokenCache",
+    "token_cache",
+    "UserCache",
+    "user_cache",
+]
@@ -0,0 +1,172 @@
+import hashlib
+import json
+import math
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from app.caches.expiring_lru import ExpiringLRUCache
+from app.configs.database import get_configs
+
+
+class ResponseCacheBackend:
+    """
+    응답 캐시 저장소 인터페이스
+
+    값은 직렬화된 응답 본문(bytes)이며, 공유 저장소도 같은 방식으로 다룰 수 있도록 비동기입니다.
+    """
+
+    async def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class LocalResponseCacheBackend(ResponseCacheBackend):
+    """프로세스 안 LRU 저장소 (워커마다 따로 보관)"""
+
+    def __init__(self, max_size: int):
+        self._entries = ExpiringLRUCache(max_size=max_size)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._entries.get(key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self._entries.set(key, value, self._entries.clock() + ttl_seconds)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class SharedResponseCacheBackend(ResponseCacheBackend):
+    """
+    여러 워커가 함께 쓰는 외부 저장소 (redis.asyncio.Redis 호환 클라이언트)
+
+    클라이언트는 get(key)과 set(key, value, ex=초)만 제공하면 되며,
+    테스트에서는 InMemorySharedClient를 사용합니다.
+    """
+
+    def __init__(self, client, key_prefix: str = "category-note:"):
+        self.client = client
+        self.key_prefix = key_prefix
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(self.key_prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        await self.client.set(
+            self.key_prefix + key, value, ex=max(1, math.ceil(ttl_seconds))
+        )
+
+    def clear(self) -> None:
+        # 공유 저장소는 다른 워커도 쓰므로 지우지 않고 TTL로 만료되도록 둠
+        return None
+
+
+class InMemorySharedClient:
+    """SharedResponseCacheBackend용 로컬 대역 (get/set(ex=)만 구현한 만료 딕셔너리)"""
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self._values: Dict[str, Tuple[float, bytes]] = {}
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None or entry[0] <= self.clock():
+                self._values.pop(key, None)
+                return None
+            return entry[1]
+
+    async def set(self, key: str, value: bytes, ex: int) -> None:
+        with self._lock:
+            self._values[key] = (self.clock() + ex, value)
+
+
+class ResponseCache:
+    """
+    사용자별 세대(generation)를 키에 포함하는 응답 캐시
+
+    세대는 북마크 쓰기마다 같은 트랜잭션에서 증가하는 users.bookmark_version이므로,
+    커밋된 쓰기 이후의 조회는 항상 새 키를 사용하고 이전 세대 항목은 LRU/TTL로 사라집니다.
+    적중/실패 카운터는 저장소와 관계없이 이 객체에서 집계합니다.
+    """
+
+    def __init__(
+        self, backend: ResponseCacheBackend, ttl_seconds: float, enabled: bool = True
+    ):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(namespace: str, user_id: int, generation: int, params: Any) -> str:
+        """정규화된 조회 조건으로 캐시 키 생성 (검색어 길이와 관계없이 일정한 길이)"""
+        digest = hashlib.sha256(
+            json.dumps(params, ensure_ascii=False, separators=(",", ":")).encode()
+        ).hexdigest()[:32]
+        return f"{namespace}:{user_id}:{generation}:{digest}"
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """캐시된 응답 본문 조회 (없거나 만료되면 None)"""
+        if not self.enabled:
+            return None
+        value = await self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: bytes) -> None:
+        """응답 본문 저장"""
+        if self.enabled:
+            await self.backend.set(key, value, self.ttl_seconds)
+
+    def clear(self) -> None:
+        """저장소와 카운터 초기화"""
+        self.backend.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """캐시 적중/실패 카운터 조회"""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def create_response_cache_backend(configs) -> ResponseCacheBackend:
+    """설정에 따른 응답 캐시 저장소 생성 (redis는 설치된 경우에만 사용)"""
+    if configs.RESPONSE_CACHE_BACKEND == "redis":
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError(
+                "RESPONSE_CACHE_BACKEND=redis를 사용하려면 redis 패키지를 설치해야 합니다"
+            ) from e
+        return SharedResponseCacheBackend(
+            redis.Redis.from_url(configs.RESPONSE_CACHE_REDIS_URL)
+        )
+    return LocalResponseCacheBackend(max_size=configs.RESPONSE_CACHE_MAX_SIZE)
+
+
+_configs = get_configs()
+
+# 애플리케이션 전역 북마크 목록 응답 캐시
+bookmark_list_cache = ResponseCache(
+    backend=create_response_cache_backend(_configs),
+    ttl_seconds=_configs.RESPONSE_CACHE_TTL_SECONDS,
+    enabled=_configs.RESPONSE_CACHE_ENABLED,
+)
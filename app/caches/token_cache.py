@@ -0,0 +1,44 @@
+import hashlib
+import time
+from typing import Optional
+from app.caches.expiring_lru import ExpiringLRUCache
+from app.configs.database import get_configs
+
+
+class TokenCache(ExpiringLRUCache):
+    """
+    검증된 JWT 페이로드 캐시
+
+    토큰 원문 대신 SHA-256 다이제스트를 키로 쓰고, 각 항목은 토큰의 exp 시각에 만료됩니다.
+    검증에 성공한 토큰만 저장하므로 만료/위조 토큰의 처리 결과는 캐시가 없을 때와 같습니다.
+    """
+
+    def __init__(self, max_size: int, enabled: bool = True):
+        # exp 클레임과 같은 기준(UNIX 시각)으로 만료를 판단
+        super().__init__(max_size=max_size, enabled=enabled, clock=time.time)
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        """토큰 캐시 키"""
+        return hashlib.sha256(token.encode()).digest()
+
+    def get_payload(self, token: str) -> Optional[dict]:
+        """캐시된 페이로드 조회 (호출한 쪽이 수정해도 캐시에 영향 없도록 복사본 반환)"""
+        payload = self.get(self._digest(token))
+        return dict(payload) if payload is not None else None
+
+    def set_payload(self, token: str, payload: dict) -> None:
+        """검증된 페이로드 저장 (exp가 없는 토큰은 만료 시점을 알 수 없어 저장하지 않음)"""
+        exp = payload.get("exp")
+        if not isinstance(exp, (int, float)):
+            return
+        self.set(self._digest(token), dict(payload), float(exp))
+
+
+_configs = get_configs()
+
+# 애플리케이션 전역 검증 토큰 캐시
+token_cache = TokenCache(
+    max_size=_configs.TOKEN_CACHE_MAX_SIZE,
+    enabled=_configs.TOKEN_CACHE_ENABLED,
+)
@@ -0,0 +1,54 @@
+import time
+from typing import Optional
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from app.caches.expiring_lru import ExpiringLRUCache
+from app.configs.database import get_configs
+from app.models.user import User
+
+
+class UserCache(ExpiringLRUCache):
+    """
+    인증된 사용자 행 캐시 (LRU + TTL)
+
+    사용자 ID별로 컬럼 값만 복사한 분리(detached) 객체를 보관하고,
+    조회 시 요청 세션에 merge(load=False)로 붙여 SELECT 없이 돌려줍니다.
+    사용자 정보가 바뀌는 쪽에서 invalidate()를 호출해야 합니다.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float, enabled: bool = True):
+        super().__init__(max_size=max_size, enabled=enabled, clock=time.monotonic)
+        self.ttl_seconds = ttl_seconds
+
+    async def get_user(self, db: AsyncSession, user_id: int) -> Optional[User]:
+        """캐시에서 사용자를 찾아 요청 세션에 연결 (없거나 만료되면 None)"""
+        cached_user = self.get(user_id)
+        if cached_user is None:
+            return None
+
+        # 캐시 객체는 그대로 두고 세션에는 복사본이 붙음
+        return await db.merge(cached_user, load=False)
+
+    def set_user(self, user: User) -> None:
+        """조회한 사용자를 캐시에 저장"""
+        if not self.enabled:
+            return
+
+        # 요청 세션의 객체를 공유하지 않도록 컬럼 값만 복사한 분리 객체를 보관
+        cached_user = User()
+        for attr in inspect(User).column_attrs:
+            setattr(cached_user, attr.key, getattr(user, attr.key))
+        make_transient_to_detached(cached_user)
+
+        self.set(user.id, cached_user, self.clock() + self.ttl_seconds)
+
+
+_configs = get_configs()
+
+# 애플리케이션 전역 인증 사용자 캐시
+user_cache = UserCache(
+    max_size=_configs.USER_CACHE_MAX_SIZE,
+    ttl_seconds=_configs.USER_CACHE_TTL_SECONDS,
+    enabled=_configs.USER_CACHE_ENABLED,
+)
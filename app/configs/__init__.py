@@ -1,11 +1,11 @@
-from .database import engine, SessionLocal, get_db
-from .oauth import oauth, JWT_SECRET_KEY, JWT_ALGORITHM
+from .database import get_db, get_engine, get_async_engine
+from .oauth import get_oauth, JWT_SECRET_KEY, JWT_ALGORITHM
 
 __all__ = [
-    "engine",
-    "SessionLocal",
     "get_db",
-    "oauth",
+    "get_engine",
+    "get_async_engine",
+    "get_oauth",
     "JWT_SECRET_KEY",
     "JWT_ALGORITHM",
 ]
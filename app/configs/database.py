@@ -6,10 +6,16 @@ import logging
 
 from dotenv import load_dotenv
 from sqlalchemy import create_engine, MetaData
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
-import pymysql.err
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -101,6 +107,43 @@ class Configs:
     GOOGLE_CLIENT_ID: str = os.getenv("GOOGLE_CLIENT_ID", "")
     GOOGLE_CLIENT_SECRET: str = os.getenv("GOOGLE_CLIENT_SECRET", "")
 
+    # 인증 사용자 캐시 설정
+    USER_CACHE_ENABLED: bool = os.getenv("USER_CACHE_ENABLED", "true").lower() == "true"
+    USER_CACHE_MAX_SIZE: int = int(os.getenv("USER_CACHE_MAX_SIZE", "10000"))
+    USER_CACHE_TTL_SECONDS: int = int(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+
+    # 검증된 토큰 캐시 설정
+    TOKEN_CACHE_ENABLED: bool = (
+        os.getenv("TOKEN_CACHE_ENABLED", "true").lower() == "true"
+    )
+    TOKEN_CACHE_MAX_SIZE: int = int(os.getenv("TOKEN_CACHE_MAX_SIZE", "10000"))
+
+    # 북마크 목록 응답 캐시 설정 (local: 워커별 LRU, redis: 워커 간 공유)
+    RESPONSE_CACHE_ENABLED: bool = (
+        os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+    )
+    RESPONSE_CACHE_BACKEND: str = os.getenv("RESPONSE_CACHE_BACKEND", "local")
+    RESPONSE_CACHE_REDIS_URL: str = os.getenv(
+        "RESPONSE_CACHE_REDIS_URL", "redis://localhost:6379/0"
+    )
+    RESPONSE_CACHE_MAX_SIZE: int = int(os.getenv("RESPONSE_CACHE_MAX_SIZE", "5000"))
+    RESPONSE_CACHE_TTL_SECONDS: int = int(
+        os.getenv("RESPONSE_CACHE_TTL_SECONDS", "300")
+    )
+
+    # 요청/SQL/커넥션 풀 지표 수집 (/metrics)
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+    # 쿼리 진단 (느린 쿼리 EXPLAIN 로그, 요청별 반복 쿼리 감지, 라우트별 쿼리 예산)
+    QUERY_DIAGNOSTICS_ENABLED: bool = (
+        os.getenv("QUERY_DIAGNOSTICS_ENABLED", "false").lower() == "true"
+    )
+    SLOW_QUERY_THRESHOLD_MS: float = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+    REPEATED_QUERY_THRESHOLD: int = int(os.getenv("REPEATED_QUERY_THRESHOLD", "5"))
+    QUERY_BUDGET_ENFORCED: bool = (
+        os.getenv("QUERY_BUDGET_ENFORCED", "false").lower() == "true"
+    )
+
 
 class DevelopmentConfigs(Configs):
     """개발 환경 전용 설정 클래스."""
@@ -161,6 +204,24 @@ def get_database_url() -> str:
     return url
 
 
+# 동기 드라이버 -> 비동기 드라이버 매핑
+_ASYNC_DRIVER_NAMES = {
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_database_url() -> str:
+    """비동기 드라이버(aiomysql, aiosqlite)용 데이터베이스 접속 URL을 반환합니다."""
+    url = make_url(get_database_url())
+    async_driver_name = _ASYNC_DRIVER_NAMES.get(url.get_backend_name())
+    if async_driver_name is None:
+        return url.render_as_string(hide_password=False)
+    return url.set(drivername=async_driver_name).render_as_string(
+        hide_password=False
+    )
+
+
 def get_configs():
     """현재 환경에 맞는 설정 객체를 반환합니다."""
     env_mapping = {
@@ -201,9 +262,19 @@ def get_engine():
             "autocommit": False,
         },
     )
+    _install_query_diagnostics(_engine)
     return _engine
 
 
+def _install_query_diagnostics(engine) -> None:
+    """설정에서 쿼리 진단을 켠 경우 엔진에 SQL 실행 이벤트 등록"""
+    if get_configs().QUERY_DIAGNOSTICS_ENABLED:
+        # 진단 모듈이 이 모듈의 설정을 읽으므로 엔진을 만들 때 import
+        from app.metrics.query_diagnostics import query_diagnostics
+
+        query_diagnostics.install(engine)
+
+
 def get_session() -> Session:
     """SQLAlchemy 세션을 반환합니다."""
     global _session_factory
@@ -236,6 +307,68 @@ def get_session() -> Session:
                 raise
 
 
+# 전역 비동기 엔진 객체 및 세션 팩토리
+_async_engine = None
+_async_session_factory = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """SQLAlchemy 비동기 엔진을 반환합니다. 싱글톤 패턴으로 구현."""
+    global _async_engine
+    if _async_engine is not None:
+        return _async_engine
+
+    url = get_async_database_url()
+    engine_options = {
+        "echo": _CURRENT_ENV
+        in [
+            AppEnv.development.value,
+            AppEnv.local.value,
+        ],  # 개발환경에서만 SQL 로깅
+    }
+    if make_url(url).get_backend_name() == "mysql":
+        engine_options.update(
+            pool_pre_ping=True,  # 연결 상태 확인을 위한 ping 활성화
+            pool_size=10,  # 기본 풀 사이즈
+            max_overflow=20,  # 최대 추가 연결 수
+            pool_timeout=60,  # 풀에서 연결을 기다리는 최대 시간(초)
+            pool_recycle=3600,  # 1시간마다 연결 재활용
+            connect_args={
+                "connect_timeout": 60,
+                "autocommit": False,
+            },
+        )
+        if get_configs().METRICS_ENABLED:
+            from app.metrics.database import InstrumentedAsyncAdaptedQueuePool
+
+            # 체크아웃 대기 시간/오버플로 사용량을 /metrics로 노출
+            engine_options["poolclass"] = InstrumentedAsyncAdaptedQueuePool
+
+    _async_engine = create_async_engine(url, **engine_options)
+    _install_query_diagnostics(_async_engine)
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """비동기 세션 팩토리를 반환합니다."""
+    global _async_session_factory
+
+    if _async_session_factory is None:
+        _async_session_factory = async_sessionmaker(
+            bind=get_async_engine(),
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False,  # 커밋 후 지연 로딩(암묵적 IO) 방지
+        )
+    return _async_session_factory
+
+
+async def dispose_async_engine() -> None:
+    """비동기 엔진의 커넥션 풀 정리 (애플리케이션 종료 시 호출, 엔진은 다시 사용 가능)"""
+    if _async_engine is not None:
+        await _async_engine.dispose()
+
+
 # 안전한 세션 사용을 위한 컨텍스트 매니저
 class safe_session:
     """
@@ -254,6 +387,8 @@ class safe_session:
         return self.session
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        import pymysql.err
+
         try:
             if exc_type is None:
                 # 예외가 없으면 커밋
@@ -269,6 +404,37 @@ class safe_session:
             self.session.close()
 
 
+class safe_async_session:
+    """
+    safe_session의 비동기 버전. 이벤트 루프를 막지 않고 DB 작업을 수행합니다.
+
+    예시:
+    ```
+    async with safe_async_session() as session:
+        result = await session.execute(query)
+    ```
+    """
+
+    async def __aenter__(self) -> AsyncSession:
+        self.session = get_async_session_factory()()
+        return self.session
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        try:
+            if exc_type is None:
+                # 예외가 없으면 커밋
+                await self.session.commit()
+            else:
+                # 예외가 있으면 롤백
+                logger.error(f"세션 예외 발생: {exc_val}")
+                await self.session.rollback()
+        except SQLAlchemyError as e:
+            logger.error(f"세션 종료 중 오류: {str(e)}")
+            await self.session.rollback()
+        finally:
+            await self.session.close()
+
+
 # 트랜잭션 안전 커밋 함수
 def safe_commit(session: Session) -> bool:
     """
@@ -280,6 +446,8 @@ def safe_commit(session: Session) -> bool:
     Returns:
         bool: 커밋 성공 여부
     """
+    import pymysql.err
+
     max_retries = 3
     retry_count = 0
 
@@ -321,14 +489,27 @@ def safe_commit(session: Session) -> bool:
 # SQLAlchemy Base 클래스
 Base = declarative_base()
 
-# 하위 호환성을 위한 기존 변수들
-DATABASE_URL = get_database_url()
-engine = get_engine()
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 하위 호환성을 위한 기존 변수들 (import 시점에 엔진을 만들지 않도록 처음 접근할 때 생성)
+_LEGACY_ATTRIBUTES = {
+    "DATABASE_URL": get_database_url,
+    "engine": get_engine,
+    "SessionLocal": lambda: sessionmaker(
+        autocommit=False, autoflush=False, bind=get_engine()
+    ),
+}
+
+
+def __getattr__(name: str):
+    factory = _LEGACY_ATTRIBUTES.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = factory()
+    globals()[name] = value
+    return value
 
 
 # 의존성 주입용 함수 (FastAPI에서 사용)
-def get_db():
-    """FastAPI 의존성 주입용 데이터베이스 세션 생성 함수"""
-    with safe_session() as session:
+async def get_db():
+    """FastAPI 의존성 주입용 비동기 데이터베이스 세션 생성 함수"""
+    async with safe_async_session() as session:
         yield session
@@ -0,0 +1,133 @@
+import asyncio
+import logging
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# 외부 API 호출 타임아웃 (연결 5초, 나머지 10초)
+HTTP_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+# 커넥션 풀 설정 (keep-alive 연결을 재사용해 로그인마다 TCP/TLS 핸드셰이크를 하지 않음)
+HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+# 연결 실패 시 전송 계층 재시도 횟수
+HTTP_CONNECT_RETRIES = 2
+
+# 재시도할 응답 상태 코드와 요청 단위 재시도 설정
+HTTP_RETRY_STATUS_CODES = {502, 503, 504}
+HTTP_RETRY_ATTEMPTS = 2
+HTTP_RETRY_BACKOFF_SECONDS = 0.2
+
+# 첫 요청이 이 시간 안에 끝나지 않으면 같은 요청을 하나 더 보내 먼저 온 응답을 사용
+HTTP_HEDGE_DELAY_SECONDS = 1.0
+
+# 애플리케이션 전역 HTTP 클라이언트
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def create_http_client(
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> httpx.AsyncClient:
+    """풀링/HTTP2/타임아웃이 설정된 AsyncClient 생성 (transport는 테스트용 교체 지점)"""
+    if transport is None:
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=HTTP_LIMITS,
+            retries=HTTP_CONNECT_RETRIES,
+        )
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=HTTP_TIMEOUT,
+        headers={"Accept": "application/json"},
+    )
+
+
+async def init_http_client(
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> httpx.AsyncClient:
+    """공유 HTTP 클라이언트 초기화 (애플리케이션 시작 시 호출)"""
+    global _http_client
+    if _http_client is None:
+        _http_client = create_http_client(transport)
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """공유 HTTP 클라이언트 종료 (애플리케이션 종료 시 호출)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """공유 HTTP 클라이언트 반환"""
+    if _http_client is None:
+        raise RuntimeError("HTTP 클라이언트가 초기화되지 않았습니다")
+    return _http_client
+
+
+async def hedged_get(
+    url: str,
+    *,
+    headers: Optional[dict] = None,
+    hedge_delay: float = HTTP_HEDGE_DELAY_SECONDS,
+    attempts: int = HTTP_RETRY_ATTEMPTS,
+) -> httpx.Response:
+    """
+    멱등 GET 요청을 재시도/헤징과 함께 수행
+
+    각 시도에서 첫 요청이 hedge_delay 안에 끝나지 않으면 같은 요청을 하나 더 보내고
+    먼저 성공한 응답을 사용합니다. 전송 오류나 일시적인 5xx 응답이면 짧게 쉬고 재시도합니다.
+    """
+    client = get_http_client()
+    for attempt in range(1, attempts + 1):
+        try:
+            response = await _hedged_request(client, url, headers, hedge_delay)
+        except httpx.TransportError as e:
+            if attempt == attempts:
+                raise
+            logger.warning(f"외부 API 요청 실패, {attempt}번째 재시도: {url} ({e})")
+        else:
+            if response.status_code not in HTTP_RETRY_STATUS_CODES or attempt == attempts:
+                return response
+            logger.warning(
+                f"외부 API 일시 오류 {response.status_code}, {attempt}번째 재시도: {url}"
+            )
+        await asyncio.sleep(HTTP_RETRY_BACKOFF_SECONDS * attempt)
+
+
+async def _hedged_request(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: Optional[dict],
+    hedge_delay: float,
+) -> httpx.Response:
+    """첫 요청이 늦으면 한 번 더 보내 먼저 끝난 성공 응답을 반환"""
+    tasks = [asyncio.create_task(client.get(url, headers=headers))]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+        if not done:
+            tasks.append(asyncio.create_task(client.get(url, headers=headers)))
+
+        error = None
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
@@ -1,5 +1,8 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, select
+from app.caches.token_cache import token_cache
+from app.caches.user_cache import user_cache
 from app.models.user import User, ProviderType
 from app.schemas.user import UserCreate, OAuthUserInfo
 from datetime import datetime, timedelta
@@ -10,25 +13,42 @@ from app.configs.oauth import JWT_SECRET_KEY, JWT_ALGORITHM, JWT_EXPIRATION_TIME
 class AuthController:
 
     @staticmethod
-    def get_user_by_email(db: Session, email: str) -> User:
+    async def get_user_by_id(db: AsyncSession, user_id: int) -> Optional[User]:
+        """ID로 사용자 조회"""
+        return await db.scalar(select(User).where(User.id == user_id))
+
+    @staticmethod
+    async def get_authenticated_user(
+        db: AsyncSession, user_id: int
+    ) -> Optional[User]:
+        """인증된 요청의 사용자 조회 (사용자 캐시 우선, 없으면 DB 조회 후 저장)"""
+        user = await user_cache.get_user(db, user_id)
+        if user is not None:
+            return user
+
+        user = await AuthController.get_user_by_id(db, user_id)
+        if user is not None:
+            user_cache.set_user(user)
+        return user
+
+    @staticmethod
+    async def get_user_by_email(db: AsyncSession, email: str) -> User:
         """이메일로 사용자 조회"""
-        return db.query(User).filter(User.email == email).first()
+        return await db.scalar(select(User).where(User.email == email))
 
     @staticmethod
-    def get_user_by_provider(
-        db: Session, provider: ProviderType, provider_id: str
+    async def get_user_by_provider(
+        db: AsyncSession, provider: ProviderType, provider_id: str
     ) -> User:
         """OAuth 제공자와 ID로 사용자 조회"""
-        return (
-            db.query(User)
-            .filter(
+        return await db.scalar(
+            select(User).where(
                 and_(User.provider == provider, User.provider_id == provider_id)
             )
-            .first()
         )
 
     @staticmethod
-    def create_user(db: Session, user_data: OAuthUserInfo) -> User:
+    async def create_user(db: AsyncSession, user_data: OAuthUserInfo) -> User:
         """새 사용자 생성"""
         db_user = User(
             email=user_data.email,
@@ -40,16 +60,17 @@ class AuthController:
             is_verified=True,  # OAuth 로그인은 기본적으로 인증된 것으로 처리
         )
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        await db.commit()
+        await db.refresh(db_user)
         return db_user
 
     @staticmethod
-    def update_last_login(db: Session, user: User) -> User:
+    async def update_last_login(db: AsyncSession, user: User) -> User:
         """마지막 로그인 시간 업데이트"""
         user.last_login_at = datetime.utcnow()
-        db.commit()
-        db.refresh(user)
+        await db.commit()
+        await db.refresh(user)
+        user_cache.invalidate(user.id)
         return user
 
     @staticmethod
@@ -65,11 +86,16 @@ class AuthController:
 
     @staticmethod
     def verify_token(token: str) -> dict:
-        """JWT 토큰 검증"""
+        """JWT 토큰 검증 (검증에 성공한 페이로드는 exp까지 캐시)"""
+        payload = token_cache.get_payload(token)
+        if payload is not None:
+            return payload
+
         try:
             payload = jwt.decode(
                 token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM]
             )
+            token_cache.set_payload(token, payload)
             return payload
         except jwt.ExpiredSignatureError:
             return None
@@ -77,10 +103,12 @@ class AuthController:
             return None
 
     @staticmethod
-    def get_or_create_user(db: Session, oauth_user: OAuthUserInfo) -> User:
+    async def get_or_create_user(
+        db: AsyncSession, oauth_user: OAuthUserInfo
+    ) -> User:
         """OAuth 사용자 정보로 기존 사용자 조회 또는 새 사용자 생성"""
         # 먼저 provider와 provider_id로 조회
-        user = AuthController.get_user_by_provider(
+        user = await AuthController.get_user_by_provider(
             db, oauth_user.provider, oauth_user.provider_id
         )
 
@@ -88,9 +116,10 @@ class AuthController:
             # 기존 사용자가 있으면 정보 업데이트
             user.full_name = oauth_user.full_name or user.full_name
             user.avatar_url = oauth_user.avatar_url or user.avatar_url
-            db.commit()
-            db.refresh(user)
+            await db.commit()
+            await db.refresh(user)
+            user_cache.invalidate(user.id)
             return user
 
         # 새 사용자 생성
-        return AuthController.create_user(db, oauth_user)
+        return await AuthController.create_user(db, oauth_user)
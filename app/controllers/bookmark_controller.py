@@ -1,38 +1,92 @@
 from datetime import datetime
-from typing import Optional, Tuple, List
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
+from typing import Dict, Optional, Tuple, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, or_, func, insert, select, literal, String
+from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 from app.models.bookmark import BookmarkNote
+from app.models.category import (
+    Category,
+    BookmarkCategory,
+    CATEGORY_COLUMN_POSITIONS,
+)
 from app.models.user import User
-from app.schemas.bookmark import BookmarkNoteCreate, BookmarkNoteCategoryUpdate
+from app.controllers.bookmark_search_controller import BookmarkSearchController
+from app.controllers.category_tree_controller import CategoryTreeController
+from app.controllers.collection_version_controller import (
+    CollectionVersionController,
+)
+from app.controllers.url_metadata_controller import UrlMetadataController
+from app.workers.bookmark_enrichment import bookmark_enrichment_worker
+from app.utils.url_canonicalizer import url_hash as canonical_url_hash
+from app.schemas.bookmark import (
+    BookmarkNoteCreate,
+    BookmarkNoteCategoryUpdate,
+    BookmarkNoteResponse,
+    BookmarkNoteSummaryResponse,
+    BookmarkNoteSortOrder,
+)
+import base64
+import binascii
+import json
 import math
 
+# 조회 응답에 필요한 컬럼만 읽는 Core SELECT 목록 (BookmarkNoteResponse 필드와 같은 순서)
+BOOKMARK_NOTE_RESPONSE_COLUMNS = tuple(
+    BookmarkNote.__table__.c[name] for name in BookmarkNoteResponse.model_fields
+)
+
+# 목록 조회 기본 필드 (TEXT 컬럼인 description 제외)
+BOOKMARK_NOTE_SUMMARY_FIELDS = tuple(BookmarkNoteSummaryResponse.model_fields)
+
 
 class BookmarkController:
     """북마크 노트 컨트롤러"""
 
     @staticmethod
-    def create_bookmark_note(
-        db: Session, bookmark_data: BookmarkNoteCreate, user_id: int
+    async def create_bookmark_note(
+        db: AsyncSession, bookmark_data: BookmarkNoteCreate, user_id: int
     ) -> BookmarkNote:
-        """북마크 노트 생성"""
+        """북마크 노트 생성 (정규화 URL이 같은 노트가 이미 있으면 기존 노트 반환)"""
         # 사용자 존재 확인
-        user = db.query(User).filter(User.id == user_id).first()
+        user = await db.scalar(select(User).where(User.id == user_id))
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="사용자를 찾을 수 없습니다",
             )
 
-        # 임시로 제목을 URL로 설정 (나중에 AI로 생성할 예정)
-        title = f"북마크 - {str(bookmark_data.url)[:50]}..."
+        url = str(bookmark_data.url)
+        url_hash = canonical_url_hash(url)
+
+        # 같은 페이지(정규화 URL)를 이미 저장했다면 새로 만들지 않고 기존 노트 반환
+        existing = await BookmarkController.get_bookmark_note_by_url_hash(
+            db, user_id, url_hash
+        )
+        if existing:
+            return existing
+
+        # 다른 사용자가 저장해 둔 같은 페이지의 메타데이터가 있으면 가져오지 않고 사용
+        url_metadata = (
+            await UrlMetadataController.get_fresh_metadata(db, [url_hash])
+        ).get(url_hash)
 
-        # 북마크 노트 생성
+        # 메타데이터가 없으면 임시 제목 (백그라운드에서 가져와 교체됨)
+        title = (url_metadata and url_metadata.title) or (
+            BookmarkController.placeholder_title(url)
+        )
+
+        # 북마크 노트 생성 (컬렉션 버전을 먼저 올려 변경 순번으로 기록)
+        change_seq = await CollectionVersionController.next_change_seq(db, user_id)
         bookmark_note = BookmarkNote(
             title=title,
-            url=str(bookmark_data.url),
+            url=url,
+            url_hash=url_hash,
+            description=url_metadata.description if url_metadata else None,
+            canonical_url=url_metadata.canonical_url if url_metadata else None,
+            url_metadata_id=url_metadata.id if url_metadata else None,
             user_id=user_id,
+            change_seq=change_seq,
             # 카테고리는 나중에 AI로 생성할 예정
             category1=None,
             category2=None,
@@ -40,75 +94,461 @@ class BookmarkController:
         )
 
         db.add(bookmark_note)
-        db.commit()
-        db.refresh(bookmark_note)
+        try:
+            # 같은 트랜잭션에서 카테고리 트리 카운트 반영
+            await CategoryTreeController.apply_path_change(
+                db,
+                user_id,
+                new_path=CategoryTreeController.bookmark_path(bookmark_note),
+            )
+            await db.commit()
+        except IntegrityError:
+            # 동시에 같은 URL을 저장한 요청이 먼저 커밋한 경우
+            await db.rollback()
+            existing = await BookmarkController.get_bookmark_note_by_url_hash(
+                db, user_id, url_hash
+            )
+            if existing:
+                return existing
+            raise
+        await db.refresh(bookmark_note)
+
+        # 제목/설명은 응답 후 백그라운드에서 채움
+        if url_metadata is None:
+            bookmark_enrichment_worker.enqueue(bookmark_note.id, bookmark_note.url)
         return bookmark_note
 
     @staticmethod
-    def get_bookmark_notes(
-        db: Session,
+    async def insert_bookmark_rows(
+        db: AsyncSession, user_id: int, rows: List[dict]
+    ) -> Dict[bytes, int]:
+        """
+        북마크 노트 행을 다중 행 INSERT 한 번으로 저장하고 정규화 URL 해시별 ID 반환
+
+        Core INSERT는 ORM flush 이벤트(sync_bookmark_category_links)를 거치지 않으므로
+        category1~3 값이 있는 행의 카테고리 연결과 트리 카운트를 여기서 함께 기록합니다.
+        북마크 수와 변경 순번은 호출한 쪽에서 반영하며, 커밋도 하지 않습니다.
+        """
+        # 다중 행 VALUES는 모든 행의 컬럼이 같아야 하므로 카테고리가 없는 행은 NULL로 채움
+        rows = [{**dict.fromkeys(CATEGORY_COLUMN_POSITIONS), **row} for row in rows]
+        await db.execute(insert(BookmarkNote.__table__).values(rows))
+        created_ids = await BookmarkController.get_bookmark_ids_by_url_hash(
+            db, user_id, [row["url_hash"] for row in rows]
+        )
+
+        categorized_rows = {}
+        paths = []
+        for row in rows:
+            path = CategoryTreeController.category_path(
+                *(row.get(column) for column in CATEGORY_COLUMN_POSITIONS)
+            )
+            if path:
+                categorized_rows[created_ids[row["url_hash"]]] = row
+                paths.append(path)
+        if categorized_rows:
+            await BookmarkController._insert_category_links(
+                db, user_id, categorized_rows
+            )
+            await CategoryTreeController.add_paths(db, user_id, paths)
+        return created_ids
+
+    @staticmethod
+    async def _insert_category_links(
+        db: AsyncSession, user_id: int, rows_by_bookmark_id: Dict[int, dict]
+    ) -> None:
+        """새로 저장한 북마크 노트의 category1~3 값을 연결 테이블에 기록 (없는 카테고리는 생성)"""
+        names = {
+            row[column]
+            for row in rows_by_bookmark_id.values()
+            for column in CATEGORY_COLUMN_POSITIONS
+            if row.get(column)
+        }
+        category_ids = await BookmarkController._get_category_ids(db, user_id, names)
+        missing = names - category_ids.keys()
+        if missing:
+            await db.execute(
+                insert(Category),
+                [{"user_id": user_id, "name": name} for name in sorted(missing)],
+            )
+            category_ids = await BookmarkController._get_category_ids(
+                db, user_id, names
+            )
+
+        await db.execute(
+            insert(BookmarkCategory),
+            [
+                {
+                    "bookmark_id": bookmark_id,
+                    "position": position,
+                    "category_id": category_ids[row[column]],
+                }
+                for bookmark_id, row in rows_by_bookmark_id.items()
+                for column, position in CATEGORY_COLUMN_POSITIONS.items()
+                if row.get(column)
+            ],
+        )
+
+    @staticmethod
+    async def _get_category_ids(
+        db: AsyncSession, user_id: int, names: set
+    ) -> Dict[str, int]:
+        """사용자의 카테고리 이름별 ID (사용자별 이름 유일 인덱스 사용)"""
+        rows = await db.execute(
+            select(Category.name, Category.id).where(
+                and_(Category.user_id == user_id, Category.name.in_(names))
+            )
+        )
+        return dict(rows.all())
+
+    @staticmethod
+    async def get_bookmark_note_by_url_hash(
+        db: AsyncSession, user_id: int, url_hash: bytes
+    ) -> Optional[BookmarkNote]:
+        """정규화 URL 해시로 삭제되지 않은 북마크 노트 조회 (사용자별 고유 인덱스 사용)"""
+        return await db.scalar(
+            select(BookmarkNote).where(
+                and_(
+                    BookmarkNote.user_id == user_id,
+                    BookmarkNote.url_hash == url_hash,
+                )
+            )
+        )
+
+    @staticmethod
+    async def get_bookmark_ids_by_url_hash(
+        db: AsyncSession, user_id: int, url_hashes: List[bytes]
+    ) -> Dict[bytes, int]:
+        """정규화 URL 해시별 북마크 노트 ID (사용자별 고유 인덱스에 IN 쿼리 한 번)"""
+        if not url_hashes:
+            return {}
+        rows = await db.execute(
+            select(BookmarkNote.url_hash, BookmarkNote.id).where(
+                and_(
+                    BookmarkNote.user_id == user_id,
+                    BookmarkNote.url_hash.in_(url_hashes),
+                )
+            )
+        )
+        return dict(rows.all())
+
+    @staticmethod
+    async def lookup_bookmark_ids(
+        db: AsyncSession, user_id: int, urls: List[str]
+    ) -> Dict[str, Optional[int]]:
+        """URL별로 이미 저장된 북마크 노트 ID 조회 (없거나 해석할 수 없는 URL은 None)"""
+        hashes = {}
+        for url in urls:
+            try:
+                hashes[url] = canonical_url_hash(url)
+            except ValueError:
+                hashes[url] = None
+        bookmark_ids = await BookmarkController.get_bookmark_ids_by_url_hash(
+            db, user_id, list({digest for digest in hashes.values() if digest})
+        )
+        return {url: bookmark_ids.get(digest) for url, digest in hashes.items()}
+
+    @staticmethod
+    def placeholder_title(url: str) -> str:
+        """메타데이터를 가져오기 전까지 사용할 임시 제목"""
+        return f"북마크 - {url[:50]}..."
+
+    @staticmethod
+    def parse_fields(fields: Optional[str]) -> Tuple[str, ...]:
+        """
+        fields 쿼리(쉼표 구분)를 응답 필드 목록으로 변환
+
+        지정하지 않으면 요약 필드를 사용하고, id는 항상 포함합니다.
+        같은 필드 집합은 같은 결과가 되도록 응답 스키마 순서로 정렬해 반환합니다.
+        """
+        if not fields:
+            return BOOKMARK_NOTE_SUMMARY_FIELDS
+
+        names = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = names - set(BookmarkNoteResponse.model_fields)
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"알 수 없는 필드입니다: {', '.join(sorted(unknown))}",
+            )
+        names.add("id")
+        return tuple(name for name in BookmarkNoteResponse.model_fields if name in names)
+
+    @staticmethod
+    async def get_bookmark_notes(
+        db: AsyncSession,
         user_id: int,
         page: int = 1,
         size: int = 20,
         category: Optional[str] = None,
         search: Optional[str] = None,
-    ) -> Tuple[List[BookmarkNote], int]:
-        """북마크 노트 리스트 조회 (페이지네이션)"""
-        query = db.query(BookmarkNote).filter(
+        cursor: Optional[str] = None,
+        sort: BookmarkNoteSortOrder = BookmarkNoteSortOrder.LATEST,
+        fields: Tuple[str, ...] = BOOKMARK_NOTE_SUMMARY_FIELDS,
+        include_total: bool = True,
+    ) -> Tuple[List[dict], Optional[int], Optional[str], bool]:
+        """
+        북마크 노트 리스트 조회 (페이지네이션)
+
+        ORM 객체 대신 fields에 해당하는 컬럼만 Core SELECT로 읽어 딕셔너리로 반환합니다.
+        cursor가 주어지면 OFFSET 대신 (created_at, id) 키셋 조건으로 이어서 조회합니다.
+        sort가 relevance이고 검색어가 있으면 전문 검색 관련도 순으로 정렬합니다.
+
+        total은 필터가 없으면 users.bookmark_count를, 필터가 있으면 COUNT를 사용하며
+        include_total이 False면 세지 않고 None입니다.
+        반환값은 (노트 목록, total, 다음 페이지 커서(마지막 페이지면 None), 다음 페이지 존재 여부)입니다.
+        """
+        relevance_sort = bool(search) and sort == BookmarkNoteSortOrder.RELEVANCE
+        if cursor and relevance_sort:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="커서는 최신순 정렬에서만 사용할 수 있습니다",
+            )
+
+        # 다음 페이지 커서에 필요한 created_at은 요청하지 않아도 읽고 응답에서 제외
+        columns = [BookmarkNote.__table__.c[name] for name in fields]
+        with_created_at = "created_at" in fields
+        if not with_created_at:
+            columns.append(BookmarkNote.__table__.c.created_at)
+        query = select(*columns).where(
             and_(
                 BookmarkNote.user_id == user_id,
                 BookmarkNote.is_deleted == False,
             )
         )
 
-        # 카테고리 필터링
+        # 카테고리 필터링 (이름 부분 일치, 대소문자 무시)
+        # 사용자의 카테고리 목록(user_id 인덱스 범위)에서만 이름을 비교하고,
+        # 북마크는 연결 테이블 인덱스로 category_id 동등 조건 조회
         if category:
-            query = query.filter(
-                or_(
-                    BookmarkNote.category1.ilike(f"%{category}%"),
-                    BookmarkNote.category2.ilike(f"%{category}%"),
-                    BookmarkNote.category3.ilike(f"%{category}%"),
+            query = query.where(
+                BookmarkNote.id.in_(
+                    select(BookmarkCategory.bookmark_id)
+                    .join(Category, Category.id == BookmarkCategory.category_id)
+                    .where(
+                        and_(
+                            Category.user_id == user_id,
+                            Category.name.ilike(f"%{category}%"),
+                        )
+                    )
                 )
             )
 
-        # 검색 필터링
+        # 검색 필터링 (DB별 전문 검색 인덱스 사용)
+        relevance = None
         if search:
-            query = query.filter(
+            query, relevance = BookmarkSearchController.apply_search_filter(
+                query, search, db.get_bind().dialect.name
+            )
+
+        # 총 개수 계산 (필터가 없으면 사용자별 북마크 수로 COUNT 생략)
+        total = None
+        if include_total and (category or search):
+            total = await db.scalar(
+                select(func.count()).select_from(query.subquery())
+            )
+        elif include_total:
+            total = await CollectionVersionController.get_bookmark_count(
+                db, user_id
+            )
+
+        # 페이지네이션 적용 (다음 페이지 존재 여부 확인을 위해 size + 1개 조회)
+        if relevance_sort:
+            query = query.order_by(relevance.desc())
+        query = query.order_by(
+            BookmarkNote.created_at.desc(), BookmarkNote.id.desc()
+        )
+        if cursor:
+            cursor_created_at, cursor_id = BookmarkController._decode_cursor(
+                cursor
+            )
+            query = query.where(
+                BookmarkController._before_cursor(
+                    cursor_created_at, cursor_id, db.get_bind().dialect.name
+                )
+            )
+        else:
+            query = query.offset((page - 1) * size)
+
+        result = await db.execute(query.limit(size + 1))
+        bookmark_notes = [row._asdict() for row in result]
+
+        next_cursor = None
+        has_more = len(bookmark_notes) > size
+        if has_more:
+            bookmark_notes = bookmark_notes[:size]
+            if not relevance_sort:
+                next_cursor = BookmarkController._encode_cursor(
+                    bookmark_notes[-1]
+                )
+        if not with_created_at:
+            for bookmark_note in bookmark_notes:
+                del bookmark_note["created_at"]
+
+        return bookmark_notes, total, next_cursor, has_more
+
+    @staticmethod
+    def _encode_cursor(bookmark_note: dict) -> str:
+        """마지막 항목의 (created_at, id)를 불투명한 커서 문자열로 인코딩"""
+        raw = json.dumps(
+            [
+                bookmark_note["created_at"].isoformat(
+                    sep=" ", timespec="microseconds"
+                ),
+                bookmark_note["id"],
+            ]
+        )
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        """커서 문자열을 (created_at, id)로 디코딩"""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            created_at, bookmark_id = json.loads(
+                base64.urlsafe_b64decode(padded.encode())
+            )
+            return datetime.fromisoformat(created_at), int(bookmark_id)
+        except (ValueError, TypeError, binascii.Error):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="유효하지 않은 커서입니다",
+            ) from None
+
+    @staticmethod
+    def _before_cursor(created_at: datetime, bookmark_id: int, dialect_name: str):
+        """
+        (created_at, id) < (:created_at, :id) 를 인덱스를 탈 수 있는 형태로 전개
+
+        created_at은 컬럼 타입으로 바인딩해 시각으로 비교합니다.
+        SQLite는 시각을 문자열로 저장하는데 CURRENT_TIMESTAMP 기본값은 소수 초 없이
+        ('YYYY-MM-DD HH:MM:SS'), 직접 넣은 값은 '.000000'까지 저장되므로
+        정각 커서는 두 표기를 같은 시각으로 취급합니다.
+        """
+        column = BookmarkNote.created_at
+        if dialect_name == "sqlite" and not created_at.microsecond:
+            whole_second = literal(created_at.strftime("%Y-%m-%d %H:%M:%S"), String)
+            return or_(
+                column < whole_second,
+                and_(
+                    or_(column == whole_second, column == created_at),
+                    BookmarkNote.id < bookmark_id,
+                ),
+            )
+        return or_(
+            column < created_at,
+            and_(column == created_at, BookmarkNote.id < bookmark_id),
+        )
+
+    @staticmethod
+    async def get_changes(
+        db: AsyncSession,
+        user_id: int,
+        since: Optional[str] = None,
+        limit: int = 500,
+    ) -> Tuple[List[BookmarkNote], str, bool]:
+        """
+        커서 이후에 바뀐 북마크 노트 조회 (변경 피드)
+
+        (user_id, change_seq, id) 인덱스를 순서대로 읽으므로 비용은 라이브러리 크기가 아니라
+        바뀐 노트 수에 비례합니다. 삭제된 노트도 is_deleted가 설정된 채로 포함되며,
+        since가 없는 첫 동기화에서는 삭제된 노트를 건너뜁니다.
+        반환값은 (노트 목록, 다음 커서, 남은 변경 존재 여부)이며 변경이 없으면 커서는 그대로입니다.
+        """
+        query = select(BookmarkNote).where(BookmarkNote.user_id == user_id)
+        if since:
+            change_seq, bookmark_id = BookmarkController._decode_change_cursor(
+                since
+            )
+            # (change_seq, id) > (:change_seq, :id) 를 인덱스를 탈 수 있는 형태로 전개
+            query = query.where(
                 or_(
-                    BookmarkNote.title.ilike(f"%{search}%"),
-                    BookmarkNote.description.ilike(f"%{search}%"),
+                    BookmarkNote.change_seq > change_seq,
+                    and_(
+                        BookmarkNote.change_seq == change_seq,
+                        BookmarkNote.id > bookmark_id,
+                    ),
                 )
             )
+        else:
+            change_seq, bookmark_id = 0, 0
+            query = query.where(BookmarkNote.is_deleted == False)
 
-        # 총 개수 계산
-        total = query.count()
+        result = await db.scalars(
+            query.order_by(BookmarkNote.change_seq, BookmarkNote.id).limit(
+                limit + 1
+            )
+        )
+        bookmark_notes = list(result.all())
 
-        # 페이지네이션 적용
-        offset = (page - 1) * size
-        bookmark_notes = (
-            query.order_by(BookmarkNote.created_at.desc())
-            .offset(offset)
-            .limit(size)
-            .all()
+        has_more = len(bookmark_notes) > limit
+        bookmark_notes = bookmark_notes[:limit]
+        if bookmark_notes:
+            change_seq = bookmark_notes[-1].change_seq
+            bookmark_id = bookmark_notes[-1].id
+        next_cursor = BookmarkController._encode_change_cursor(
+            change_seq, bookmark_id
         )
+        return bookmark_notes, next_cursor, has_more
 
-        return bookmark_notes, total
+    @staticmethod
+    def _encode_change_cursor(change_seq: int, bookmark_id: int) -> str:
+        """마지막으로 받은 변경의 (change_seq, id)를 불투명한 커서 문자열로 인코딩"""
+        raw = json.dumps([change_seq, bookmark_id])
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_change_cursor(cursor: str) -> Tuple[int, int]:
+        """변경 피드 커서 문자열을 (change_seq, id)로 디코딩"""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            change_seq, bookmark_id = json.loads(
+                base64.urlsafe_b64decode(padded.encode())
+            )
+            return int(change_seq), int(bookmark_id)
+        except (ValueError, TypeError, binascii.Error):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="유효하지 않은 커서입니다",
+            ) from None
 
     @staticmethod
-    def get_bookmark_note(
-        db: Session, bookmark_id: int, user_id: int
+    async def get_bookmark_note_fields(
+        db: AsyncSession, bookmark_id: int, user_id: int
+    ) -> dict:
+        """특정 북마크 노트의 응답 필드 조회 (ORM 객체 없이 Core SELECT 한 번)"""
+        row = (
+            await db.execute(
+                select(*BOOKMARK_NOTE_RESPONSE_COLUMNS).where(
+                    and_(
+                        BookmarkNote.id == bookmark_id,
+                        BookmarkNote.user_id == user_id,
+                        BookmarkNote.is_deleted == False,
+                    )
+                )
+            )
+        ).first()
+
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="북마크 노트를 찾을 수 없습니다",
+            )
+
+        return row._asdict()
+
+    @staticmethod
+    async def get_bookmark_note(
+        db: AsyncSession, bookmark_id: int, user_id: int
     ) -> BookmarkNote:
         """특정 북마크 노트 조회"""
-        bookmark_note = (
-            db.query(BookmarkNote)
-            .filter(
+        bookmark_note = await db.scalar(
+            select(BookmarkNote).where(
                 and_(
                     BookmarkNote.id == bookmark_id,
                     BookmarkNote.user_id == user_id,
                     BookmarkNote.is_deleted == False,
                 )
             )
-            .first()
         )
 
         if not bookmark_note:
@@ -120,17 +560,22 @@ class BookmarkController:
         return bookmark_note
 
     @staticmethod
-    def update_bookmark_categories(
-        db: Session,
+    async def update_bookmark_categories(
+        db: AsyncSession,
         bookmark_id: int,
         user_id: int,
         category_data: BookmarkNoteCategoryUpdate,
     ) -> BookmarkNote:
         """북마크 노트 카테고리 업데이트"""
-        bookmark_note = BookmarkController.get_bookmark_note(
+        bookmark_note = await BookmarkController.get_bookmark_note(
             db, bookmark_id, user_id
         )
 
+        old_path = CategoryTreeController.bookmark_path(bookmark_note)
+        bookmark_note.change_seq = await CollectionVersionController.next_change_seq(
+            db, user_id
+        )
+
         # 카테고리 업데이트
         if category_data.category1 is not None:
             bookmark_note.category1 = category_data.category1
@@ -141,85 +586,58 @@ class BookmarkController:
 
         bookmark_note.updated_at = datetime.utcnow()
 
-        db.commit()
-        db.refresh(bookmark_note)
+        await CategoryTreeController.apply_path_change(
+            db,
+            user_id,
+            old_path=old_path,
+            new_path=CategoryTreeController.bookmark_path(bookmark_note),
+        )
+        await db.commit()
+        await db.refresh(bookmark_note)
         return bookmark_note
 
     @staticmethod
-    def delete_bookmark_note(
-        db: Session, bookmark_id: int, user_id: int
+    async def delete_bookmark_note(
+        db: AsyncSession, bookmark_id: int, user_id: int
     ) -> BookmarkNote:
         """북마크 노트 소프트 삭제"""
-        bookmark_note = BookmarkController.get_bookmark_note(
+        bookmark_note = await BookmarkController.get_bookmark_note(
             db, bookmark_id, user_id
         )
 
-        # 소프트 삭제
+        # 소프트 삭제 (변경 피드에 삭제 기록으로 남도록 순번 갱신)
+        bookmark_note.change_seq = await CollectionVersionController.next_change_seq(
+            db, user_id
+        )
         bookmark_note.is_deleted = True
         bookmark_note.deleted_at = datetime.utcnow()
+        # 같은 URL을 다시 저장할 수 있도록 중복 판별 키 해제
+        bookmark_note.url_hash = None
         bookmark_note.updated_at = datetime.utcnow()
 
-        db.commit()
-        db.refresh(bookmark_note)
+        await CategoryTreeController.apply_path_change(
+            db,
+            user_id,
+            old_path=CategoryTreeController.bookmark_path(bookmark_note),
+        )
+        await db.commit()
+        await db.refresh(bookmark_note)
         return bookmark_note
 
     @staticmethod
-    def get_categories(db: Session, user_id: int) -> List[str]:
-        """사용자의 모든 카테고리 조회"""
-        # 각 카테고리 컬럼에서 고유한 값들을 가져와서 합치기
-        categories = set()
-
-        # category1에서 가져오기
-        cat1_results = (
-            db.query(BookmarkNote.category1)
-            .filter(
-                and_(
-                    BookmarkNote.user_id == user_id,
-                    BookmarkNote.is_deleted == False,
-                    BookmarkNote.category1.isnot(None),
-                )
-            )
-            .distinct()
-            .all()
-        )
-
-        # category2에서 가져오기
-        cat2_results = (
-            db.query(BookmarkNote.category2)
-            .filter(
-                and_(
-                    BookmarkNote.user_id == user_id,
-                    BookmarkNote.is_deleted == False,
-                    BookmarkNote.category2.isnot(None),
-                )
-            )
-            .distinct()
-            .all()
-        )
-
-        # category3에서 가져오기
-        cat3_results = (
-            db.query(BookmarkNote.category3)
-            .filter(
+    async def get_categories(db: AsyncSession, user_id: int) -> List[str]:
+        """사용자의 모든 카테고리 조회 (삭제되지 않은 북마크에 연결된 카테고리만)"""
+        result = await db.scalars(
+            select(Category.name)
+            .join(BookmarkCategory, BookmarkCategory.category_id == Category.id)
+            .join(BookmarkNote, BookmarkNote.id == BookmarkCategory.bookmark_id)
+            .where(
                 and_(
-                    BookmarkNote.user_id == user_id,
+                    Category.user_id == user_id,
                     BookmarkNote.is_deleted == False,
-                    BookmarkNote.category3.isnot(None),
                 )
             )
             .distinct()
-            .all()
+            .order_by(Category.name)
         )
-
-        # 결과를 set에 추가
-        for result in cat1_results:
-            if result[0]:
-                categories.add(result[0])
-        for result in cat2_results:
-            if result[0]:
-                categories.add(result[0])
-        for result in cat3_results:
-            if result[0]:
-                categories.add(result[0])
-
-        return sorted(list(categories))
+        return list(result.all())
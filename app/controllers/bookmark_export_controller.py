@@ -0,0 +1,112 @@
+import csv
+import io
+import json
+import zlib
+from typing import AsyncIterator, Iterable
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+from app.models.bookmark import BookmarkNote
+from app.schemas.bookmark import BookmarkExportFormat
+
+# 서버 사이드 커서에서 한 번에 가져오는 행 수
+EXPORT_BATCH_SIZE = 1000
+
+# 내보내는 컬럼 (CSV 헤더 순서)
+EXPORT_COLUMNS = (
+    "id",
+    "title",
+    "url",
+    "category1",
+    "category2",
+    "category3",
+    "description",
+    "canonical_url",
+    "created_at",
+    "updated_at",
+)
+
+EXPORT_MEDIA_TYPES = {
+    BookmarkExportFormat.NDJSON: "application/x-ndjson",
+    BookmarkExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+class BookmarkExportController:
+    """북마크 내보내기 컨트롤러"""
+
+    @staticmethod
+    async def stream_bookmark_notes(
+        engine: AsyncEngine,
+        user_id: int,
+        export_format: BookmarkExportFormat,
+        gzip: bool = False,
+    ) -> AsyncIterator[bytes]:
+        """
+        사용자의 북마크 노트를 인코딩된 바이트 조각으로 스트리밍
+
+        서버 사이드 커서(stream_results)로 EXPORT_BATCH_SIZE개씩 읽어 바로 인코딩하므로
+        라이브러리 크기와 관계없이 메모리 사용량이 일정합니다. ORM 객체 대신 컬럼 행만 읽습니다.
+        응답 본문이 만들어지는 동안 요청 세션이 이미 닫혔을 수 있어 별도 연결을 사용합니다.
+        """
+        statement = (
+            select(*(getattr(BookmarkNote, column) for column in EXPORT_COLUMNS))
+            .where(
+                and_(
+                    BookmarkNote.user_id == user_id,
+                    BookmarkNote.is_deleted == False,
+                )
+            )
+            # 목록 조회용 복합 인덱스 순서 그대로 읽어 별도 정렬 없음
+            .order_by(BookmarkNote.created_at, BookmarkNote.id)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        encode = (
+            BookmarkExportController._encode_ndjson
+            if export_format == BookmarkExportFormat.NDJSON
+            else BookmarkExportController._encode_csv
+        )
+        compressor = zlib.compressobj(wbits=31) if gzip else None  # gzip 컨테이너
+
+        if export_format == BookmarkExportFormat.CSV:
+            chunk = BookmarkExportController._encode_csv([EXPORT_COLUMNS])
+            yield compressor.compress(chunk) if compressor else chunk
+
+        async with engine.connect() as connection:
+            result = await connection.stream(statement)
+            async for rows in result.partitions():
+                chunk = encode(rows)
+                if compressor:
+                    chunk = compressor.compress(chunk)
+                    if not chunk:
+                        continue
+                yield chunk
+
+        if compressor:
+            yield compressor.flush()
+
+    @staticmethod
+    def _encode_ndjson(rows: Iterable) -> bytes:
+        """행 묶음을 줄 단위 JSON으로 인코딩"""
+        return b"".join(
+            json.dumps(
+                dict(zip(EXPORT_COLUMNS, row)),
+                ensure_ascii=False,
+                default=lambda value: value.isoformat(),
+            ).encode()
+            + b"\n"
+            for row in rows
+        )
+
+    @staticmethod
+    def _encode_csv(rows: Iterable) -> bytes:
+        """행 묶음을 CSV로 인코딩"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows(
+            [
+                value.isoformat() if hasattr(value, "isoformat") else value
+                for value in row
+            ]
+            for row in rows
+        )
+        return buffer.getvalue().encode()
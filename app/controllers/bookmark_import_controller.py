@@ -0,0 +1,355 @@
+import csv
+import io
+import json
+from html.parser import HTMLParser
+from typing import BinaryIO, Dict, Iterator, List, Optional, TextIO, Tuple
+from urllib.parse import urlsplit
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException, status
+from app.models.user import User
+from app.controllers.bookmark_controller import BookmarkController
+from app.controllers.collection_version_controller import (
+    CollectionVersionController,
+)
+from app.controllers.url_metadata_controller import UrlMetadataController
+from app.schemas.bookmark import BookmarkImportFormat, BookmarkImportItemStatus
+from app.workers.bookmark_enrichment import bookmark_enrichment_worker
+from app.utils.url_canonicalizer import url_hash
+
+# 파일을 읽는 단위 (문자 수)
+IMPORT_READ_SIZE = 64 * 1024
+
+# 한 번의 다중 행 INSERT와 트랜잭션에 담는 항목 수
+IMPORT_CHUNK_SIZE = 500
+
+# 북마크 컬럼 길이 제한
+_MAX_URL_LENGTH = 2048
+_MAX_TITLE_LENGTH = 500
+
+# Takeout 시청 기록 제목 앞에 붙는 문구
+_TAKEOUT_TITLE_PREFIX = "Watched "
+
+ImportItem = Tuple[str, Optional[str]]
+
+
+class _AnchorParser(HTMLParser):
+    """<a href>와 링크 텍스트를 모으는 파서 (북마크 HTML은 DT/A 구조)"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.items: List[ImportItem] = []
+        self._href: Optional[str] = None
+        self._text: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "a":
+            self._href = dict(attrs).get("href") or ""
+            self._text = []
+
+    def handle_data(self, data):
+        if self._href is not None:
+            self._text.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == "a" and self._href is not None:
+            self.items.append((self._href, "".join(self._text)))
+            self._href = None
+
+
+def _parse_html(stream: TextIO) -> Iterator[ImportItem]:
+    """Chrome/Firefox/Pocket 북마크 HTML을 조각 단위로 읽으며 링크 반환"""
+    parser = _AnchorParser()
+    while True:
+        chunk = stream.read(IMPORT_READ_SIZE)
+        if not chunk:
+            parser.close()
+        else:
+            parser.feed(chunk)
+        yield from parser.items
+        parser.items = []
+        if not chunk:
+            return
+
+
+def _parse_pocket_csv(stream: TextIO) -> Iterator[ImportItem]:
+    """Pocket CSV 내보내기(title,url,time_added,tags,status)를 한 행씩 읽으며 링크 반환"""
+    for row in csv.DictReader(stream):
+        yield row.get("url") or "", row.get("title")
+
+
+def _parse_takeout_json(stream: TextIO) -> Iterator[ImportItem]:
+    """Takeout watch-history.json 배열을 조각 단위로 읽으며 항목별로 디코딩"""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    started = False
+    eof = False
+
+    while True:
+        # 공백, 배열 시작/구분 문자 건너뛰기
+        while position < len(buffer) and buffer[position] in " \t\r\n,[":
+            started = started or buffer[position] == "["
+            position += 1
+        if position < len(buffer) and buffer[position] == "]":
+            return
+
+        if position < len(buffer) and started:
+            try:
+                entry, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise ValueError("JSON 형식이 올바르지 않습니다") from None
+            else:
+                position = end
+                if isinstance(entry, dict):
+                    title = entry.get("title") or ""
+                    if title.startswith(_TAKEOUT_TITLE_PREFIX):
+                        title = title[len(_TAKEOUT_TITLE_PREFIX) :]
+                    yield entry.get("titleUrl") or "", title
+                continue
+
+        if eof:
+            if started:
+                raise ValueError("JSON 형식이 올바르지 않습니다")
+            return
+        chunk = stream.read(IMPORT_READ_SIZE)
+        eof = not chunk
+        buffer = buffer[position:] + chunk
+        position = 0
+
+
+_PARSERS = {
+    BookmarkImportFormat.HTML: _parse_html,
+    BookmarkImportFormat.POCKET_CSV: _parse_pocket_csv,
+    BookmarkImportFormat.TAKEOUT_JSON: _parse_takeout_json,
+}
+
+
+class BookmarkImportController:
+    """북마크 가져오기 컨트롤러"""
+
+    @staticmethod
+    def detect_format(file: BinaryIO) -> BookmarkImportFormat:
+        """파일 앞부분으로 형식 판별 (읽은 위치는 되돌림)"""
+        head = file.read(1024).decode("utf-8-sig", errors="ignore").lstrip()
+        file.seek(0)
+        if head.startswith("["):
+            return BookmarkImportFormat.TAKEOUT_JSON
+        if head.startswith("<"):
+            return BookmarkImportFormat.HTML
+        return BookmarkImportFormat.POCKET_CSV
+
+    @staticmethod
+    def validate_url(url: str) -> Optional[str]:
+        """URL 검증 (북마크 생성과 같은 규칙, 실패 시 오류 메시지 반환)"""
+        if len(url) > _MAX_URL_LENGTH:
+            return "URL이 너무 깁니다"
+        try:
+            parts = urlsplit(url)
+            _ = parts.port  # 잘못된 포트는 여기서 ValueError
+        except ValueError:
+            return "URL 형식이 올바르지 않습니다"
+        if not parts.netloc or not parts.hostname:
+            return "URL 형식이 올바르지 않습니다"
+        if parts.scheme != "https":
+            return "HTTPS URL만 허용됩니다"
+        return None
+
+    @staticmethod
+    async def import_bookmarks(
+        db: AsyncSession,
+        user_id: int,
+        file: BinaryIO,
+        import_format: BookmarkImportFormat = BookmarkImportFormat.AUTO,
+    ) -> dict:
+        """
+        업로드된 내보내기 파일에서 북마크 노트를 일괄 생성
+
+        파일은 조각 단위로 읽으며, 유효한 URL을 IMPORT_CHUNK_SIZE개씩 모아
+        이미 있는 URL을 한 번에 걸러낸 뒤 다중 행 INSERT 한 번과 커밋 한 번으로 저장합니다.
+        파일 전체를 읽고 검증한 뒤에 저장을 시작하므로, 파일이 깨져 400을 반환하면 아무것도 저장되지 않습니다.
+        """
+        user_exists = await db.scalar(select(User.id).where(User.id == user_id))
+        if not user_exists:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="사용자를 찾을 수 없습니다",
+            )
+
+        if import_format == BookmarkImportFormat.AUTO:
+            import_format = BookmarkImportController.detect_format(file)
+
+        stream = io.TextIOWrapper(
+            file, encoding="utf-8-sig", errors="replace", newline=""
+        )
+        results: List[dict] = []
+        first_results: Dict[bytes, dict] = {}
+        chunks: List[List[dict]] = [[]]
+        try:
+            for index, (url, title) in enumerate(_PARSERS[import_format](stream)):
+                url = url.strip()
+                result = {"index": index, "url": url, "bookmark_id": None, "error": None}
+                results.append(result)
+
+                error = BookmarkImportController.validate_url(url)
+                if error:
+                    result.update(status=BookmarkImportItemStatus.INVALID, error=error)
+                    continue
+                result["_hash"] = url_hash(url)
+                if result["_hash"] in first_results:
+                    # 파일 안 중복(정규화 URL 기준)은 첫 항목의 결과(북마크 ID)를 따름
+                    result.update(status=BookmarkImportItemStatus.DUPLICATE)
+                    result["_first"] = first_results[result["_hash"]]
+                    continue
+
+                first_results[result["_hash"]] = result
+                result["_title"] = (title or "").strip()[:_MAX_TITLE_LENGTH]
+                if len(chunks[-1]) >= IMPORT_CHUNK_SIZE:
+                    chunks.append([])
+                chunks[-1].append(result)
+        except (ValueError, csv.Error) as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"파일을 읽을 수 없습니다: {e}",
+            ) from e
+        finally:
+            # UploadFile은 호출한 쪽에서 닫음
+            stream.detach()
+
+        to_enrich: List[dict] = []
+        for chunk in chunks:
+            if chunk:
+                to_enrich += await BookmarkImportController._insert_chunk(
+                    db, user_id, chunk
+                )
+
+        # 제목도 공유 메타데이터도 없던 항목만 페이지를 가져와 채움
+        # (대기열이 가득 차거나 작업자가 멈춰 있으면 나머지는 넣지 않고 개수만 요약에 반영)
+        enrichment_skipped = 0
+        for result in to_enrich:
+            if enrichment_skipped or not bookmark_enrichment_worker.enqueue(
+                result["bookmark_id"], result["url"]
+            ):
+                enrichment_skipped += 1
+
+        summary = {
+            "total": len(results),
+            "created": 0,
+            "duplicates": 0,
+            "invalid": 0,
+            "enrichment_skipped": enrichment_skipped,
+        }
+        for result in results:
+            first = result.pop("_first", None)
+            result.pop("_title", None)
+            result.pop("_hash", None)
+            if first is not None:
+                result["bookmark_id"] = first["bookmark_id"]
+            if result["status"] == BookmarkImportItemStatus.CREATED:
+                summary["created"] += 1
+            elif result["status"] == BookmarkImportItemStatus.DUPLICATE:
+                summary["duplicates"] += 1
+            else:
+                summary["invalid"] += 1
+
+        return {"format": import_format, "summary": summary, "items": results}
+
+    @staticmethod
+    async def _insert_chunk(
+        db: AsyncSession, user_id: int, chunk: List[dict]
+    ) -> List[dict]:
+        """
+        이미 있는 URL을 걸러내고 나머지를 다중 행 INSERT 한 번으로 저장 후 커밋
+
+        다른 요청이 같은 URL을 먼저 저장해 고유 인덱스 충돌이 나면 이 묶음만 되돌리고,
+        이미 있는 URL을 다시 걸러 DUPLICATE로 표시한 뒤 나머지를 다시 저장합니다.
+        제목도 공유 메타데이터도 없어 페이지를 가져와야 하는 항목을 반환합니다.
+        """
+        conflict = None
+        while True:
+            new_results = await BookmarkImportController._mark_existing(
+                db, user_id, chunk
+            )
+            if not new_results:
+                return []
+            if conflict is not None and len(new_results) == conflict_size:
+                # 다시 걸러도 줄어들지 않으면 URL 충돌이 아닌 오류
+                raise conflict
+            rows = await BookmarkImportController._build_rows(
+                db, user_id, new_results
+            )
+            try:
+                created_ids = await BookmarkController.insert_bookmark_rows(
+                    db, user_id, rows
+                )
+                await db.commit()
+                break
+            except IntegrityError as e:
+                await db.rollback()
+                conflict, conflict_size = e, len(new_results)
+
+        to_enrich = []
+        for result in new_results:
+            result.update(
+                status=BookmarkImportItemStatus.CREATED,
+                bookmark_id=created_ids[result["_hash"]],
+            )
+            if result.pop("_enrich"):
+                to_enrich.append(result)
+        return to_enrich
+
+    @staticmethod
+    async def _mark_existing(
+        db: AsyncSession, user_id: int, chunk: List[dict]
+    ) -> List[dict]:
+        """이미 저장된 URL은 DUPLICATE로 표시하고 새로 저장할 항목만 반환"""
+        existing = await BookmarkController.get_bookmark_ids_by_url_hash(
+            db, user_id, [result["_hash"] for result in chunk]
+        )
+
+        new_results = []
+        for result in chunk:
+            if result["_hash"] in existing:
+                result.update(
+                    status=BookmarkImportItemStatus.DUPLICATE,
+                    bookmark_id=existing[result["_hash"]],
+                )
+            else:
+                new_results.append(result)
+        return new_results
+
+    @staticmethod
+    async def _build_rows(
+        db: AsyncSession, user_id: int, new_results: List[dict]
+    ) -> List[dict]:
+        """새로 저장할 항목의 INSERT 행 (북마크 수와 변경 순번도 같은 트랜잭션에서 반영)"""
+        # 다른 사용자가 이미 가져온 페이지는 공유 메타데이터로 바로 채움
+        shared = await UrlMetadataController.get_fresh_metadata(
+            db, {result["_hash"] for result in new_results}
+        )
+        # 다중 행 INSERT는 ORM 이벤트를 거치지 않으므로 북마크 수도 함께 반영
+        change_seq = await CollectionVersionController.next_change_seq(
+            db, user_id, bookmark_count_delta=len(new_results)
+        )
+        rows = []
+        for result in new_results:
+            metadata = shared.get(result["_hash"])
+            result["_enrich"] = metadata is None and not result["_title"]
+            rows.append(
+                {
+                    "title": result["_title"]
+                    or (metadata and metadata.title)
+                    or BookmarkController.placeholder_title(result["url"]),
+                    "url": result["url"],
+                    "url_hash": result["_hash"],
+                    "description": metadata.description if metadata else None,
+                    "canonical_url": metadata.canonical_url if metadata else None,
+                    "url_metadata_id": metadata.id if metadata else None,
+                    "user_id": user_id,
+                    "is_deleted": False,
+                    "change_seq": change_seq,
+                }
+            )
+        return rows
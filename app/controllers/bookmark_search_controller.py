@@ -0,0 +1,104 @@
+from typing import Tuple
+from sqlalchemy import (
+    Select,
+    case,
+    column,
+    func,
+    literal_column,
+    or_,
+    select,
+    table,
+)
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.sql.elements import ColumnElement
+from app.models.bookmark import BookmarkNote, BOOKMARK_NOTES_FTS_TABLE
+
+
+class BookmarkSearchController:
+    """북마크 전문 검색 컨트롤러 (DB 종류별 검색 엔진 선택)"""
+
+    # SQLite trigram 토크나이저가 처리할 수 있는 최소 검색어 길이
+    SQLITE_TRIGRAM_MIN_LENGTH = 3
+    # MySQL ngram 파서의 토큰 길이 (서버 ngram_token_size 기본값), 이보다 짧은 검색어는 색인에 없음
+    MYSQL_NGRAM_TOKEN_SIZE = 2
+
+    @staticmethod
+    def apply_search_filter(
+        query: Select, search: str, dialect_name: str
+    ) -> Tuple[Select, ColumnElement]:
+        """
+        검색 조건을 쿼리에 적용하고 관련도 점수 표현식을 함께 반환
+
+        - MySQL: ngram 파서 FULLTEXT 인덱스 (MATCH ... AGAINST)
+        - SQLite: FTS5 섀도 테이블 (trigram 토크나이저, bm25 점수)
+        - 그 외 / 짧은 검색어: LIKE 검색 (제목 일치 우선)
+
+        관련도 점수는 값이 클수록 검색어와 더 관련 있는 북마크입니다.
+        """
+        if (
+            dialect_name == "mysql"
+            and len(search) >= BookmarkSearchController.MYSQL_NGRAM_TOKEN_SIZE
+        ):
+            return BookmarkSearchController._apply_mysql_fulltext(query, search)
+
+        if (
+            dialect_name == "sqlite"
+            and len(search) >= BookmarkSearchController.SQLITE_TRIGRAM_MIN_LENGTH
+        ):
+            return BookmarkSearchController._apply_sqlite_fts(query, search)
+
+        return BookmarkSearchController._apply_like(query, search)
+
+    @staticmethod
+    def _apply_mysql_fulltext(
+        query: Select, search: str
+    ) -> Tuple[Select, ColumnElement]:
+        """MySQL FULLTEXT(ngram) 검색 적용"""
+        # 구문(phrase) 검색으로 ngram 토큰이 연속으로 일치하는 문서만 조회
+        phrase = '"' + search.replace('"', " ") + '"'
+        relevance = match(
+            BookmarkNote.title, BookmarkNote.description, against=phrase
+        ).in_boolean_mode()
+        return query.where(relevance > 0), relevance
+
+    @staticmethod
+    def _apply_sqlite_fts(
+        query: Select, search: str
+    ) -> Tuple[Select, ColumnElement]:
+        """
+        SQLite FTS5 검색 적용
+
+        FTS 테이블을 그냥 조인하면 플래너가 사용자 북마크를 바깥 루프로 두고 행마다 MATCH를
+        다시 실행하므로(북마크 수 × 검색 비용), 일치하는 행을 MATERIALIZED CTE로 한 번만
+        찾은 뒤 기본 키로 조인합니다.
+        """
+        fts_table = table(BOOKMARK_NOTES_FTS_TABLE, column("rowid"))
+        fts_table_name = literal_column(BOOKMARK_NOTES_FTS_TABLE)
+        phrase = '"' + search.replace('"', '""') + '"'
+
+        matches = (
+            select(
+                fts_table.c.rowid.label("rowid"),
+                # bm25는 값이 작을수록 관련도가 높으므로 부호를 뒤집어 사용
+                (-func.bm25(fts_table_name)).label("relevance"),
+            )
+            .where(fts_table_name.op("MATCH")(phrase))
+            .cte("bookmark_search_matches")
+            .prefix_with("MATERIALIZED")
+        )
+        query = query.join(matches, matches.c.rowid == BookmarkNote.id)
+        return query, matches.c.relevance
+
+    @staticmethod
+    def _apply_like(query: Select, search: str) -> Tuple[Select, ColumnElement]:
+        """LIKE 검색 적용 (전문 검색 인덱스를 쓸 수 없는 경우)"""
+        query = query.where(
+            or_(
+                BookmarkNote.title.ilike(f"%{search}%"),
+                BookmarkNote.description.ilike(f"%{search}%"),
+            )
+        )
+        relevance = case(
+            (BookmarkNote.title.ilike(f"%{search}%"), 1), else_=0
+        )
+        return query, relevance
@@ -0,0 +1,271 @@
+from collections import Counter
+from typing import Iterable, List, Optional, Tuple
+from sqlalchemy import and_, delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.bookmark import BookmarkNote
+from app.models.category import CategoryTreeNode
+from app.utils.upsert import upsert_statement
+
+CategoryPath = Tuple[str, ...]
+
+_PATH_COLUMNS = ("category1", "category2", "category3")
+
+
+class CategoryTreeController:
+    """사용자별 카테고리 트리 컨트롤러"""
+
+    @staticmethod
+    def category_path(
+        category1: Optional[str],
+        category2: Optional[str],
+        category3: Optional[str],
+    ) -> CategoryPath:
+        """category1~3 값을 트리 경로로 변환 (비어 있는 단계는 건너뜀)"""
+        return tuple(name for name in (category1, category2, category3) if name)
+
+    @staticmethod
+    def bookmark_path(bookmark_note: BookmarkNote) -> CategoryPath:
+        """북마크 노트의 현재 카테고리 트리 경로"""
+        return CategoryTreeController.category_path(
+            bookmark_note.category1,
+            bookmark_note.category2,
+            bookmark_note.category3,
+        )
+
+    @staticmethod
+    def _prefixes(path: CategoryPath) -> List[CategoryPath]:
+        """경로에 포함된 모든 노드 (상위 노드부터)"""
+        return [path[:depth] for depth in range(1, len(path) + 1)]
+
+    @staticmethod
+    def _node_values(path: CategoryPath) -> dict:
+        """트리 경로를 category1~3 컬럼 값으로 변환 (하위 단계는 빈 문자열)"""
+        padded = path + ("",) * (len(_PATH_COLUMNS) - len(path))
+        return dict(zip(_PATH_COLUMNS, padded))
+
+    @staticmethod
+    async def apply_path_change(
+        db: AsyncSession,
+        user_id: int,
+        old_path: CategoryPath = (),
+        new_path: CategoryPath = (),
+    ) -> None:
+        """
+        북마크 하나의 경로 변경을 트리 카운트에 반영
+
+        호출한 쪽의 트랜잭션 안에서 실행되며 커밋은 하지 않습니다.
+        생성은 old_path 없이, 삭제는 new_path 없이 호출합니다.
+        """
+        await CategoryTreeController.apply_count_deltas(
+            db,
+            user_id,
+            Counter(CategoryTreeController._prefixes(new_path))
+            - Counter(CategoryTreeController._prefixes(old_path)),
+            Counter(CategoryTreeController._prefixes(old_path))
+            - Counter(CategoryTreeController._prefixes(new_path)),
+        )
+
+    @staticmethod
+    async def add_paths(
+        db: AsyncSession, user_id: int, paths: Iterable[CategoryPath]
+    ) -> None:
+        """여러 북마크를 한 번에 추가한 경로를 트리 카운트에 반영 (다중 행 INSERT용)"""
+        increments = Counter()
+        for path in paths:
+            increments.update(CategoryTreeController._prefixes(path))
+        await CategoryTreeController.apply_count_deltas(
+            db, user_id, increments, Counter()
+        )
+
+    @staticmethod
+    async def apply_count_deltas(
+        db: AsyncSession,
+        user_id: int,
+        increments: Counter,
+        decrements: Counter,
+    ) -> None:
+        """노드별 증가/감소량을 반영하고 카운트가 0이 된 노드를 정리"""
+        if increments:
+            await CategoryTreeController._increment_nodes(db, user_id, increments)
+
+        if decrements:
+            for path, amount in decrements.items():
+                await db.execute(
+                    update(CategoryTreeNode)
+                    .where(CategoryTreeController._node_condition(user_id, path))
+                    .values(bookmark_count=CategoryTreeNode.bookmark_count - amount)
+                )
+            await db.execute(
+                delete(CategoryTreeNode).where(
+                    and_(
+                        CategoryTreeNode.user_id == user_id,
+                        CategoryTreeNode.bookmark_count <= 0,
+                    )
+                )
+            )
+
+    @staticmethod
+    async def _increment_nodes(
+        db: AsyncSession, user_id: int, increments: Counter
+    ) -> None:
+        """노드 카운트 증가 (없으면 생성)"""
+        rows = [
+            {
+                "user_id": user_id,
+                "depth": len(path),
+                "bookmark_count": amount,
+                **CategoryTreeController._node_values(path),
+            }
+            for path, amount in increments.items()
+        ]
+
+        statement = upsert_statement(
+            db.get_bind().dialect.name,
+            CategoryTreeNode.__table__,
+            ["user_id", *_PATH_COLUMNS],
+            lambda new: {
+                "bookmark_count": CategoryTreeNode.bookmark_count
+                + new.bookmark_count
+            },
+        )
+        if statement is None:
+            # 업서트를 지원하지 않는 DB는 조회 후 갱신/생성
+            for path, row in zip(increments, rows):
+                result = await db.execute(
+                    update(CategoryTreeNode)
+                    .where(CategoryTreeController._node_condition(user_id, path))
+                    .values(
+                        bookmark_count=CategoryTreeNode.bookmark_count
+                        + row["bookmark_count"]
+                    )
+                )
+                if result.rowcount == 0:
+                    await db.execute(insert(CategoryTreeNode).values(**row))
+            return
+
+        for row in rows:
+            await db.execute(statement.values(**row))
+
+    @staticmethod
+    def _node_condition(user_id: int, path: CategoryPath):
+        """특정 트리 노드를 가리키는 조건 (유일 인덱스와 같은 컬럼)"""
+        values = CategoryTreeController._node_values(path)
+        return and_(
+            CategoryTreeNode.user_id == user_id,
+            *(
+                getattr(CategoryTreeNode, column) == value
+                for column, value in values.items()
+            ),
+        )
+
+    @staticmethod
+    async def get_category_tree(db: AsyncSession, user_id: int) -> List[dict]:
+        """
+        사용자의 카테고리 트리 조회
+
+        유일 인덱스 순서대로 한 번 읽어 중첩 구조로 조립하므로
+        북마크 수와 관계없이 카테고리 수에만 비례합니다.
+        """
+        result = await db.execute(
+            select(
+                CategoryTreeNode.category1,
+                CategoryTreeNode.category2,
+                CategoryTreeNode.category3,
+                CategoryTreeNode.depth,
+                CategoryTreeNode.bookmark_count,
+            )
+            .where(CategoryTreeNode.user_id == user_id)
+            .order_by(
+                CategoryTreeNode.category1,
+                CategoryTreeNode.category2,
+                CategoryTreeNode.category3,
+            )
+        )
+
+        roots: List[dict] = []
+        nodes_by_path = {}
+        for category1, category2, category3, depth, bookmark_count in result:
+            path = (category1, category2, category3)[:depth]
+            node = {
+                "name": path[-1],
+                "bookmark_count": bookmark_count,
+                "children": [],
+            }
+            nodes_by_path[path] = node
+            parent = nodes_by_path.get(path[:-1])
+            if parent is not None:
+                parent["children"].append(node)
+            else:
+                roots.append(node)
+
+        return roots
+
+    @staticmethod
+    async def rebuild_category_tree(
+        db: AsyncSession, user_ids: Optional[Iterable[int]] = None
+    ) -> int:
+        """
+        북마크 노트 기준으로 카테고리 트리를 처음부터 다시 생성
+
+        user_ids가 없으면 북마크가 있는 모든 사용자를 대상으로 합니다.
+        커밋은 호출한 쪽에서 하며, 생성한 노드 수를 반환합니다.
+        """
+        if user_ids is None:
+            user_ids = (
+                await db.scalars(
+                    select(BookmarkNote.user_id)
+                    .distinct()
+                    .union(select(CategoryTreeNode.user_id).distinct())
+                )
+            ).all()
+
+        created = 0
+        for user_id in user_ids:
+            await db.execute(
+                delete(CategoryTreeNode).where(CategoryTreeNode.user_id == user_id)
+            )
+
+            result = await db.execute(
+                select(
+                    BookmarkNote.category1,
+                    BookmarkNote.category2,
+                    BookmarkNote.category3,
+                    func.count(),
+                )
+                .where(
+                    and_(
+                        BookmarkNote.user_id == user_id,
+                        BookmarkNote.is_deleted == False,
+                    )
+                )
+                .group_by(
+                    BookmarkNote.category1,
+                    BookmarkNote.category2,
+                    BookmarkNote.category3,
+                )
+            )
+
+            counts = Counter()
+            for category1, category2, category3, bookmark_count in result:
+                path = CategoryTreeController.category_path(
+                    category1, category2, category3
+                )
+                for prefix in CategoryTreeController._prefixes(path):
+                    counts[prefix] += bookmark_count
+
+            if counts:
+                await db.execute(
+                    insert(CategoryTreeNode),
+                    [
+                        {
+                            "user_id": user_id,
+                            "depth": len(path),
+                            "bookmark_count": bookmark_count,
+                            **CategoryTreeController._node_values(path),
+                        }
+                        for path, bookmark_count in counts.items()
+                    ],
+                )
+            created += len(counts)
+
+        return created
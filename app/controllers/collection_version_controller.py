@@ -0,0 +1,90 @@
+from typing import Iterable
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.bookmark import BookmarkNote
+from app.models.user import User
+
+
+class CollectionVersionController:
+    """
+    사용자별 북마크 컬렉션 버전 컨트롤러
+
+    북마크를 바꾸는 모든 쓰기는 같은 트랜잭션에서 버전을 올리고,
+    조회 API는 북마크 테이블을 읽기 전에 버전만 확인해 ETag와 응답 캐시 키를 만듭니다.
+    """
+
+    @staticmethod
+    async def get_version(db: AsyncSession, user_id: int) -> int:
+        """현재 컬렉션 버전 (users 기본 키 조회 한 번)"""
+        return await db.scalar(
+            select(User.bookmark_version).where(User.id == user_id)
+        ) or 0
+
+    @staticmethod
+    async def bump(
+        db: AsyncSession, user_ids: Iterable[int], bookmark_count_delta: int = 0
+    ) -> None:
+        """
+        사용자들의 컬렉션 버전 증가
+
+        ORM을 거치지 않고 노트를 추가한 경우 bookmark_count_delta로 북마크 수도 같은 UPDATE에서 반영합니다.
+        호출한 쪽의 트랜잭션 안에서 실행되며 커밋은 하지 않습니다.
+        프로필의 Last-Modified가 바뀌지 않도록 updated_at은 그대로 둡니다.
+        """
+        user_ids = list(user_ids)
+        if not user_ids:
+            return
+        values = {
+            "bookmark_version": User.bookmark_version + 1,
+            "updated_at": User.updated_at,
+        }
+        if bookmark_count_delta:
+            values["bookmark_count"] = User.bookmark_count + bookmark_count_delta
+        await db.execute(
+            update(User)
+            .where(User.id.in_(user_ids))
+            .values(values)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    async def next_change_seq(
+        db: AsyncSession, user_id: int, bookmark_count_delta: int = 0
+    ) -> int:
+        """
+        컬렉션 버전을 올리고 새 버전을 변경 순번으로 반환
+
+        버전 증가가 users 행을 잠그므로 같은 사용자의 쓰기는 커밋 순서대로 순번을 받고,
+        변경 피드는 작은 순번의 변경이 보이기 전에 큰 순번을 내보내지 않습니다.
+        """
+        await CollectionVersionController.bump(db, [user_id], bookmark_count_delta)
+        return await CollectionVersionController.get_version(db, user_id)
+
+    @staticmethod
+    async def get_bookmark_count(db: AsyncSession, user_id: int) -> int:
+        """삭제되지 않은 북마크 수 (COUNT 대신 users 기본 키 조회 한 번)"""
+        return await db.scalar(
+            select(User.bookmark_count).where(User.id == user_id)
+        ) or 0
+
+    @staticmethod
+    async def bump_for_bookmarks(db: AsyncSession, bookmark_ids: Iterable[int]) -> None:
+        """북마크 노트 ID로 소유자들의 컬렉션 버전 증가 (UPDATE 한 번)"""
+        bookmark_ids = list(bookmark_ids)
+        if not bookmark_ids:
+            return
+        await db.execute(
+            update(User)
+            .where(
+                User.id.in_(
+                    select(BookmarkNote.user_id).where(
+                        BookmarkNote.id.in_(bookmark_ids)
+                    )
+                )
+            )
+            .values(
+                bookmark_version=User.bookmark_version + 1,
+                updated_at=User.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
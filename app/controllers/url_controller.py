@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.url import URL
 from app.models.user import User
 from app.schemas.url import URLCreate
@@ -8,7 +8,7 @@ class URLController:
     """URL 관련 비즈니스 로직 컨트롤러"""
 
     @staticmethod
-    def create_url(db: Session, url_data: URLCreate, user: User) -> URL:
+    async def create_url(db: AsyncSession, url_data: URLCreate, user: User) -> URL:
         """새 URL 생성"""
         db_url = URL(
             url=url_data.url,
@@ -17,6 +17,6 @@ class URLController:
             user_id=user.id,
         )
         db.add(db_url)
-        db.commit()
-        db.refresh(db_url)
+        await db.commit()
+        await db.refresh(db_url)
         return db_url
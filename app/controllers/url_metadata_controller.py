@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.url_metadata import UrlMetadata, UrlFetchStatus
+from app.utils.upsert import upsert_statement
+
+# 가져온 메타데이터를 다시 가져오지 않고 쓰는 기간
+URL_METADATA_TTL = timedelta(days=30)
+
+# 가져오기에 실패한 URL을 다시 시도하기까지의 기간
+URL_METADATA_RETRY_AFTER = timedelta(hours=6)
+
+# 가져오기에 성공했을 때 덮어쓰는 컬럼 (실패 시에는 상태와 시각만 갱신)
+_FETCHED_COLUMNS = (
+    "url",
+    "title",
+    "description",
+    "thumbnail_url",
+    "canonical_url",
+    "content_type",
+    "fetch_status",
+    "fetched_at",
+)
+_FAILED_COLUMNS = ("fetch_status", "fetched_at")
+
+
+class UrlMetadataController:
+    """사용자 간 공유 페이지 메타데이터 컨트롤러"""
+
+    @staticmethod
+    def is_fresh(
+        fetch_status: UrlFetchStatus,
+        fetched_at: datetime,
+        now: Optional[datetime] = None,
+    ) -> bool:
+        """다시 가져오지 않아도 되는지 (성공은 URL_METADATA_TTL, 실패는 URL_METADATA_RETRY_AFTER)"""
+        max_age = (
+            URL_METADATA_TTL
+            if fetch_status == UrlFetchStatus.OK
+            else URL_METADATA_RETRY_AFTER
+        )
+        return (now or datetime.utcnow()) - fetched_at < max_age
+
+    @staticmethod
+    async def get_fresh_metadata(
+        db: AsyncSession, url_hashes: Iterable[bytes]
+    ) -> Dict[bytes, UrlMetadata]:
+        """정규화 URL 해시별 최신 메타데이터 (url_hash 고유 인덱스에 IN 쿼리 한 번)"""
+        url_hashes = list(url_hashes)
+        if not url_hashes:
+            return {}
+        result = await db.scalars(
+            select(UrlMetadata).where(UrlMetadata.url_hash.in_(url_hashes))
+        )
+        now = datetime.utcnow()
+        return {
+            metadata.url_hash: metadata
+            for metadata in result
+            if UrlMetadataController.is_fresh(
+                metadata.fetch_status, metadata.fetched_at, now
+            )
+        }
+
+    @staticmethod
+    async def save_metadata(db: AsyncSession, rows: List[dict]) -> None:
+        """
+        가져온 결과를 url_hash 기준으로 저장 (없으면 생성, 있으면 갱신)
+
+        실패한 결과는 이전에 가져온 제목/설명을 지우지 않고 상태와 시각만 갱신합니다.
+        호출한 쪽의 트랜잭션 안에서 실행되며 커밋은 하지 않습니다.
+        """
+        fetched = [row for row in rows if row["fetch_status"] == UrlFetchStatus.OK]
+        failed = [row for row in rows if row["fetch_status"] != UrlFetchStatus.OK]
+        for batch, columns in ((fetched, _FETCHED_COLUMNS), (failed, _FAILED_COLUMNS)):
+            if batch:
+                await UrlMetadataController._upsert(db, batch, columns)
+
+    @staticmethod
+    async def _upsert(db: AsyncSession, rows: List[dict], columns) -> None:
+        """행 묶음을 업서트 (executemany 한 번)"""
+        table = UrlMetadata.__table__
+        statement = upsert_statement(
+            db.get_bind().dialect.name,
+            table,
+            ["url_hash"],
+            lambda new: {
+                "updated_at": func.now(),
+                **{column: new[column] for column in columns},
+            },
+        )
+        if statement is None:
+            # 업서트를 지원하지 않는 DB는 갱신 후 없으면 생성
+            for row in rows:
+                result = await db.execute(
+                    update(table)
+                    .where(table.c.url_hash == row["url_hash"])
+                    .values({column: row[column] for column in columns})
+                )
+                if result.rowcount == 0:
+                    await db.execute(insert(table).values(**row))
+            return
+
+        await db.execute(statement, rows)
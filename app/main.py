@@ -1,20 +1,57 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.configs.database import engine
-from app.models import user, url, bookmark
+from fastapi.responses import PlainTextResponse
+from app.configs.database import (
+    dispose_async_engine,
+    get_async_session_factory,
+    get_configs,
+)
+from app.configs.http_client import init_http_client, close_http_client
+from app.configs.oauth import get_oauth
+from app.caches import token_cache, user_cache, bookmark_list_cache
+from app.metrics import (
+    MetricsMiddleware,
+    QueryDiagnosticsMiddleware,
+    install_sql_metrics,
+    metrics_registry,
+)
+from app.models import user, url, bookmark, category  # noqa: F401 (매퍼 관계 등록)
 from app.routers import auth, url as url_router, bookmark as bookmark_router
+from app.workers.bookmark_enrichment import bookmark_enrichment_worker
 import os
 
-# 테스트 환경이 아닐 때만 데이터베이스 테이블 생성
-if not os.getenv("TESTING"):
-    user.Base.metadata.create_all(bind=engine)
-    url.Base.metadata.create_all(bind=engine)
-    bookmark.Base.metadata.create_all(bind=engine)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    애플리케이션 수명 주기 동안 공유 자원 관리
+
+    엔진/세션 팩토리와 OAuth 레지스트리는 import 시점이 아니라 여기서 생성합니다.
+    엔진 생성은 DB에 연결하지 않으므로 DB가 잠시 내려가 있어도 시작할 수 있고,
+    첫 연결은 요청에서 맺습니다. 테이블은 Alembic 마이그레이션(alembic upgrade head)으로 관리합니다.
+    """
+    get_async_session_factory()
+    get_oauth()
+    # 외부 API 호출용 공유 HTTP 클라이언트 (커넥션 풀 재사용)
+    await init_http_client()
+    # 새 북마크 메타데이터 보강 작업자 (테스트 환경에서는 테스트가 직접 시작)
+    if not os.getenv("TESTING"):
+        await bookmark_enrichment_worker.start()
+    try:
+        yield
+    finally:
+        # 진행 중인 보강 작업을 마친 뒤 HTTP 클라이언트와 DB 커넥션 풀 종료
+        await bookmark_enrichment_worker.stop()
+        await close_http_client()
+        await dispose_async_engine()
+
 
 app = FastAPI(
     title="Category Note API",
     description="YouTube와 지식 웹 페이지를 정리하는 API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS 설정
@@ -26,6 +63,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청별 반복 쿼리 감지/쿼리 예산 확인 (QUERY_DIAGNOSTICS_ENABLED가 꺼져 있으면 그대로 통과)
+app.add_middleware(QueryDiagnosticsMiddleware)
+
+# 라우트별 지연 시간, 요청별 SQL 문 수/시간 지표 (가장 바깥에서 측정)
+if get_configs().METRICS_ENABLED:
+    install_sql_metrics()
+    app.add_middleware(MetricsMiddleware)
+
 # 라우터 등록
 app.include_router(auth.router, prefix="/auth", tags=["authentication"])
 app.include_router(url_router.router, prefix="/api", tags=["urls"])
@@ -40,3 +85,21 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/health/caches")
+async def cache_stats():
+    """프로세스별 캐시 적중률 (워커마다 따로 집계)"""
+    return {
+        "token": token_cache.stats(),
+        "user": user_cache.stats(),
+        "bookmark_list": bookmark_list_cache.stats(),
+    }
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 텍스트 형식 지표 (프로세스별 집계, 워커마다 따로 수집)"""
+    return PlainTextResponse(
+        metrics_registry.render(), media_type="text/plain; version=0.0.4"
+    )
@@ -0,0 +1,35 @@
+from .registry import Counter, Gauge, Histogram, MetricsRegistry, metrics_registry
+from .database import (
+    EXCLUDE_FROM_METRICS,
+    InstrumentedAsyncAdaptedQueuePool,
+    RequestDatabaseStats,
+    current_request_stats,
+    install_sql_metrics,
+)
+from .http import MetricsMiddleware
+from .query_diagnostics import (
+    QueryBudgetExceeded,
+    QueryDiagnostics,
+    QueryDiagnosticsMiddleware,
+    fingerprint,
+    query_diagnostics,
+)
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "metrics_registry",
+    "EXCLUDE_FROM_METRICS",
+    "InstrumentedAsyncAdaptedQueuePool",
+    "RequestDatabaseStats",
+    "current_request_stats",
+    "install_sql_metrics",
+    "MetricsMiddleware",
+    "QueryBudgetExceeded",
+    "QueryDiagnostics",
+    "QueryDiagnosticsMiddleware",
+    "fingerprint",
+    "query_diagnostics",
+]
@@ -0,0 +1,124 @@
+import time
+import weakref
+from contextvars import ContextVar
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from app.metrics.registry import Counter, Gauge, Histogram, metrics_registry
+
+
+class RequestDatabaseStats:
+    """요청 하나가 실행한 SQL 문 수와 실행 시간 합계"""
+
+    __slots__ = ("statements", "seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.seconds = 0.0
+
+
+# 이 실행 옵션이 켜진 SQL 문은 지표에서 제외 (진단용 EXPLAIN 등 애플리케이션이 실행하지 않은 문)
+EXCLUDE_FROM_METRICS = "exclude_from_metrics"
+
+# 지표 미들웨어가 요청마다 설정 (요청 밖의 쿼리는 None이라 요청별 집계에서 빠짐)
+current_request_stats: ContextVar[Optional[RequestDatabaseStats]] = ContextVar(
+    "current_request_stats", default=None
+)
+
+db_statements_total = metrics_registry.register(
+    Counter("db_statements_total", "Number of executed SQL statements")
+)
+db_statement_duration_seconds = metrics_registry.register(
+    Histogram(
+        "db_statement_duration_seconds",
+        "SQL statement execution time",
+        buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+    )
+)
+db_pool_checkout_seconds = metrics_registry.register(
+    Histogram(
+        "db_pool_checkout_seconds",
+        "Time to check out a pooled connection, including waiting and opening new connections",
+        buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+    )
+)
+db_pool_checkout_timeouts_total = metrics_registry.register(
+    Counter(
+        "db_pool_checkout_timeouts_total",
+        "Connection checkouts that gave up after pool_timeout",
+    )
+)
+
+# 지표를 기록하는 커넥션 풀 (엔진을 다시 만들면 이전 풀은 자동으로 빠짐)
+_instrumented_pools = weakref.WeakSet()
+
+
+def _pool_gauge(read):
+    def collect():
+        yield (), sum(read(pool) for pool in list(_instrumented_pools))
+
+    return collect
+
+
+metrics_registry.register(
+    Gauge("db_pool_size", "Configured pool size", _pool_gauge(lambda pool: pool.size()))
+)
+metrics_registry.register(
+    Gauge(
+        "db_pool_checked_out",
+        "Connections currently checked out",
+        _pool_gauge(lambda pool: pool.checkedout()),
+    )
+)
+metrics_registry.register(
+    Gauge(
+        "db_pool_overflow",
+        "Overflow connections currently open beyond pool_size",
+        _pool_gauge(lambda pool: max(0, pool.overflow())),
+    )
+)
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """체크아웃 대기 시간과 타임아웃을 기록하는 비동기 커넥션 풀"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        _instrumented_pools.add(self)
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            db_pool_checkout_timeouts_total.inc()
+            raise
+        finally:
+            db_pool_checkout_seconds.observe(time.perf_counter() - started)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and not context.execution_options.get(EXCLUDE_FROM_METRICS):
+        context._metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_metrics_started", None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    db_statements_total.inc()
+    db_statement_duration_seconds.observe(elapsed)
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.seconds += elapsed
+
+
+def install_sql_metrics() -> None:
+    """모든 엔진의 SQL 실행 시간을 기록하도록 이벤트 등록 (여러 번 호출해도 한 번만 등록)"""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
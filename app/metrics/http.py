@@ -0,0 +1,99 @@
+import time
+from app.metrics.database import RequestDatabaseStats, current_request_stats
+from app.metrics.registry import Histogram, metrics_registry
+
+# 레이블 수를 제한하기 위해 라우트는 경로 템플릿, 메서드는 아래 값만 사용
+UNMATCHED_ROUTE = "unmatched"
+_KNOWN_METHODS = frozenset(
+    {"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"}
+)
+
+http_request_duration_seconds = metrics_registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency by route template",
+        buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+        label_names=("method", "route", "status"),
+    )
+)
+http_request_db_statements = metrics_registry.register(
+    Histogram(
+        "http_request_db_statements",
+        "SQL statements executed per HTTP request",
+        buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55),
+        label_names=("method", "route"),
+    )
+)
+http_request_db_seconds = metrics_registry.register(
+    Histogram(
+        "http_request_db_seconds",
+        "Total SQL execution time per HTTP request",
+        buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+        label_names=("method", "route"),
+    )
+)
+
+
+def route_template(scope) -> str:
+    """
+    요청이 매칭된 라우트의 전체 경로 템플릿 (매칭되지 않았으면 UNMATCHED_ROUTE)
+
+    include_router(prefix=...)로 등록한 라우트는 scope["route"].path에 prefix가 빠져 있을 수 있으므로
+    템플릿의 구간 수만큼 요청 경로 끝을 잘라낸 앞부분을 prefix로 붙입니다.
+    경로 전체를 받는 {name:path} 파라미터는 구간 수를 알 수 없어 템플릿만 사용합니다.
+    """
+    template = getattr(scope.get("route"), "path", None)
+    if template is None:
+        return UNMATCHED_ROUTE
+    if ":path}" in template:
+        return template
+    path = scope["path"]
+    end = len(path)
+    for _ in range(template.count("/")):
+        end = path.rfind("/", 0, end)
+        if end < 0:
+            return template
+    return path[:end] + template
+
+
+class MetricsMiddleware:
+    """
+    라우트별 지연 시간과 요청별 SQL 문 수/시간을 기록하는 ASGI 미들웨어
+
+    요청 본문을 감싸지 않는 순수 ASGI 미들웨어라 응답 시작 메시지에서 상태 코드만 읽습니다.
+    라우트 레이블은 매칭된 경로 템플릿(예: /api/bookmark/{bookmark_id})이므로
+    경로 파라미터 값이 늘어나도 레이블 수는 늘지 않습니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = RequestDatabaseStats()
+        token = current_request_stats.set(stats)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            current_request_stats.reset(token)
+
+            route = route_template(scope)
+            method = scope["method"] if scope["method"] in _KNOWN_METHODS else "OTHER"
+            http_request_duration_seconds.observe(
+                elapsed, (method, route, str(status_code))
+            )
+            http_request_db_statements.observe(stats.statements, (method, route))
+            http_request_db_seconds.observe(stats.seconds, (method, route))
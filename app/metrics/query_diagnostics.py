@@ -0,0 +1,214 @@
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import event
+from app.configs.database import get_configs
+from app.metrics.database import EXCLUDE_FROM_METRICS
+from app.metrics.http import UNMATCHED_ROUTE, route_template
+
+logger = logging.getLogger(__name__)
+
+# 방언별 실행 계획 조회 구문 (실제로 실행하지 않음)
+_EXPLAIN_PREFIXES = {
+    "mysql": "EXPLAIN ",
+    "sqlite": "EXPLAIN QUERY PLAN ",
+    "postgresql": "EXPLAIN ",
+}
+
+# 라우트별 요청당 SQL 문 수 상한 ((메서드, 경로 템플릿) -> 최대 문 수)
+# 사용자 캐시가 비어 있을 때의 사용자 조회 한 번을 포함한 값입니다.
+# 가져오기는 파일 크기에 비례해 조각마다 쿼리를 실행하므로 상한을 두지 않습니다.
+ENDPOINT_QUERY_BUDGETS: Dict[Tuple[str, str], int] = {
+    ("GET", "/auth/me"): 2,
+    ("GET", "/api/bookmark/"): 5,
+    ("GET", "/api/bookmark/changes"): 4,
+    ("GET", "/api/bookmark/export"): 3,
+    ("GET", "/api/bookmark/{bookmark_id}"): 3,
+    ("GET", "/api/bookmark/categories/list"): 4,
+    ("GET", "/api/bookmark/categories/tree"): 4,
+    ("POST", "/api/bookmark/"): 10,
+    ("POST", "/api/bookmark/lookup"): 3,
+    # 카테고리 3단계마다 카테고리 조회/생성과 트리 노드 갱신
+    ("PUT", "/api/bookmark/{bookmark_id}/categories"): 18,
+    ("DELETE", "/api/bookmark/{bookmark_id}"): 9,
+}
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAMETER = re.compile(r"%s|%\(\w+\)s|:\w+|\$\d+")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """
+    SQL 문의 형태 (리터럴과 파라미터를 ?로 바꾸고 IN 목록 길이는 무시)
+
+    같은 쿼리를 다른 값으로 반복 실행하면 같은 형태가 되므로 N+1 패턴을 찾을 때 사용합니다.
+    """
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _PARAMETER.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    statement = _PLACEHOLDER_LIST.sub("(?)", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+class QueryBudgetExceeded(AssertionError):
+    """요청이 라우트의 SQL 문 수 상한을 넘음 (테스트에서 실패로 처리)"""
+
+
+class RequestQueryLog:
+    """요청 하나가 실행한 SQL 문 형태별 횟수"""
+
+    __slots__ = ("fingerprints", "statements")
+
+    def __init__(self):
+        self.fingerprints: Counter = Counter()
+        self.statements = 0
+
+
+# 진단 미들웨어가 요청마다 설정 (요청 밖의 쿼리는 느린 쿼리만 기록)
+current_query_log: ContextVar[Optional[RequestQueryLog]] = ContextVar(
+    "current_query_log", default=None
+)
+
+
+class QueryDiagnostics:
+    """
+    느린 쿼리/반복 쿼리 진단
+
+    - 느린 쿼리: slow_query_ms 이상 걸린 SQL 문을 실행 계획(EXPLAIN)과 함께 경고 로그로 남김
+    - 반복 쿼리: 한 요청에서 같은 형태의 SQL 문이 repeated_threshold번 이상 실행되면 경고 로그
+    - 쿼리 예산: enforce_budgets가 켜져 있으면 라우트 상한을 넘은 요청에서 QueryBudgetExceeded
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        slow_query_ms: float,
+        repeated_threshold: int,
+        budgets: Dict[Tuple[str, str], int],
+        enforce_budgets: bool = False,
+    ):
+        self.enabled = enabled
+        self.slow_query_ms = slow_query_ms
+        self.repeated_threshold = repeated_threshold
+        self.budgets = budgets
+        self.enforce_budgets = enforce_budgets
+
+    def install(self, engine) -> None:
+        """엔진에 SQL 실행 이벤트 등록 (비동기 엔진은 sync_engine에 등록)"""
+        engine = getattr(engine, "sync_engine", engine)
+        if not event.contains(engine, "before_cursor_execute", self._before_execute):
+            event.listen(engine, "before_cursor_execute", self._before_execute)
+            event.listen(engine, "after_cursor_execute", self._after_execute)
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if (
+            self.enabled
+            and context is not None
+            and not context.execution_options.get(EXCLUDE_FROM_METRICS)
+        ):
+            context._diagnostics_started = time.perf_counter()
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_diagnostics_started", None)
+        if started is None:
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        query_log = current_query_log.get()
+        if query_log is not None:
+            query_log.statements += 1
+            query_log.fingerprints[fingerprint(statement)] += 1
+
+        if elapsed_ms >= self.slow_query_ms:
+            plan = None
+            if not executemany and not context.execution_options.get("stream_results"):
+                plan = self._explain(conn, statement, parameters)
+            logger.warning(
+                f"느린 쿼리 ({elapsed_ms:.1f}ms): {fingerprint(statement)}"
+                + ("\n실행 계획:\n" + "\n".join(plan) if plan else "")
+            )
+
+    @staticmethod
+    def _explain(conn, statement: str, parameters) -> Optional[List[str]]:
+        """
+        같은 커넥션에서 조회 문의 실행 계획 조회 (실패하면 None)
+
+        EXPLAIN 문은 EXCLUDE_FROM_METRICS 실행 옵션으로 실행해 요청별 SQL 문 수/시간,
+        /metrics 지표, 쿼리 예산에 포함되지 않게 합니다.
+        """
+        prefix = _EXPLAIN_PREFIXES.get(conn.dialect.name)
+        if prefix is None or not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            return None
+        try:
+            rows = conn.exec_driver_sql(
+                prefix + statement,
+                parameters,
+                execution_options={EXCLUDE_FROM_METRICS: True},
+            ).all()
+        except Exception as e:
+            logger.debug(f"실행 계획 조회 실패: {e}")
+            return None
+        return [" | ".join(str(value) for value in row) for row in rows]
+
+    def finish_request(self, method: str, route: str, query_log: RequestQueryLog) -> None:
+        """요청이 끝나면 반복 쿼리를 기록하고 쿼리 예산 확인"""
+        for shape, count in query_log.fingerprints.items():
+            if count >= self.repeated_threshold:
+                logger.warning(
+                    f"반복 쿼리 감지 ({method} {route}, {count}회): {shape}"
+                )
+
+        budget = self.budgets.get((method, route))
+        if budget is not None and query_log.statements > budget:
+            message = (
+                f"{method} {route} 요청이 SQL 문 {query_log.statements}개를 실행했습니다 "
+                f"(예산 {budget}개): "
+                + "; ".join(
+                    f"{count}회 {shape}"
+                    for shape, count in query_log.fingerprints.most_common(5)
+                )
+            )
+            if self.enforce_budgets:
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+
+
+class QueryDiagnosticsMiddleware:
+    """요청별 SQL 문 형태를 모아 반복 쿼리/쿼리 예산을 확인하는 ASGI 미들웨어"""
+
+    def __init__(self, app, diagnostics: Optional[QueryDiagnostics] = None):
+        self.app = app
+        self.diagnostics = diagnostics or query_diagnostics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.diagnostics.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        query_log = RequestQueryLog()
+        token = current_query_log.set(query_log)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_query_log.reset(token)
+        route = route_template(scope)
+        if route != UNMATCHED_ROUTE:
+            self.diagnostics.finish_request(scope["method"], route, query_log)
+
+
+_configs = get_configs()
+
+# 애플리케이션 전역 쿼리 진단 (엔진은 get_engine()/get_async_engine()에서 등록)
+query_diagnostics = QueryDiagnostics(
+    enabled=_configs.QUERY_DIAGNOSTICS_ENABLED,
+    slow_query_ms=_configs.SLOW_QUERY_THRESHOLD_MS,
+    repeated_threshold=_configs.REPEATED_QUERY_THRESHOLD,
+    budgets=ENDPOINT_QUERY_BUDGETS,
+    enforce_budgets=_configs.QUERY_BUDGET_ENFORCED,
+)
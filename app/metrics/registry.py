@@ -0,0 +1,205 @@
+import bisect
+import threading
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    """Prometheus 텍스트 형식의 숫자 (정수는 그대로, 무한대는 +Inf)"""
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and not value.is_integer():
+        return repr(value)
+    return str(int(value))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(label_names: Sequence[str], label_values: Sequence[str]) -> str:
+    if not label_names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label_value(value)}"'
+        for name, value in zip(label_names, label_values)
+    )
+    return "{" + pairs + "}"
+
+
+class Metric:
+    """
+    레이블별 값을 보관하는 지표 (Prometheus 텍스트 형식으로 출력)
+
+    레이블 값은 호출한 쪽에서 라우트 템플릿처럼 개수가 정해진 값만 넘겨야 합니다.
+    """
+
+    type_name = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self._samples(),
+        ]
+
+    def _samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """저장된 값 초기화 (테스트용)"""
+
+
+class Counter(Metric):
+    """단조 증가 카운터"""
+
+    type_name = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ):
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, labels: LabelValues = ()) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, labels: LabelValues = ()) -> float:
+        return self._values.get(labels, 0)
+
+    def _samples(self) -> Iterable[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        for labels, value in values:
+            yield (
+                f"{self.name}{_format_labels(self.label_names, labels)} "
+                f"{_format_value(value)}"
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram(Metric):
+    """
+    고정 구간 히스토그램
+
+    관측마다 구간 하나의 카운트만 올리고, 누적 카운트(le)는 출력할 때 계산합니다.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        buckets: Sequence[float],
+        label_names: Sequence[str] = (),
+    ):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # 레이블 값 -> [구간별 카운트(마지막은 +Inf), 합계, 개수]
+        self._values: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, labels: LabelValues = ()) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def count(self, labels: LabelValues = ()) -> int:
+        entry = self._values.get(labels)
+        return entry[2] if entry else 0
+
+    def sum(self, labels: LabelValues = ()) -> float:
+        entry = self._values.get(labels)
+        return entry[1] if entry else 0.0
+
+    def _samples(self) -> Iterable[str]:
+        with self._lock:
+            values = sorted(
+                (labels, (list(entry[0]), entry[1], entry[2]))
+                for labels, entry in self._values.items()
+            )
+        bucket_label_names = self.label_names + ("le",)
+        for labels, (bucket_counts, total, count) in values:
+            cumulative = 0
+            for bound, bucket_count in zip(
+                self.buckets + (float("inf"),), bucket_counts
+            ):
+                cumulative += bucket_count
+                bucket_labels = _format_labels(
+                    bucket_label_names, labels + (_format_value(bound),)
+                )
+                yield f"{self.name}_bucket{bucket_labels} {cumulative}"
+            label_text = _format_labels(self.label_names, labels)
+            yield f"{self.name}_sum{label_text} {_format_value(total)}"
+            yield f"{self.name}_count{label_text} {count}"
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(Metric):
+    """출력할 때 콜백으로 현재 값을 읽는 게이지 (커넥션 풀 상태처럼 이미 있는 값)"""
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        collect: Callable[[], Iterable[Tuple[LabelValues, float]]],
+        label_names: Sequence[str] = (),
+    ):
+        super().__init__(name, documentation, label_names)
+        self.collect = collect
+
+    def _samples(self) -> Iterable[str]:
+        for labels, value in self.collect():
+            yield (
+                f"{self.name}{_format_labels(self.label_names, labels)} "
+                f"{_format_value(value)}"
+            )
+
+
+class MetricsRegistry:
+    """지표 모음 (/metrics 응답 본문 생성)"""
+
+    def __init__(self):
+        self._metrics: List[Metric] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """모든 지표 값 초기화 (테스트용)"""
+        for metric in self._metrics:
+            metric.clear()
+
+
+# 애플리케이션 전역 지표 모음
+metrics_registry = MetricsRegistry()
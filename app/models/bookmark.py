@@ -1,4 +1,7 @@
 from sqlalchemy import (
+    BINARY,
+    update,
+    inspect,
     Column,
     Integer,
     String,
@@ -6,10 +9,19 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     Boolean,
+    Index,
+    DDL,
+    event,
+    text,
 )
-from sqlalchemy.orm import relationship
+from collections import defaultdict
+from sqlalchemy.orm import Session, relationship
 from sqlalchemy.sql import func
 from app.configs.database import Base
+from app.utils.url_canonicalizer import URL_HASH_LENGTH, url_hash
+from app.models import category  # noqa: F401 (BookmarkCategory 관계 등록)
+from app.models import url_metadata  # noqa: F401 (UrlMetadata 관계 등록)
+from app.models.user import User
 
 
 class BookmarkNote(Base):
@@ -18,26 +30,26 @@ class BookmarkNote(Base):
     __tablename__ = "bookmark_notes"
 
     id = Column(Integer, primary_key=True, index=True)
-    title = Column(String(500), nullable=False, index=True)  # 요약된 제목
+    title = Column(String(500), nullable=False)  # 요약된 제목
     url = Column(
         String(2048), nullable=False
     )  # 원본 URL (인덱스 제거 - 너무 긴 필드)
-    category1 = Column(
-        String(100), nullable=True, index=True
-    )  # 첫 번째 카테고리
-    category2 = Column(
-        String(100), nullable=True, index=True
-    )  # 두 번째 카테고리
-    category3 = Column(
-        String(100), nullable=True, index=True
-    )  # 세 번째 카테고리
+    # 정규화 URL의 SHA-256 (중복 판별용 고정 길이 키, 삭제된 노트는 NULL)
+    url_hash = Column(BINARY(URL_HASH_LENGTH), nullable=True)
+    # 카테고리 (API 호환용 값, 조회/필터링은 bookmark_categories 연결 테이블 사용)
+    category1 = Column(String(100), nullable=True)  # 첫 번째 카테고리
+    category2 = Column(String(100), nullable=True)  # 두 번째 카테고리
+    category3 = Column(String(100), nullable=True)  # 세 번째 카테고리
     description = Column(Text, nullable=True)  # 추가 설명
-    is_deleted = Column(
-        Boolean, default=False, nullable=False, index=True
-    )  # 소프트 삭제
-    user_id = Column(
-        Integer, ForeignKey("users.id"), nullable=False, index=True
+    canonical_url = Column(String(2048), nullable=True)  # 페이지가 선언한 대표 URL
+    # 공유 페이지 메타데이터 (보강 작업자가 연결)
+    url_metadata_id = Column(
+        Integer, ForeignKey("url_metadata.id"), nullable=True, index=True
     )
+    is_deleted = Column(Boolean, default=False, nullable=False)  # 소프트 삭제
+    # 마지막으로 바뀐 시점의 사용자 컬렉션 버전 (변경 피드 커서, 삭제도 기록)
+    change_seq = Column(Integer, nullable=False, default=0, server_default="0")
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
@@ -46,6 +58,136 @@ class BookmarkNote(Base):
 
     # 관계 설정
     user = relationship("User", back_populates="bookmark_notes")
+    url_metadata = relationship("UrlMetadata")
+    category_links = relationship(
+        "BookmarkCategory",
+        back_populates="bookmark_note",
+        cascade="all, delete-orphan",
+        order_by="BookmarkCategory.position",
+    )
+
+    # 사용자별 목록 조회 경로용 복합 인덱스
+    # (user_id, is_deleted)로 범위를 좁힌 뒤 정렬 컬럼까지 인덱스에서 처리.
+    # SQLite에서는 삭제되지 않은 행만 담는 부분 인덱스로 생성된다.
+    __table_args__ = (
+        Index(
+            "ix_bookmark_notes_user_active_created",
+            "user_id",
+            "is_deleted",
+            "created_at",
+            "id",
+            sqlite_where=text("is_deleted = 0"),
+        ),
+        # 변경 피드 조회용 (삭제된 노트 포함, (change_seq, id) 순서로 이어서 조회)
+        Index("ix_bookmark_notes_user_change_seq", "user_id", "change_seq", "id"),
+        # 사용자별 같은 페이지 중복 저장 방지 (NULL은 중복으로 보지 않음)
+        Index("ux_bookmark_notes_user_url_hash", "user_id", "url_hash", unique=True),
+        # 제목/설명 전문 검색 인덱스 (MySQL 전용, 한국어를 위해 ngram 파서 사용)
+        Index(
+            "ft_bookmark_notes_title_description",
+            "title",
+            "description",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ).ddl_if(dialect="mysql"),
+    )
 
     def __repr__(self):
         return f"<BookmarkNote(id={self.id}, title='{self.title[:30]}...', user_id={self.user_id})>"
+
+
+@event.listens_for(BookmarkNote, "before_insert")
+def _fill_url_hash(mapper, connection, target):
+    """url_hash를 지정하지 않고 저장하는 노트는 URL로 채움"""
+    if target.url_hash is None and not target.is_deleted:
+        target.url_hash = url_hash(target.url)
+
+
+@event.listens_for(Session, "before_flush")
+def sync_user_bookmark_counts(session, flush_context, instances):
+    """
+    ORM으로 생성/소프트 삭제/삭제한 노트만큼 users.bookmark_count를 같은 트랜잭션에서 갱신합니다.
+
+    다중 행 INSERT처럼 ORM을 거치지 않는 쓰기는 호출한 쪽에서 직접 반영해야 합니다
+    (CollectionVersionController.next_change_seq의 bookmark_count_delta).
+    """
+    deltas = defaultdict(int)
+    for obj in session.new:
+        if isinstance(obj, BookmarkNote) and not obj.is_deleted:
+            deltas[obj.user_id] += 1
+    for obj in session.dirty:
+        if not isinstance(obj, BookmarkNote):
+            continue
+        history = inspect(obj).attrs.is_deleted.history
+        if history.has_changes() and bool(history.deleted and history.deleted[0]) != bool(
+            obj.is_deleted
+        ):
+            deltas[obj.user_id] += -1 if obj.is_deleted else 1
+    for obj in session.deleted:
+        if isinstance(obj, BookmarkNote) and not obj.is_deleted:
+            deltas[obj.user_id] -= 1
+
+    users = User.__table__
+    for user_id, delta in deltas.items():
+        if delta:
+            session.execute(
+                update(users)
+                .where(users.c.id == user_id)
+                .values(
+                    bookmark_count=users.c.bookmark_count + delta,
+                    updated_at=users.c.updated_at,
+                )
+            )
+
+
+# SQLite 전문 검색용 FTS5 섀도 테이블 (bookmark_notes를 외부 콘텐츠로 사용)
+# 트리거로 bookmark_notes의 INSERT/UPDATE/DELETE와 동기화된다.
+BOOKMARK_NOTES_FTS_TABLE = "bookmark_notes_fts"
+
+SQLITE_FTS_CREATE_STATEMENTS = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {BOOKMARK_NOTES_FTS_TABLE} USING fts5(
+        title, description,
+        content='bookmark_notes', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS bookmark_notes_fts_ai AFTER INSERT ON bookmark_notes
+    BEGIN
+        INSERT INTO {BOOKMARK_NOTES_FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS bookmark_notes_fts_ad AFTER DELETE ON bookmark_notes
+    BEGIN
+        INSERT INTO {BOOKMARK_NOTES_FTS_TABLE}({BOOKMARK_NOTES_FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS bookmark_notes_fts_au
+    AFTER UPDATE OF title, description ON bookmark_notes
+    BEGIN
+        INSERT INTO {BOOKMARK_NOTES_FTS_TABLE}({BOOKMARK_NOTES_FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {BOOKMARK_NOTES_FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+
+for _statement in SQLITE_FTS_CREATE_STATEMENTS:
+    event.listen(
+        BookmarkNote.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="sqlite"),
+    )
+
+event.listen(
+    BookmarkNote.__table__,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {BOOKMARK_NOTES_FTS_TABLE}").execute_if(
+        dialect="sqlite"
+    ),
+)
@@ -0,0 +1,177 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    DateTime,
+    ForeignKey,
+    Index,
+    event,
+    inspect,
+    select,
+)
+from sqlalchemy.orm import relationship, Session
+from sqlalchemy.sql import func
+from app.configs.database import Base
+
+
+class Category(Base):
+    """사용자별 카테고리 모델"""
+
+    __tablename__ = "categories"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    name = Column(String(100), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # 관계 설정
+    bookmark_links = relationship("BookmarkCategory", back_populates="category")
+
+    # 사용자별 카테고리 이름은 유일 (이름으로 찾는 조회도 이 인덱스 사용)
+    __table_args__ = (
+        Index("ix_categories_user_id_name", "user_id", "name", unique=True),
+    )
+
+    def __repr__(self):
+        return f"<Category(id={self.id}, name='{self.name}', user_id={self.user_id})>"
+
+
+class BookmarkCategory(Base):
+    """북마크 노트-카테고리 연결 모델 (position 1~3은 category1~3에 대응)"""
+
+    __tablename__ = "bookmark_categories"
+
+    bookmark_id = Column(
+        Integer, ForeignKey("bookmark_notes.id"), primary_key=True
+    )
+    position = Column(Integer, primary_key=True)
+    category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
+
+    # 관계 설정
+    bookmark_note = relationship("BookmarkNote", back_populates="category_links")
+    category = relationship("Category", back_populates="bookmark_links")
+
+    # 카테고리로 북마크를 찾는 필터링 경로용 인덱스
+    __table_args__ = (
+        Index(
+            "ix_bookmark_categories_category_bookmark",
+            "category_id",
+            "bookmark_id",
+        ),
+    )
+
+    def __repr__(self):
+        return (
+            f"<BookmarkCategory(bookmark_id={self.bookmark_id}, "
+            f"position={self.position}, category_id={self.category_id})>"
+        )
+
+
+class CategoryTreeNode(Base):
+    """
+    사용자별 카테고리 트리 노드 모델 (category1 > category2 > category3)
+
+    각 행은 트리 경로 하나와 그 경로 아래에 있는 삭제되지 않은 북마크 수입니다.
+    비어 있는 하위 단계는 빈 문자열로 저장하고, 북마크 생성/카테고리 변경/삭제
+    트랜잭션 안에서 증감으로 갱신합니다.
+    """
+
+    __tablename__ = "category_tree_nodes"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    category1 = Column(String(100), nullable=False, server_default="")
+    category2 = Column(String(100), nullable=False, server_default="")
+    category3 = Column(String(100), nullable=False, server_default="")
+    depth = Column(Integer, nullable=False)
+    bookmark_count = Column(Integer, nullable=False, server_default="0")
+
+    # 사용자별 경로는 유일 (트리 조회는 이 인덱스 범위 스캔 한 번으로 끝남)
+    __table_args__ = (
+        Index(
+            "ix_category_tree_nodes_user_path",
+            "user_id",
+            "category1",
+            "category2",
+            "category3",
+            unique=True,
+        ),
+    )
+
+    def __repr__(self):
+        return (
+            f"<CategoryTreeNode(user_id={self.user_id}, "
+            f"path=({self.category1!r}, {self.category2!r}, {self.category3!r}), "
+            f"bookmark_count={self.bookmark_count})>"
+        )
+
+
+# category1~3 컬럼 이름과 연결 테이블 position 매핑
+CATEGORY_COLUMN_POSITIONS = {"category1": 1, "category2": 2, "category3": 3}
+
+
+@event.listens_for(Session, "before_flush")
+def sync_bookmark_category_links(session, flush_context, instances):
+    """
+    북마크 노트의 category1~3 값이 바뀌면 연결 테이블을 함께 갱신합니다.
+
+    category1~3 컬럼은 기존 API 응답 형태를 위한 호환용 값이고,
+    카테고리 필터링/목록 조회는 정규화된 연결 테이블을 사용합니다.
+    Core 다중 행 INSERT는 이 이벤트를 거치지 않으므로 BookmarkController.insert_bookmark_rows를 사용합니다.
+    """
+    from app.models.bookmark import BookmarkNote
+
+    changed_notes = [
+        obj for obj in session.new if isinstance(obj, BookmarkNote)
+    ] + [
+        obj
+        for obj in session.dirty
+        if isinstance(obj, BookmarkNote)
+        and any(
+            inspect(obj).attrs[column].history.has_changes()
+            for column in CATEGORY_COLUMN_POSITIONS
+        )
+    ]
+    if not changed_notes:
+        return
+
+    # 같은 flush 안에서 새로 만든 카테고리를 재사용하기 위한 캐시
+    category_cache = {}
+    with session.no_autoflush:
+        for bookmark_note in changed_notes:
+            links_by_position = {
+                link.position: link for link in bookmark_note.category_links
+            }
+            for column, position in CATEGORY_COLUMN_POSITIONS.items():
+                name = getattr(bookmark_note, column)
+                link = links_by_position.get(position)
+                if not name:
+                    if link is not None:
+                        bookmark_note.category_links.remove(link)
+                    continue
+
+                category = _get_or_create_category(
+                    session, category_cache, bookmark_note.user_id, name
+                )
+                if link is None:
+                    bookmark_note.category_links.append(
+                        BookmarkCategory(category=category, position=position)
+                    )
+                else:
+                    link.category = category
+
+
+def _get_or_create_category(session, category_cache, user_id, name) -> Category:
+    """사용자의 카테고리를 이름으로 조회하고 없으면 생성"""
+    key = (user_id, name)
+    if key not in category_cache:
+        category = session.scalar(
+            select(Category).where(
+                Category.user_id == user_id, Category.name == name
+            )
+        )
+        if category is None:
+            category = Category(user_id=user_id, name=name)
+            session.add(category)
+        category_cache[key] = category
+    return category_cache[key]
@@ -0,0 +1,50 @@
+import enum
+from sqlalchemy import (
+    BINARY,
+    Column,
+    Integer,
+    String,
+    Text,
+    DateTime,
+    Enum,
+)
+from sqlalchemy.sql import func
+from app.configs.database import Base
+from app.utils.url_canonicalizer import URL_HASH_LENGTH
+
+
+class UrlFetchStatus(str, enum.Enum):
+    """페이지 메타데이터 가져오기 결과"""
+
+    OK = "ok"  # 가져옴 (HTML이 아니면 content_type만 채워짐)
+    FAILED = "failed"  # 오류 응답 또는 연결 실패
+
+
+class UrlMetadata(Base):
+    """
+    사용자 구분 없이 정규화 URL별로 한 번만 가져와 공유하는 페이지 메타데이터
+
+    같은 페이지를 북마크한 모든 사용자의 노트가 이 행을 참조하며,
+    보강 작업자는 새로 가져오기 전에 fetched_at 기준으로 최신 여부를 확인합니다.
+    """
+
+    __tablename__ = "url_metadata"
+
+    id = Column(Integer, primary_key=True)
+    # 정규화 URL의 SHA-256 (bookmark_notes.url_hash와 같은 값)
+    url_hash = Column(BINARY(URL_HASH_LENGTH), nullable=False, unique=True)
+    url = Column(String(2048), nullable=False)  # 정규화 URL
+    title = Column(String(500), nullable=True)
+    description = Column(Text, nullable=True)
+    thumbnail_url = Column(String(2048), nullable=True)  # og:image
+    canonical_url = Column(String(2048), nullable=True)  # 페이지가 선언한 대표 URL
+    content_type = Column(String(100), nullable=True)
+    fetch_status = Column(Enum(UrlFetchStatus), nullable=False)
+    fetched_at = Column(DateTime, nullable=False)  # 마지막으로 가져온 시각 (UTC)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    def __repr__(self):
+        return f"<UrlMetadata(id={self.id}, url='{self.url[:50]}...', status='{self.fetch_status.value}')>"
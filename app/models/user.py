@@ -27,6 +27,11 @@ class User(Base):
     is_active = Column(Boolean, default=True)
     is_verified = Column(Boolean, default=False)
 
+    # 북마크 컬렉션 버전 (북마크를 바꿀 때마다 증가, 조회 API의 ETag에 사용)
+    bookmark_version = Column(Integer, nullable=False, default=0, server_default="0")
+    # 삭제되지 않은 북마크 수 (필터 없는 목록의 total, COUNT 대신 사용)
+    bookmark_count = Column(Integer, nullable=False, default=0, server_default="0")
+
     # 타임스탬프
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
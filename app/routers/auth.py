@@ -1,13 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.responses import RedirectResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.configs.database import get_db
-from app.configs.oauth import oauth, JWT_EXPIRATION_TIME
+from app.configs.http_client import hedged_get
+from app.configs.oauth import get_oauth, JWT_EXPIRATION_TIME
 from app.controllers.auth_controller import AuthController
 from app.schemas.user import TokenResponse, OAuthUserInfo, UserResponse
 from app.models.user import User, ProviderType
-import httpx
+from app.utils.conditional_request import check_not_modified, make_etag
+import asyncio
 
 router = APIRouter()
 security = HTTPBearer(auto_error=False)
@@ -15,7 +17,7 @@ security = HTTPBearer(auto_error=False)
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> User:
     """현재 인증된 사용자 조회"""
     if not credentials:
@@ -39,8 +41,8 @@ async def get_current_user(
                 status_code=401, detail="유효하지 않은 토큰입니다"
             )
 
-        # 사용자 조회
-        user = db.query(User).filter(User.id == int(user_id)).first()
+        # 사용자 조회 (사용자 캐시 우선)
+        user = await AuthController.get_authenticated_user(db, int(user_id))
         if not user:
             raise HTTPException(
                 status_code=404, detail="사용자를 찾을 수 없습니다"
@@ -70,7 +72,7 @@ async def login(provider: str, request: Request):
         redirect_uri = str(request.url_for("auth_callback", provider=provider))
 
         # OAuth 인증 URL로 리다이렉트
-        return await oauth.create_client(provider).authorize_redirect(
+        return await get_oauth().create_client(provider).authorize_redirect(
             request, redirect_uri
         )
     except ValueError:
@@ -80,8 +82,26 @@ async def login(provider: str, request: Request):
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
-    """현재 사용자 정보 조회"""
+async def get_current_user_info(
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    현재 사용자 정보 조회
+
+    - 프로필이 바뀔 때마다 갱신되는 `updated_at`으로 `ETag`와 `Last-Modified`를 만듭니다
+    - `If-None-Match` 또는 `If-Modified-Since`가 최신이면 304를 반환합니다 (사용자 캐시만 사용)
+    """
+    not_modified = check_not_modified(
+        request,
+        response,
+        make_etag("me", current_user.id, current_user.updated_at.isoformat()),
+        last_modified=current_user.updated_at,
+    )
+    if not_modified:
+        return not_modified
+
     return UserResponse(
         id=current_user.id,
         email=current_user.email,
@@ -104,14 +124,14 @@ async def signin(provider: ProviderType, request: Request):
     redirect_uri = str(request.url_for("auth_callback", provider=provider))
 
     # OAuth 인증 URL로 리다이렉트
-    return await oauth.create_client(provider.value).authorize_redirect(
+    return await get_oauth().create_client(provider.value).authorize_redirect(
         request, redirect_uri
     )
 
 
 @router.get("/callback/{provider}")
 async def auth_callback(
-    provider: str, request: Request, db: Session = Depends(get_db)
+    provider: str, request: Request, db: AsyncSession = Depends(get_db)
 ):
     """OAuth 콜백 처리"""
     try:
@@ -124,7 +144,7 @@ async def auth_callback(
         provider_enum = ProviderType(provider)
 
         # OAuth 토큰 받기
-        client = oauth.create_client(provider)
+        client = get_oauth().create_client(provider)
         token = await client.authorize_access_token(request)
 
         # 사용자 정보 가져오기
@@ -134,10 +154,10 @@ async def auth_callback(
             user_info = await _get_google_user_info(token)
 
         # 사용자 생성 또는 조회
-        user = AuthController.get_or_create_user(db, user_info)
+        user = await AuthController.get_or_create_user(db, user_info)
 
         # 마지막 로그인 시간 업데이트
-        user = AuthController.update_last_login(db, user)
+        user = await AuthController.update_last_login(db, user)
 
         # JWT 토큰 생성
         access_token = AuthController.create_access_token(user)
@@ -162,54 +182,48 @@ async def auth_callback(
 
 async def _get_github_user_info(token: dict) -> OAuthUserInfo:
     """GitHub 사용자 정보 조회"""
-    async with httpx.AsyncClient() as client:
-        # 사용자 기본 정보
-        response = await client.get(
-            "https://api.github.com/user",
-            headers={"Authorization": f"Bearer {token['access_token']}"},
-        )
-        user_data = response.json()
+    headers = {"Authorization": f"Bearer {token['access_token']}"}
 
-        # 이메일 정보 (private일 수 있음)
-        email_response = await client.get(
-            "https://api.github.com/user/emails",
-            headers={"Authorization": f"Bearer {token['access_token']}"},
-        )
-        emails = email_response.json()
-        primary_email = next(
-            (email["email"] for email in emails if email["primary"]),
-            user_data.get("email"),
-        )
+    # 사용자 기본 정보와 이메일 정보(private일 수 있음)를 동시에 조회
+    response, email_response = await asyncio.gather(
+        hedged_get("https://api.github.com/user", headers=headers),
+        hedged_get("https://api.github.com/user/emails", headers=headers),
+    )
+    user_data = response.json()
+    emails = email_response.json()
+    primary_email = next(
+        (email["email"] for email in emails if email["primary"]),
+        user_data.get("email"),
+    )
 
-        return OAuthUserInfo(
-            email=primary_email,
-            username=user_data["login"],
-            full_name=user_data.get("name"),
-            avatar_url=user_data.get("avatar_url"),
-            provider=ProviderType.GITHUB,
-            provider_id=str(user_data["id"]),
-        )
+    return OAuthUserInfo(
+        email=primary_email,
+        username=user_data["login"],
+        full_name=user_data.get("name"),
+        avatar_url=user_data.get("avatar_url"),
+        provider=ProviderType.GITHUB,
+        provider_id=str(user_data["id"]),
+    )
 
 
 async def _get_google_user_info(token: dict) -> OAuthUserInfo:
     """Google 사용자 정보 조회"""
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            "https://www.googleapis.com/oauth2/v2/userinfo",
-            headers={"Authorization": f"Bearer {token['access_token']}"},
-        )
-        user_data = response.json()
-
-        return OAuthUserInfo(
-            email=user_data["email"],
-            username=user_data.get(
-                "given_name", user_data["email"].split("@")[0]
-            ),
-            full_name=user_data.get("name"),
-            avatar_url=user_data.get("picture"),
-            provider=ProviderType.GOOGLE,
-            provider_id=user_data["id"],
-        )
+    response = await hedged_get(
+        "https://www.googleapis.com/oauth2/v2/userinfo",
+        headers={"Authorization": f"Bearer {token['access_token']}"},
+    )
+    user_data = response.json()
+
+    return OAuthUserInfo(
+        email=user_data["email"],
+        username=user_data.get(
+            "given_name", user_data["email"].split("@")[0]
+        ),
+        full_name=user_data.get("name"),
+        avatar_url=user_data.get("picture"),
+        provider=ProviderType.GOOGLE,
+        provider_id=user_data["id"],
+    )
 
 
 @router.post("/logout")
@@ -1,47 +1,182 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from typing import List, Optional, Tuple
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    status,
+    Query,
+    UploadFile,
+    File,
+    Request,
+    Response,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.configs.database import get_db
 from app.routers.auth import get_current_user
 from app.controllers.bookmark_controller import BookmarkController
+from app.controllers.category_tree_controller import CategoryTreeController
+from app.controllers.bookmark_import_controller import BookmarkImportController
+from app.controllers.bookmark_export_controller import (
+    BookmarkExportController,
+    EXPORT_MEDIA_TYPES,
+)
+from app.controllers.collection_version_controller import (
+    CollectionVersionController,
+)
 from app.schemas.bookmark import (
     BookmarkNoteCreate,
     BookmarkNoteResponse,
     BookmarkNoteListResponse,
+    BookmarkChangesResponse,
     BookmarkNoteCategoryUpdate,
+    BookmarkNoteSortOrder,
+    CategoryTreeNodeResponse,
+    BookmarkImportFormat,
+    BookmarkImportResponse,
+    BookmarkExportFormat,
+    BookmarkLookupRequest,
+    BookmarkLookupResponse,
 )
 from app.models.user import User
+from app.caches.response_cache import bookmark_list_cache
+from app.utils.conditional_request import check_not_modified, make_etag
+from app.utils.json_response import FastJSONResponse, dumps_json
 import math
 
 router = APIRouter(prefix="/api/bookmark", tags=["bookmark"])
 
 
+async def _check_collection_not_modified(
+    request: Request, response: Response, db: AsyncSession, user_id: int
+) -> Tuple[Optional[Response], int]:
+    """
+    컬렉션 버전으로 ETag를 만들어 조건부 요청 처리 (304 응답 또는 None, 컬렉션 버전)
+
+    버전은 users 기본 키 조회 한 번으로 읽으므로 304 응답은 북마크 테이블을 읽지 않습니다.
+    같은 버전이라도 경로와 쿼리 문자열이 다르면 다른 응답이므로 ETag에 포함합니다.
+    """
+    version = await CollectionVersionController.get_version(db, user_id)
+    etag = make_etag(
+        "bookmarks", user_id, version, request.url.path, request.url.query
+    )
+    return check_not_modified(request, response, etag), version
+
+
 @router.post("/", response_model=BookmarkNoteResponse)
 async def create_bookmark_note(
     bookmark_data: BookmarkNoteCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     북마크 노트 생성
 
     - **url**: 북마크할 URL (HTTPS만 허용)
+    - 추적 파라미터 등을 정리한 정규화 URL이 같은 북마크가 이미 있으면 새로 만들지 않고 기존 노트를 반환합니다
     - 나중에 AI를 통해 제목과 카테고리가 자동 생성됩니다
     """
-    bookmark_note = BookmarkController.create_bookmark_note(
+    bookmark_note = await BookmarkController.create_bookmark_note(
         db=db, bookmark_data=bookmark_data, user_id=current_user.id
     )
     return bookmark_note
 
 
+@router.post("/import", response_model=BookmarkImportResponse)
+async def import_bookmarks(
+    file: UploadFile = File(..., description="북마크 내보내기 파일"),
+    format: BookmarkImportFormat = Query(
+        BookmarkImportFormat.AUTO,
+        description="파일 형식 (auto, html, pocket_csv, takeout_json)",
+    ),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    북마크 일괄 가져오기
+
+    - **file**: Chrome/Firefox 북마크 HTML, Pocket 내보내기(HTML/CSV), Google Takeout YouTube 시청 기록(JSON)
+    - **format**: 생략하면 파일 내용으로 자동 판별합니다
+    - HTTPS URL만 가져오며, 정규화 URL 기준으로 이미 있는 북마크와 파일 안의 중복은 건너뜁니다
+    - 항목별 결과(`created`, `duplicate`, `invalid`)와 요약을 반환합니다
+    """
+    result = await BookmarkImportController.import_bookmarks(
+        db=db, user_id=current_user.id, file=file.file, import_format=format
+    )
+    return result
+
+
+@router.post("/lookup", response_model=BookmarkLookupResponse)
+async def lookup_bookmarks(
+    lookup_data: BookmarkLookupRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    URL 저장 여부 일괄 조회
+
+    - **urls**: 확인할 URL 목록 (최대 5000개)
+    - 추적 파라미터 등을 정리한 정규화 URL 기준으로 비교하며, URL별 북마크 노트 ID(없으면 null)를 반환합니다
+    """
+    results = await BookmarkController.lookup_bookmark_ids(
+        db=db, user_id=current_user.id, urls=lookup_data.urls
+    )
+    return BookmarkLookupResponse(results=results)
+
+
+@router.get("/export")
+async def export_bookmarks(
+    format: BookmarkExportFormat = Query(
+        BookmarkExportFormat.NDJSON, description="파일 형식 (ndjson, csv)"
+    ),
+    gzip: bool = Query(False, description="gzip으로 압축해서 전송"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    북마크 전체 내보내기
+
+    - **format**: `ndjson`(기본값) 또는 `csv`
+    - **gzip**: true면 `Content-Encoding: gzip`으로 압축해서 전송합니다
+    - 생성일 오래된 순으로 스트리밍하므로 북마크 수와 관계없이 바로 응답이 시작됩니다
+    """
+    headers = {
+        "Content-Disposition": f'attachment; filename="bookmarks.{format.value}"'
+    }
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        BookmarkExportController.stream_bookmark_notes(
+            db.bind, current_user.id, format, gzip=gzip
+        ),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers=headers,
+    )
+
+
 @router.get("/", response_model=BookmarkNoteListResponse)
 async def get_bookmark_notes(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(20, ge=1, le=100, description="페이지 크기"),
     category: Optional[str] = Query(None, description="카테고리로 필터링"),
     search: Optional[str] = Query(None, description="제목 또는 설명에서 검색"),
+    cursor: Optional[str] = Query(
+        None, description="이전 응답의 next_cursor (지정 시 page 대신 사용)"
+    ),
+    sort: BookmarkNoteSortOrder = Query(
+        BookmarkNoteSortOrder.LATEST, description="정렬 기준 (latest, relevance)"
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="응답에 포함할 필드 (쉼표 구분, 예: id,title,url). 없으면 description을 뺀 요약 필드",
+    ),
+    include_total: bool = Query(
+        True, description="total/pages 포함 여부 (false면 세지 않고 has_more만 반환)"
+    ),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     북마크 노트 리스트 조회 (페이지네이션)
@@ -50,20 +185,111 @@ async def get_bookmark_notes(
     - **size**: 페이지 크기 (1-100)
     - **category**: 카테고리로 필터링 (선택사항)
     - **search**: 제목 또는 설명에서 검색 (선택사항)
+    - **cursor**: 이전 응답의 `next_cursor` 값. 지정하면 깊은 페이지도 일정한 속도로 이어서 조회합니다
+    - **sort**: `latest`(기본값, 최신순) 또는 `relevance`(검색 관련도순, page로만 페이지 이동)
+    - **fields**: 응답 항목에 포함할 필드. 지정한 필드의 컬럼만 조회하며 `id`는 항상 포함됩니다.
+      지정하지 않으면 `description`/`deleted_at`을 뺀 요약 필드를 반환합니다
+    - **include_total**: `false`면 `total`/`pages`를 세지 않고 `null`로 반환합니다.
+      필터/검색 조건이 있으면 COUNT를 생략해 조회 비용이 줄어들며, 다음 페이지 여부는 `has_more`로 확인합니다
+    - `If-None-Match`에 이전 응답의 `ETag`를 보내면 북마크가 바뀌지 않은 경우 304를 반환합니다
+    - 같은 조건의 응답은 컬렉션 버전이 바뀔 때까지 응답 캐시에서 COUNT/SELECT 없이 반환합니다
     """
-    bookmark_notes, total = BookmarkController.get_bookmark_notes(
+    not_modified, version = await _check_collection_not_modified(
+        request, response, db, current_user.id
+    )
+    if not_modified:
+        return not_modified
+
+    # 결과가 같은 조건은 같은 키가 되도록 정규화 (빈 문자열은 조건 없음, 검색어 없으면 정렬 무관)
+    fields = BookmarkController.parse_fields(fields)
+    category = category or None
+    search = search or None
+    if not search:
+        sort = BookmarkNoteSortOrder.LATEST
+    cache_key = bookmark_list_cache.make_key(
+        "bookmark_list",
+        current_user.id,
+        version,
+        [page, size, category, search, cursor, sort.value, fields, include_total],
+    )
+    cached_body = await bookmark_list_cache.get(cache_key)
+    if cached_body is not None:
+        return Response(
+            content=cached_body,
+            media_type="application/json",
+            headers=dict(response.headers),
+        )
+
+    (
+        bookmark_notes,
+        total,
+        next_cursor,
+        has_more,
+    ) = await BookmarkController.get_bookmark_notes(
         db=db,
         user_id=current_user.id,
         page=page,
         size=size,
         category=category,
         search=search,
+        cursor=cursor,
+        sort=sort,
+        fields=fields,
+        include_total=include_total,
+    )
+
+    pages = None
+    if total is not None:
+        pages = math.ceil(total / size) if total > 0 else 0
+
+    # 응답 컬럼만 읽은 딕셔너리라 BookmarkNoteListResponse 재검증 없이 바로 직렬화
+    body = dumps_json(
+        {
+            "items": bookmark_notes,
+            "total": total,
+            "page": page,
+            "size": size,
+            "pages": pages,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
+        }
     )
+    await bookmark_list_cache.set(cache_key, body)
+    return Response(
+        content=body, media_type="application/json", headers=dict(response.headers)
+    )
+
 
-    pages = math.ceil(total / size) if total > 0 else 0
+@router.get("/changes", response_model=BookmarkChangesResponse)
+async def get_bookmark_changes(
+    request: Request,
+    response: Response,
+    since: Optional[str] = Query(
+        None, description="이전 응답의 next_cursor (없으면 처음부터 전체 동기화)"
+    ),
+    limit: int = Query(500, ge=1, le=1000, description="한 번에 받을 최대 변경 수"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    북마크 변경 피드 (델타 동기화)
 
-    return BookmarkNoteListResponse(
-        items=bookmark_notes, total=total, page=page, size=size, pages=pages
+    - **since**: 이전 응답의 `next_cursor`. 그 이후에 생성/카테고리 변경/삭제된 노트만 반환합니다
+    - **limit**: 한 번에 받을 최대 변경 수 (1-1000). `has_more`가 true면 `next_cursor`로 이어서 요청합니다
+    - 삭제된 노트는 `is_deleted: true`인 삭제 기록으로 포함됩니다 (since가 없는 첫 동기화는 제외)
+    - `If-None-Match`에 이전 응답의 `ETag`를 보내면 바뀐 것이 없는 경우 304를 반환합니다
+    """
+    not_modified, _ = await _check_collection_not_modified(
+        request, response, db, current_user.id
+    )
+    if not_modified:
+        return not_modified
+
+    bookmark_notes, next_cursor, has_more = await BookmarkController.get_changes(
+        db=db, user_id=current_user.id, since=since, limit=limit
+    )
+    return BookmarkChangesResponse(
+        items=bookmark_notes, next_cursor=next_cursor, has_more=has_more
     )
 
 
@@ -71,17 +297,17 @@ async def get_bookmark_notes(
 async def get_bookmark_note(
     bookmark_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     특정 북마크 노트 조회
 
     - **bookmark_id**: 조회할 북마크 노트 ID
     """
-    bookmark_note = BookmarkController.get_bookmark_note(
+    bookmark_note = await BookmarkController.get_bookmark_note_fields(
         db=db, bookmark_id=bookmark_id, user_id=current_user.id
     )
-    return bookmark_note
+    return FastJSONResponse(bookmark_note)
 
 
 @router.put("/{bookmark_id}/categories", response_model=BookmarkNoteResponse)
@@ -89,7 +315,7 @@ async def update_bookmark_categories(
     bookmark_id: int,
     category_data: BookmarkNoteCategoryUpdate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     북마크 노트 카테고리 업데이트
@@ -99,7 +325,7 @@ async def update_bookmark_categories(
     - **category2**: 두 번째 카테고리
     - **category3**: 세 번째 카테고리
     """
-    bookmark_note = BookmarkController.update_bookmark_categories(
+    bookmark_note = await BookmarkController.update_bookmark_categories(
         db=db,
         bookmark_id=bookmark_id,
         user_id=current_user.id,
@@ -112,7 +338,7 @@ async def update_bookmark_categories(
 async def delete_bookmark_note(
     bookmark_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     북마크 노트 삭제 (소프트 삭제)
@@ -120,7 +346,7 @@ async def delete_bookmark_note(
     - **bookmark_id**: 삭제할 북마크 노트 ID
     - 실제로는 삭제되지 않고 is_deleted 플래그가 True로 설정됩니다
     """
-    bookmark_note = BookmarkController.delete_bookmark_note(
+    bookmark_note = await BookmarkController.delete_bookmark_note(
         db=db, bookmark_id=bookmark_id, user_id=current_user.id
     )
     return bookmark_note
@@ -128,15 +354,50 @@ async def delete_bookmark_note(
 
 @router.get("/categories/list", response_model=List[str])
 async def get_categories(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     사용자의 모든 카테고리 조회
 
     - 현재 사용자가 생성한 모든 북마크 노트의 카테고리 목록을 반환합니다
+    - `If-None-Match`에 이전 응답의 `ETag`를 보내면 북마크가 바뀌지 않은 경우 304를 반환합니다
     """
-    categories = BookmarkController.get_categories(
+    not_modified, _ = await _check_collection_not_modified(
+        request, response, db, current_user.id
+    )
+    if not_modified:
+        return not_modified
+
+    categories = await BookmarkController.get_categories(
         db=db, user_id=current_user.id
     )
     return categories
+
+
+@router.get("/categories/tree", response_model=List[CategoryTreeNodeResponse])
+async def get_category_tree(
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    사용자의 카테고리 트리 조회
+
+    - category1 > category2 > category3 계층과 각 노드의 북마크 수를 반환합니다
+    - 비어 있는 중간 단계는 건너뛰고 다음 단계가 바로 하위 노드가 됩니다
+    - `If-None-Match`에 이전 응답의 `ETag`를 보내면 북마크가 바뀌지 않은 경우 304를 반환합니다
+    """
+    not_modified, _ = await _check_collection_not_modified(
+        request, response, db, current_user.id
+    )
+    if not_modified:
+        return not_modified
+
+    category_tree = await CategoryTreeController.get_category_tree(
+        db=db, user_id=current_user.id
+    )
+    return category_tree
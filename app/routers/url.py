@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.configs.database import get_db
 from app.routers.auth import get_current_user
 from app.controllers.bookmark_controller import BookmarkController
@@ -13,7 +13,7 @@ router = APIRouter()
 async def create_url(
     url_data: BookmarkNoteCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     URL 등록 및 북마크 노트 생성
@@ -25,7 +25,7 @@ async def create_url(
     """
     try:
         # 북마크 노트 생성
-        bookmark_note = BookmarkController.create_bookmark_note(
+        bookmark_note = await BookmarkController.create_bookmark_note(
             db=db, bookmark_data=url_data, user_id=current_user.id
         )
 
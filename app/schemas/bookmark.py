@@ -1,8 +1,16 @@
 from datetime import datetime
-from typing import Optional, List
+from enum import Enum
+from typing import Dict, Optional, List
 from pydantic import BaseModel, HttpUrl, Field, validator
 
 
+class BookmarkNoteSortOrder(str, Enum):
+    """북마크 노트 목록 정렬 기준"""
+
+    LATEST = "latest"  # 최신순
+    RELEVANCE = "relevance"  # 검색 관련도순 (search와 함께 사용)
+
+
 class BookmarkNoteCreate(BaseModel):
     """북마크 노트 생성 스키마"""
 
@@ -15,8 +23,8 @@ class BookmarkNoteCreate(BaseModel):
         return v
 
 
-class BookmarkNoteResponse(BaseModel):
-    """북마크 노트 응답 스키마"""
+class BookmarkNoteSummaryResponse(BaseModel):
+    """북마크 노트 요약 응답 스키마 (목록 기본 필드, 긴 설명 제외)"""
 
     id: int
     title: str
@@ -24,16 +32,22 @@ class BookmarkNoteResponse(BaseModel):
     category1: Optional[str] = None
     category2: Optional[str] = None
     category3: Optional[str] = None
-    description: Optional[str] = None
+    canonical_url: Optional[str] = None
     user_id: int
     created_at: datetime
     updated_at: datetime
-    deleted_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
 
 
+class BookmarkNoteResponse(BookmarkNoteSummaryResponse):
+    """북마크 노트 응답 스키마"""
+
+    description: Optional[str] = None
+    deleted_at: Optional[datetime] = None
+
+
 class BookmarkNoteCategoryUpdate(BaseModel):
     """북마크 노트 카테고리 업데이트 스키마"""
 
@@ -51,11 +65,124 @@ class BookmarkNoteCategoryUpdate(BaseModel):
 class BookmarkNoteListResponse(BaseModel):
     """북마크 노트 리스트 응답 스키마"""
 
-    items: List[BookmarkNoteResponse]
-    total: int
+    items: List[BookmarkNoteSummaryResponse] = Field(
+        ...,
+        description="기본은 요약 필드, fields를 지정하면 지정한 필드(와 id)만 포함",
+    )
+    total: Optional[int] = Field(
+        ..., description="조건에 맞는 전체 수 (include_total=false면 null)"
+    )
     page: int
     size: int
-    pages: int
+    pages: Optional[int] = Field(
+        ..., description="전체 페이지 수 (include_total=false면 null)"
+    )
+    has_more: bool = Field(..., description="다음 페이지가 있는지")
+    next_cursor: Optional[str] = Field(
+        None, description="다음 페이지 조회용 커서 (마지막 페이지면 null)"
+    )
+
+
+class BookmarkChangeResponse(BookmarkNoteResponse):
+    """변경 피드 항목 스키마 (삭제된 노트는 is_deleted가 true인 삭제 기록)"""
+
+    is_deleted: bool
+
+
+class BookmarkChangesResponse(BaseModel):
+    """변경 피드 응답 스키마"""
+
+    items: List[BookmarkChangeResponse]
+    next_cursor: str = Field(
+        ..., description="다음 동기화에 since로 보낼 커서 (변경이 없으면 요청한 커서와 같음)"
+    )
+    has_more: bool = Field(..., description="이번 응답 이후에 남은 변경이 있는지")
+
+
+class BookmarkLookupRequest(BaseModel):
+    """저장 여부 일괄 조회 요청 스키마"""
+
+    urls: List[str] = Field(
+        ...,
+        max_length=5000,
+        description="조회할 URL 목록 (최대 5000개, 정규화 URL 기준으로 비교)",
+    )
+
+
+class BookmarkLookupResponse(BaseModel):
+    """저장 여부 일괄 조회 응답 스키마"""
+
+    results: Dict[str, Optional[int]] = Field(
+        ..., description="URL별 북마크 노트 ID (저장되지 않았으면 null)"
+    )
+
+
+class CategoryTreeNodeResponse(BaseModel):
+    """카테고리 트리 노드 응답 스키마"""
+
+    name: str
+    bookmark_count: int = Field(..., description="이 카테고리 아래 북마크 수")
+    children: List["CategoryTreeNodeResponse"] = []
+
+
+class BookmarkImportFormat(str, Enum):
+    """북마크 가져오기 파일 형식"""
+
+    AUTO = "auto"  # 파일 내용으로 자동 판별
+    HTML = "html"  # Chrome/Firefox 북마크 HTML, Pocket HTML 내보내기
+    POCKET_CSV = "pocket_csv"  # Pocket CSV 내보내기
+    TAKEOUT_JSON = "takeout_json"  # Google Takeout YouTube 시청 기록 (watch-history.json)
+
+
+class BookmarkImportItemStatus(str, Enum):
+    """북마크 가져오기 항목별 처리 결과"""
+
+    CREATED = "created"  # 새로 생성됨
+    DUPLICATE = "duplicate"  # 이미 있거나 파일 안에서 중복됨
+    INVALID = "invalid"  # URL 검증 실패
+
+
+class BookmarkImportItemResult(BaseModel):
+    """북마크 가져오기 항목별 결과 스키마"""
+
+    index: int = Field(..., description="파일 안에서의 항목 순서 (0부터 시작)")
+    url: str
+    status: BookmarkImportItemStatus
+    bookmark_id: Optional[int] = Field(
+        None, description="생성되었거나 이미 있는 북마크 노트 ID"
+    )
+    error: Optional[str] = None
+
+
+class BookmarkImportSummary(BaseModel):
+    """북마크 가져오기 요약 스키마"""
+
+    total: int
+    created: int
+    duplicates: int
+    invalid: int
+    enrichment_skipped: int = Field(
+        0,
+        description=(
+            "제목 없이 생성됐지만 보강 대기열에 넣지 못해 페이지 정보를 채우지 못한 항목 수 (임시 제목 유지). "
+            "대기열이 한 번 거절하면 그 뒤로 비워지더라도 나머지 항목은 넣지 않고 모두 이 수에 포함합니다."
+        ),
+    )
+
+
+class BookmarkImportResponse(BaseModel):
+    """북마크 가져오기 응답 스키마"""
+
+    format: BookmarkImportFormat
+    summary: BookmarkImportSummary
+    items: List[BookmarkImportItemResult]
+
+
+class BookmarkExportFormat(str, Enum):
+    """북마크 내보내기 파일 형식"""
+
+    NDJSON = "ndjson"  # 한 줄에 북마크 하나씩 JSON
+    CSV = "csv"  # 헤더 행이 있는 CSV
 
 
 class BookmarkNoteFilter(BaseModel):
@@ -65,3 +192,9 @@ class BookmarkNoteFilter(BaseModel):
     search: Optional[str] = Field(None, description="제목 또는 설명에서 검색")
     page: int = Field(1, ge=1, description="페이지 번호")
     size: int = Field(20, ge=1, le=100, description="페이지 크기")
+    cursor: Optional[str] = Field(
+        None, description="이전 응답의 next_cursor (지정 시 page 대신 사용)"
+    )
+    sort: BookmarkNoteSortOrder = Field(
+        BookmarkNoteSortOrder.LATEST, description="정렬 기준 (latest, relevance)"
+    )
@@ -0,0 +1,45 @@
+"""
+카테고리 트리 재구성 스크립트
+
+북마크 노트의 category1~3 값을 기준으로 category_tree_nodes를 처음부터 다시 만듭니다.
+증분 갱신 카운트가 어긋났을 때(직접 수정한 데이터, 장애 복구 등) 맞추는 용도입니다.
+
+실행: uv run python -m app.scripts.rebuild_category_tree [--user-id ID ...]
+"""
+
+import argparse
+import asyncio
+from typing import List, Optional
+
+from app.configs.database import safe_async_session
+from app.controllers.category_tree_controller import CategoryTreeController
+
+# 모든 모델을 import (SQLAlchemy 관계 설정을 위해)
+from app.models import user, url, bookmark, category  # noqa: F401
+
+
+async def rebuild(user_ids: Optional[List[int]] = None) -> int:
+    """한 트랜잭션 안에서 카테고리 트리를 재구성하고 생성한 노드 수를 반환"""
+    async with safe_async_session() as db:
+        return await CategoryTreeController.rebuild_category_tree(db, user_ids)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 인자를 읽어 재구성을 실행하고 생성한 노드 수를 반환"""
+    parser = argparse.ArgumentParser(description="카테고리 트리 재구성")
+    parser.add_argument(
+        "--user-id",
+        type=int,
+        action="append",
+        dest="user_ids",
+        help="재구성할 사용자 ID (여러 번 지정 가능, 생략하면 전체 사용자)",
+    )
+    args = parser.parse_args(argv)
+
+    created = asyncio.run(rebuild(args.user_ids))
+    print(f"카테고리 트리 노드 {created}개를 재구성했습니다")
+    return created
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import json
+from datetime import datetime
+from typing import Any
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # 의존성에 포함되어 있지만, 빠진 환경에서는 표준 json으로 같은 형식을 만든다
+    orjson = None
+
+
+def _default(value: Any) -> str:
+    """표준 json이 직렬화하지 못하는 값 (orjson/pydantic과 같은 날짜 형식)"""
+    if isinstance(value, datetime):
+        text = value.isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    raise TypeError(f"{type(value).__name__} 값은 JSON으로 직렬화할 수 없습니다")
+
+
+def dumps_json(content: Any) -> bytes:
+    """
+    응답 본문 직렬화 (orjson 사용, 없으면 표준 json)
+
+    DB에서 읽은 값을 검증 없이 바로 쓰므로 딕셔너리/리스트/기본 타입과 datetime만 받습니다.
+    """
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+    return json.dumps(
+        content, ensure_ascii=False, separators=(",", ":"), default=_default
+    ).encode()
+
+
+class FastJSONResponse(JSONResponse):
+    """dumps_json으로 직렬화하는 JSON 응답 (response_model 재검증을 거치지 않도록 직접 반환)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
@@ -0,0 +1,33 @@
+import importlib
+from typing import Callable, Dict, Iterable, Optional
+from sqlalchemy import Table
+from sqlalchemy.sql.dml import Insert
+
+# ON CONFLICT / ON DUPLICATE KEY 구문으로 한 번에 저장할 수 있는 방언
+# (방언 모듈은 import 비용이 커서 해당 DB에 처음 쓸 때 import)
+UPSERT_DIALECTS = frozenset({"mysql", "postgresql", "sqlite"})
+
+
+def upsert_statement(
+    dialect_name: str,
+    table: Table,
+    index_elements: Iterable[str],
+    updates: Callable[[object], Dict[str, object]],
+) -> Optional[Insert]:
+    """
+    충돌 시 갱신하는 방언별 INSERT 구문 (지원하지 않는 방언이면 None)
+
+    updates는 넣으려던 행(MySQL은 inserted, 그 외는 excluded)을 받아
+    충돌한 행에 덮어쓸 컬럼과 값을 돌려줍니다.
+    index_elements는 ON CONFLICT 대상이며, MySQL은 모든 고유 키에 대해 갱신합니다.
+    """
+    if dialect_name not in UPSERT_DIALECTS:
+        return None
+    statement = importlib.import_module(f"sqlalchemy.dialects.{dialect_name}").insert(
+        table
+    )
+    if dialect_name == "mysql":
+        return statement.on_duplicate_key_update(updates(statement.inserted))
+    return statement.on_conflict_do_update(
+        index_elements=list(index_elements), set_=updates(statement.excluded)
+    )
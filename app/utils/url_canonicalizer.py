@@ -0,0 +1,123 @@
+import hashlib
+from typing import Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+# 같은 페이지를 가리키는지와 관계없는 추적용 쿼리 파라미터
+TRACKING_PARAMS = frozenset(
+    {
+        "fbclid",
+        "gclid",
+        "dclid",
+        "gbraid",
+        "wbraid",
+        "msclkid",
+        "yclid",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "_hsenc",
+        "_hsmi",
+        "ref_src",
+        "spm",
+    }
+)
+TRACKING_PARAM_PREFIXES = ("utm_",)
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+_YOUTUBE_HOSTS = frozenset(
+    {"youtube.com", "www.youtube.com", "m.youtube.com", "music.youtube.com"}
+)
+_YOUTUBE_SHORT_HOST = "youtu.be"
+_YOUTUBE_PATH_PREFIXES = ("/shorts/", "/embed/", "/live/", "/v/")
+_YOUTUBE_CANONICAL_PREFIX = "https://www.youtube.com/watch?v="
+
+# url_hash 컬럼 길이 (SHA-256 다이제스트 바이트 수)
+URL_HASH_LENGTH = 32
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PARAM_PREFIXES)
+
+
+def _youtube_video_id(host: str, path: str, query: str):
+    """YouTube 영상 URL이면 영상 ID 반환 (youtu.be/ID, watch?v=ID, shorts/ID 등)"""
+    if host == _YOUTUBE_SHORT_HOST:
+        video_id = path.strip("/").split("/")[0]
+        return video_id or None
+    if host not in _YOUTUBE_HOSTS:
+        return None
+    if path.rstrip("/") == "/watch":
+        return dict(parse_qsl(query)).get("v") or None
+    for prefix in _YOUTUBE_PATH_PREFIXES:
+        if path.startswith(prefix):
+            return path[len(prefix) :].split("/")[0] or None
+    return None
+
+
+def _split_url(url: str) -> Tuple[str, str, str, str, str]:
+    """(scheme, netloc, path, query, fragment) 분리 (urlsplit보다 가벼운 일반 경로)"""
+    scheme, separator, rest = url.partition("://")
+    if not separator:
+        return tuple(urlsplit(url))
+    rest, _, fragment = rest.partition("#")
+    rest, _, query = rest.partition("?")
+    netloc, slash, path = rest.partition("/")
+    return scheme, netloc, slash + path, query, fragment
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    중복 판별용 정규화 URL
+
+    - 스킴/호스트 소문자, 기본 포트(80/443) 제거
+    - 추적용 파라미터(utm_*, fbclid, gclid 등) 제거 후 나머지 파라미터 정렬
+    - 경로 끝 슬래시 제거 (루트는 "/"), 프래그먼트 제거 (#!/, #/ 해시 라우팅은 유지)
+    - YouTube 영상은 https://www.youtube.com/watch?v=ID 하나로 통일
+    """
+    scheme, netloc, path, query, fragment = _split_url(url.strip())
+    scheme = scheme.lower()
+    if "@" in netloc or ":" in netloc:
+        parts = urlsplit(f"{scheme}://{netloc}")
+        host = (parts.hostname or "").lower()
+        if ":" in host:
+            # IPv6 리터럴은 hostname에서 대괄호가 빠지므로 다시 감쌈 (포트와 구분)
+            host = f"[{host}]"
+        netloc = host
+        port = parts.port
+        if port and port != _DEFAULT_PORTS.get(scheme):
+            netloc = f"{host}:{port}"
+        if parts.username:
+            userinfo = parts.username
+            if parts.password:
+                userinfo = f"{userinfo}:{parts.password}"
+            netloc = f"{userinfo}@{netloc}"
+    else:
+        # 포트/사용자 정보가 없는 대부분의 URL은 netloc을 다시 파싱하지 않음
+        host = netloc = netloc.lower()
+
+    video_id = _youtube_video_id(host, path, query)
+    if video_id:
+        return f"{_YOUTUBE_CANONICAL_PREFIX}{video_id}"
+
+    path = path.rstrip("/") or "/"
+    # 파라미터는 디코딩하지 않고 원문 그대로 비교 (요청마다 수천 개를 처리하므로)
+    query = "&".join(
+        sorted(
+            pair
+            for pair in query.split("&")
+            if pair and not _is_tracking_param(pair.partition("=")[0])
+        )
+    )
+    canonical = f"{scheme}://{netloc}{path}"
+    if query:
+        canonical = f"{canonical}?{query}"
+    if fragment.startswith(("!", "/")):
+        canonical = f"{canonical}#{fragment}"
+    return canonical
+
+
+def url_hash(url: str) -> bytes:
+    """정규화 URL의 SHA-256 다이제스트 (bookmark_notes.url_hash 값)"""
+    return hashlib.sha256(canonicalize_url(url).encode()).digest()
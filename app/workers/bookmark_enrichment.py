@@ -0,0 +1,649 @@
+import asyncio
+import codecs
+import ipaddress
+import logging
+import re
+import socket
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+
+import httpcore
+import httpx
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.configs.database import get_async_session_factory
+from app.configs.http_client import (
+    HTTP_CONNECT_RETRIES,
+    HTTP_LIMITS,
+    HTTP_TIMEOUT,
+)
+from app.controllers.collection_version_controller import (
+    CollectionVersionController,
+)
+from app.controllers.url_metadata_controller import UrlMetadataController
+from app.models.bookmark import BookmarkNote
+from app.models.url_metadata import UrlMetadata, UrlFetchStatus
+from app.models.user import User
+from app.utils.url_canonicalizer import canonicalize_url, url_hash
+
+logger = logging.getLogger(__name__)
+
+# 동시에 가져오는 URL 수 (전체 / 호스트별)
+ENRICHMENT_CONCURRENCY = 10
+ENRICHMENT_PER_HOST_CONCURRENCY = 2
+
+# 대기열 최대 길이 (넘치면 보강을 건너뜀)
+ENRICHMENT_QUEUE_SIZE = 1000
+
+# <head>를 찾기 위해 읽는 최대 바이트 수
+ENRICHMENT_MAX_HEAD_BYTES = 64 * 1024
+
+# Content-Type에 charset이 없을 때 <meta charset> 선언을 찾는 앞부분 바이트 수 (HTML 표준의 prescan 범위)
+ENRICHMENT_CHARSET_SNIFF_BYTES = 1024
+
+# 결과를 모아 한 번에 UPDATE하는 기준 (건수 / 최대 대기 시간)
+ENRICHMENT_BATCH_SIZE = 50
+ENRICHMENT_FLUSH_INTERVAL_SECONDS = 0.5
+
+# 종료 시 진행 중인 작업을 기다리는 최대 시간
+ENRICHMENT_DRAIN_TIMEOUT_SECONDS = 10.0
+
+# 직접 따라가는 최대 리다이렉트 횟수
+ENRICHMENT_MAX_REDIRECTS = 5
+
+# 전역 주소가 아니어도 가져올 수 있는 네트워크 (기본은 없음, 내부 문서용 배포/테스트에서 지정)
+ENRICHMENT_ALLOWED_NETWORKS: Tuple[
+    Union[ipaddress.IPv4Network, ipaddress.IPv6Network], ...
+] = ()
+
+# 제목/URL 컬럼 길이
+_MAX_TITLE_LENGTH = 500
+_MAX_URL_LENGTH = 2048
+
+# <meta charset="..."> 와 <meta http-equiv="Content-Type" content="...; charset=..."> 선언
+_META_CHARSET_PATTERN = re.compile(
+    rb"""<meta[^>]*?charset\s*=\s*["']?\s*([a-z0-9_.:-]+)""", re.IGNORECASE
+)
+
+
+@dataclass
+class HeadMetadata:
+    """<head>에서 추출한 페이지 메타데이터"""
+
+    title: Optional[str] = None
+    description: Optional[str] = None
+    canonical_url: Optional[str] = None
+    thumbnail_url: Optional[str] = None
+    content_type: Optional[str] = None
+
+
+class HeadMetadataParser(HTMLParser):
+    """og:title, og:description, og:image, canonical 링크만 뽑고 </head>나 <body>에서 멈추는 파서"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.og_title: Optional[str] = None
+        self.og_description: Optional[str] = None
+        self.meta_description: Optional[str] = None
+        self.image_url: Optional[str] = None
+        self.canonical_url: Optional[str] = None
+        self.done = False
+        self._title_parts: Optional[List[str]] = None
+        self._document_title: Optional[str] = None
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        attributes = {name.lower(): value for name, value in attrs if value}
+        if tag == "meta":
+            key = (attributes.get("property") or attributes.get("name") or "").lower()
+            content = (attributes.get("content") or "").strip()
+            if not content:
+                return
+            if key == "og:title" and self.og_title is None:
+                self.og_title = content
+            elif key == "og:description" and self.og_description is None:
+                self.og_description = content
+            elif key == "description" and self.meta_description is None:
+                self.meta_description = content
+            elif key in ("og:image", "twitter:image") and self.image_url is None:
+                self.image_url = content
+        elif tag == "link":
+            rel = (attributes.get("rel") or "").lower().split()
+            if "canonical" in rel and self.canonical_url is None:
+                self.canonical_url = attributes.get("href", "").strip() or None
+        elif tag == "title" and self._document_title is None:
+            self._title_parts = []
+        elif tag == "body":
+            self.done = True
+
+    def handle_data(self, data):
+        if self._title_parts is not None:
+            self._title_parts.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == "title" and self._title_parts is not None:
+            self._document_title = "".join(self._title_parts).strip() or None
+            self._title_parts = None
+        elif tag == "head":
+            self.done = True
+
+    def result(self, base_url: str, content_type: Optional[str] = None) -> HeadMetadata:
+        """추출 결과 (og 값 우선, 없으면 <title>/description 메타 태그)"""
+        base = httpx.URL(base_url)
+        return HeadMetadata(
+            title=self.og_title or self._document_title,
+            description=self.og_description or self.meta_description,
+            canonical_url=str(base.join(self.canonical_url))
+            if self.canonical_url
+            else None,
+            thumbnail_url=str(base.join(self.image_url)) if self.image_url else None,
+            content_type=content_type,
+        )
+
+
+class UnsafeUrlError(ValueError):
+    """서버가 가져오면 안 되는 URL (http/https가 아니거나 내부 주소로 연결됨)"""
+
+
+def _is_allowed_address(address: str) -> bool:
+    """전역으로 라우팅되는 주소인지 (ENRICHMENT_ALLOWED_NETWORKS에 속하면 허용)"""
+    ip = ipaddress.ip_address(address.split("%")[0])
+    if ip.version == 6 and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    if any(ip in network for network in ENRICHMENT_ALLOWED_NETWORKS):
+        return True
+    return ip.is_global
+
+
+async def resolve_fetch_addresses(host: str) -> List[str]:
+    """
+    호스트가 가리키는 주소 목록 (SSRF 방지)
+
+    IP 주소는 그대로, 이름은 getaddrinfo로 해석하며, 전역 주소가 아닌 주소가 하나라도 있으면
+    UnsafeUrlError를 발생시킵니다.
+    """
+    try:
+        ipaddress.ip_address(host)
+        addresses = [host]
+    except ValueError:
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                host, None, type=socket.SOCK_STREAM
+            )
+        except socket.gaierror as e:
+            raise UnsafeUrlError(f"호스트를 찾을 수 없음: {host} ({e})") from e
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+    if not addresses or not all(_is_allowed_address(a) for a in addresses):
+        raise UnsafeUrlError(f"내부 주소로 연결되는 호스트: {host}")
+    return addresses
+
+
+async def check_fetch_url(url: str) -> None:
+    """
+    가져오기 전에 URL 검사 (SSRF 방지)
+
+    http/https만 허용하고, 호스트가 가리키는 모든 주소가 전역 주소가 아니면 UnsafeUrlError를 발생시킵니다.
+    연결할 때 다시 해석한 결과로 한 번 더 검사하므로(PinnedAddressBackend), 이 검사는
+    연결을 열기 전에 걸러내는 용도입니다.
+    """
+    parsed = httpx.URL(url)
+    if parsed.scheme not in ("http", "https") or not parsed.host:
+        raise UnsafeUrlError(f"지원하지 않는 URL: {url}")
+    await resolve_fetch_addresses(parsed.host)
+
+
+class PinnedAddressBackend(httpcore.AsyncNetworkBackend):
+    """
+    연결할 때 호스트를 해석해 검사를 통과한 주소로만 TCP 연결을 여는 네트워크 백엔드
+
+    요청 URL은 호스트 이름 그대로이므로 Host 헤더와 TLS SNI/인증서 검증은 원래 호스트 기준이고,
+    실제 연결 주소만 여기서 검사한 주소로 고정됩니다. 검사와 연결 사이에 DNS 응답이 바뀌어도
+    (DNS 리바인딩) 검사하지 않은 주소로는 연결하지 않습니다.
+    """
+
+    def __init__(self):
+        self._backend = httpcore.AnyIOBackend()
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options=None,
+    ) -> httpcore.AsyncNetworkStream:
+        addresses = await resolve_fetch_addresses(host)
+        for index, address in enumerate(addresses):
+            try:
+                return await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout):
+                # 다음 주소로 재시도 (마지막 주소면 그대로 전달)
+                if index == len(addresses) - 1:
+                    raise
+
+    async def connect_unix_socket(
+        self, path: str, timeout: Optional[float] = None, socket_options=None
+    ) -> httpcore.AsyncNetworkStream:
+        raise UnsafeUrlError(f"유닉스 소켓으로는 가져오지 않음: {path}")
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class PinnedAddressTransport(httpx.AsyncHTTPTransport):
+    """PinnedAddressBackend로 연결하는 전송 계층 (httpx는 네트워크 백엔드를 인자로 받지 않아 풀을 직접 구성)"""
+
+    def __init__(self):
+        super().__init__(http2=True, limits=HTTP_LIMITS, retries=HTTP_CONNECT_RETRIES)
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=HTTP_LIMITS.max_connections,
+            max_keepalive_connections=HTTP_LIMITS.max_keepalive_connections,
+            keepalive_expiry=HTTP_LIMITS.keepalive_expiry,
+            http1=True,
+            http2=True,
+            retries=HTTP_CONNECT_RETRIES,
+            network_backend=PinnedAddressBackend(),
+        )
+
+
+def create_enrichment_http_client() -> httpx.AsyncClient:
+    """
+    페이지 메타데이터를 가져올 때 쓰는 클라이언트 생성
+
+    연결 주소를 검사한 주소로 고정하고, 환경변수 프록시는 사용하지 않습니다
+    (프록시를 거치면 연결 주소를 검사할 수 없음).
+    """
+    return httpx.AsyncClient(
+        transport=PinnedAddressTransport(),
+        timeout=HTTP_TIMEOUT,
+        trust_env=False,
+    )
+
+
+async def fetch_head_metadata(
+    client: httpx.AsyncClient,
+    url: str,
+    max_bytes: int = ENRICHMENT_MAX_HEAD_BYTES,
+) -> Optional[HeadMetadata]:
+    """
+    URL을 스트리밍으로 받아 <head> 부분만 파싱
+
+    리다이렉트는 자동으로 따라가지 않고 ENRICHMENT_MAX_REDIRECTS번까지 직접 따라가며,
+    매번 check_fetch_url()로 검사해 내부 주소로 가는 요청은 UnsafeUrlError로 막습니다.
+    client는 create_enrichment_http_client()로 만든 클라이언트여야 연결 주소까지 검사됩니다.
+    </head>(또는 <body>)를 만나거나 max_bytes를 넘으면 본문을 더 받지 않고 연결을 닫습니다.
+    오류 응답이거나 리다이렉트가 너무 많으면 None을, HTML이 아니면 content_type만 채운 결과를 반환합니다.
+    """
+    for _ in range(ENRICHMENT_MAX_REDIRECTS + 1):
+        await check_fetch_url(url)
+        async with client.stream(
+            "GET",
+            url,
+            headers={"Accept": "text/html,application/xhtml+xml"},
+            follow_redirects=False,
+        ) as response:
+            if response.is_redirect:
+                url = str(response.url.join(response.headers["location"]))
+                continue
+            return await _read_head_metadata(response, max_bytes)
+    return None
+
+
+async def _read_head_metadata(
+    response: httpx.Response, max_bytes: int
+) -> Optional[HeadMetadata]:
+    """스트리밍 응답에서 <head> 메타데이터 추출"""
+    if response.status_code != 200:
+        return None
+    content_type = (
+        response.headers.get("content-type", "").split(";")[0].strip().lower()
+        or None
+    )
+    if "html" not in (content_type or ""):
+        return HeadMetadata(content_type=content_type)
+
+    parser = HeadMetadataParser()
+    decoder = None
+    head = b""
+    received = 0
+    async for chunk in response.aiter_bytes():
+        chunk = chunk[: max_bytes - received]
+        received += len(chunk)
+        if decoder is None:
+            # 인코딩을 정하기 전까지 앞부분을 모아 둠
+            head += chunk
+            if len(head) < ENRICHMENT_CHARSET_SNIFF_BYTES and received < max_bytes:
+                continue
+            decoder = _incremental_decoder(response, head)
+            chunk = head
+        parser.feed(decoder.decode(chunk))
+        if parser.done or received >= max_bytes:
+            break
+    if decoder is None:
+        # 앞부분 크기보다 짧은 문서
+        parser.feed(_incremental_decoder(response, head).decode(head, final=True))
+    return parser.result(str(response.url), content_type)
+
+
+def sniff_meta_charset(head: bytes) -> Optional[str]:
+    """문서 앞부분의 <meta> charset 선언에서 인코딩 이름 추출 (없거나 모르는 인코딩이면 None)"""
+    match = _META_CHARSET_PATTERN.search(head[:ENRICHMENT_CHARSET_SNIFF_BYTES])
+    if match is None:
+        return None
+    try:
+        return codecs.lookup(match.group(1).decode("ascii")).name
+    except LookupError:
+        return None
+
+
+def _incremental_decoder(response: httpx.Response, head: bytes):
+    """본문 디코더 (Content-Type의 charset, 없으면 <meta> 선언, 둘 다 없으면 UTF-8)"""
+    encoding = response.charset_encoding or sniff_meta_charset(head) or "utf-8"
+    try:
+        return codecs.getincrementaldecoder(encoding)(errors="replace")
+    except LookupError:
+        return codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+
+def _fit_url(url: Optional[str]) -> Optional[str]:
+    """컬럼 길이를 넘는 URL은 버림 (잘라 쓰면 깨진 URL이 됨)"""
+    return url if url and len(url) <= _MAX_URL_LENGTH else None
+
+
+class BookmarkEnrichmentWorker:
+    """
+    새 북마크의 제목/설명/canonical URL을 백그라운드에서 채우는 작업자
+
+    enqueue()는 대기열에 넣기만 하고 바로 반환하므로 생성 요청이 기다리지 않습니다.
+    가져오기 전에 공유 메타데이터(url_metadata)를 먼저 확인하고, 같은 페이지를 동시에
+    여러 번 요청받아도 한 번만 가져옵니다. 전체/호스트별 동시 요청 수를 제한하고,
+    결과는 모아서 메타데이터 업서트와 북마크 UPDATE 각 한 번(executemany)으로 씁니다.
+    페이지는 연결 주소를 검사한 주소로 고정하는 전용 클라이언트로 가져옵니다.
+    stop()은 대기열과 진행 중인 요청을 정해진 시간 안에서 마저 처리한 뒤 종료합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+        concurrency: int = ENRICHMENT_CONCURRENCY,
+        per_host_concurrency: int = ENRICHMENT_PER_HOST_CONCURRENCY,
+        batch_size: int = ENRICHMENT_BATCH_SIZE,
+        flush_interval: float = ENRICHMENT_FLUSH_INTERVAL_SECONDS,
+    ):
+        self.session_factory = session_factory
+        self.concurrency = concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._global_limit: Optional[asyncio.Semaphore] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._host_users: Dict[str, int] = defaultdict(int)
+        self._tasks: Set[asyncio.Task] = set()
+        self._pending: List[dict] = []
+        self._pending_metadata: Dict[bytes, dict] = {}
+        self._inflight: Dict[bytes, asyncio.Future] = {}
+        self._flush_requested: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def running(self) -> bool:
+        return self._dispatcher is not None
+
+    async def start(
+        self, session_factory: Optional[Callable[[], AsyncSession]] = None
+    ) -> None:
+        """작업자 시작 (애플리케이션 시작 시 호출)"""
+        if self.running:
+            return
+        if session_factory is not None:
+            self.session_factory = session_factory
+        if self.session_factory is None:
+            self.session_factory = get_async_session_factory()
+
+        self._http_client = create_enrichment_http_client()
+        self._queue = asyncio.Queue(maxsize=ENRICHMENT_QUEUE_SIZE)
+        self._global_limit = asyncio.Semaphore(self.concurrency)
+        self._flush_requested = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._dispatcher = asyncio.create_task(self._dispatch())
+        self._flusher = asyncio.create_task(self._flush_periodically())
+
+    def enqueue(self, bookmark_id: int, url: str) -> bool:
+        """보강할 북마크를 대기열에 추가 (작업자가 멈춰 있거나 대기열이 가득 차면 False)"""
+        if not self.running:
+            return False
+        try:
+            self._queue.put_nowait((bookmark_id, url))
+        except asyncio.QueueFull:
+            logger.warning(f"메타데이터 보강 대기열이 가득 차 건너뜀: {bookmark_id}")
+            return False
+        return True
+
+    async def stop(self, timeout: float = ENRICHMENT_DRAIN_TIMEOUT_SECONDS) -> None:
+        """대기열과 진행 중인 요청을 마저 처리하고 남은 결과를 쓴 뒤 종료"""
+        if not self.running:
+            return
+
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"메타데이터 보강 종료 대기 시간 초과, 남은 작업 {self._queue.qsize()}건 취소"
+            )
+
+        # 쓰는 중인 배치가 취소되지 않도록 잠금을 잡은 상태에서 취소
+        async with self._flush_lock:
+            tasks = [self._dispatcher, self._flusher, *self._tasks]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._dispatcher = None
+        self._flusher = None
+        await self._http_client.aclose()
+        self._http_client = None
+
+        await self.flush()
+
+    async def _dispatch(self) -> None:
+        """대기열에서 꺼내 전체 동시 요청 수 안에서 작업 생성"""
+        while True:
+            bookmark_id, url = await self._queue.get()
+            await self._global_limit.acquire()
+            task = asyncio.create_task(self._enrich(bookmark_id, url))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _enrich(self, bookmark_id: int, url: str) -> None:
+        """URL 하나의 메타데이터를 구해 결과를 배치 대기 목록에 추가"""
+        try:
+            digest = url_hash(url)
+            metadata = await self._get_metadata(digest, url)
+            self._pending.append(
+                {
+                    "bookmark_id": bookmark_id,
+                    "metadata_hash": digest,
+                    "new_title": metadata["title"],
+                    "new_description": metadata["description"],
+                    "new_canonical_url": metadata["canonical_url"],
+                }
+            )
+            if len(self._pending) >= self.batch_size:
+                self._flush_requested.set()
+        except UnsafeUrlError as e:
+            logger.warning(f"메타데이터 보강 건너뜀: {e}")
+        except Exception as e:
+            logger.warning(f"메타데이터 보강 실패: {url} ({e})")
+        finally:
+            self._global_limit.release()
+            self._queue.task_done()
+
+    async def _get_metadata(self, digest: bytes, url: str) -> dict:
+        """같은 페이지를 이미 가져오는 중이면 그 결과를 함께 기다림"""
+        shared = self._inflight.get(digest)
+        if shared is not None:
+            return await asyncio.shield(shared)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[digest] = future
+        try:
+            metadata = await self._load_metadata(digest, url)
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # 기다리는 쪽이 없어도 경고하지 않도록 확인 처리
+            raise
+        else:
+            future.set_result(metadata)
+            return metadata
+        finally:
+            del self._inflight[digest]
+
+    async def _load_metadata(self, digest: bytes, url: str) -> dict:
+        """
+        공유 메타데이터를 먼저 확인하고 없거나 오래됐을 때만 페이지를 가져옴
+
+        새로 가져온 결과는 다음 쓰기에서 url_metadata에 업서트됩니다.
+        """
+        pending = self._pending_metadata.get(digest)
+        if pending is not None:
+            return pending
+
+        async with self.session_factory() as session:
+            stored = (
+                await UrlMetadataController.get_fresh_metadata(session, [digest])
+            ).get(digest)
+        if stored is not None:
+            return {
+                "title": stored.title,
+                "description": stored.description,
+                "canonical_url": stored.canonical_url,
+            }
+
+        try:
+            async with self._host_limit(httpx.URL(url).host):
+                fetched = await fetch_head_metadata(self._http_client, url)
+        except httpx.HTTPError as e:
+            logger.warning(f"페이지 가져오기 실패: {url} ({e})")
+            fetched = None
+
+        fetch_status = (
+            UrlFetchStatus.OK if fetched is not None else UrlFetchStatus.FAILED
+        )
+        fetched = fetched or HeadMetadata()
+        metadata = {
+            "url_hash": digest,
+            "url": canonicalize_url(url)[:_MAX_URL_LENGTH],
+            "title": (fetched.title or "")[:_MAX_TITLE_LENGTH] or None,
+            "description": fetched.description,
+            "thumbnail_url": _fit_url(fetched.thumbnail_url),
+            "canonical_url": _fit_url(fetched.canonical_url),
+            "content_type": (fetched.content_type or "")[:100] or None,
+            "fetch_status": fetch_status,
+            "fetched_at": datetime.utcnow(),
+        }
+        self._pending_metadata[digest] = metadata
+        return metadata
+
+    @asynccontextmanager
+    async def _host_limit(self, host: str):
+        """호스트별 동시 요청 제한 (사용 중인 호스트의 세마포어만 유지)"""
+        semaphore = self._host_limits.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.per_host_concurrency)
+            self._host_limits[host] = semaphore
+        self._host_users[host] += 1
+        try:
+            async with semaphore:
+                yield
+        finally:
+            self._host_users[host] -= 1
+            if not self._host_users[host]:
+                del self._host_users[host]
+                del self._host_limits[host]
+
+    async def _flush_periodically(self) -> None:
+        """배치 크기에 도달하거나 flush_interval이 지나면 결과 쓰기"""
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._flush_requested.wait(), timeout=self.flush_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """모인 결과를 메타데이터 업서트와 북마크 UPDATE 한 번씩으로 반영하고 반영한 북마크 수를 반환"""
+        if not self._pending and not self._pending_metadata:
+            return 0
+
+        async with self._flush_lock:
+            rows, self._pending = self._pending, []
+            metadata_rows = list(self._pending_metadata.values())
+            self._pending_metadata = {}
+            if not rows and not metadata_rows:
+                return 0
+
+            bookmark_notes = BookmarkNote.__table__
+            statement = (
+                update(bookmark_notes)
+                .where(bookmark_notes.c.id == bindparam("bookmark_id"))
+                .values(
+                    title=func.coalesce(
+                        bindparam("new_title"), bookmark_notes.c.title
+                    ),
+                    # 이미 입력된 설명은 덮어쓰지 않음
+                    description=func.coalesce(
+                        bookmark_notes.c.description, bindparam("new_description")
+                    ),
+                    canonical_url=func.coalesce(
+                        bindparam("new_canonical_url"), bookmark_notes.c.canonical_url
+                    ),
+                    url_metadata_id=select(UrlMetadata.id)
+                    .where(UrlMetadata.url_hash == bindparam("metadata_hash"))
+                    .scalar_subquery(),
+                    # 먼저 올린 소유자의 컬렉션 버전을 변경 순번으로 기록
+                    change_seq=select(User.bookmark_version)
+                    .where(User.id == bookmark_notes.c.user_id)
+                    .scalar_subquery(),
+                )
+            )
+            try:
+                async with self.session_factory() as session:
+                    if metadata_rows:
+                        await UrlMetadataController.save_metadata(
+                            session, metadata_rows
+                        )
+                    if rows:
+                        # 제목/설명이 바뀐 북마크 소유자의 조회 ETag 무효화
+                        await CollectionVersionController.bump_for_bookmarks(
+                            session, {row["bookmark_id"] for row in rows}
+                        )
+                        await session.execute(statement, rows)
+                    await session.commit()
+            except Exception as e:
+                logger.error(f"메타데이터 보강 결과 저장 실패 ({len(rows)}건): {e}")
+                return 0
+            return len(rows)
+
+
+# 애플리케이션 전역 북마크 메타데이터 보강 작업자
+bookmark_enrichment_worker = BookmarkEnrichmentWorker()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+북마크 목록 조회/직렬화 벤치마크
+
+임시 SQLite 데이터베이스에 북마크를 채운 뒤 한 페이지(기본 100개)를 만드는 처리량을 비교합니다.
+
+- orm: ORM 객체 조회 → BookmarkNoteResponse(from_attributes) 검증 → 표준 json 직렬화
+  (이전 목록 API와 FastAPI response_model 경로)
+- core: BookmarkController.get_bookmark_notes(Core SELECT, 전체 응답 필드, total은 사용자별 북마크 수) → dumps_json
+- summary: 같은 경로의 기본 요약 필드 (description 제외)
+
+같은 페이지를 반복해 초당 처리 페이지 수를 출력합니다.
+
+실행: uv run python -m benchmarks.bookmark_list [--bookmarks N] [--size S] [--runs R]
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import tempfile
+import time
+
+os.environ.setdefault("TESTING", "1")
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from sqlalchemy import and_, func, insert, select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+
+from app.configs.database import Base  # noqa: E402
+from app.controllers.bookmark_controller import (  # noqa: E402
+    BookmarkController,
+    BOOKMARK_NOTE_SUMMARY_FIELDS,
+)
+from app.models import user, url, bookmark, category  # noqa: E402, F401
+from app.models.bookmark import BookmarkNote  # noqa: E402
+from app.models.user import User, ProviderType  # noqa: E402
+from app.schemas.bookmark import BookmarkNoteResponse  # noqa: E402
+from app.utils.json_response import dumps_json, orjson  # noqa: E402
+
+SEED_BATCH_SIZE = 5000
+
+
+async def orm_page(db: AsyncSession, size: int) -> bytes:
+    """ORM 객체와 response_model 검증을 거치는 이전 경로"""
+    query = select(BookmarkNote).where(
+        and_(BookmarkNote.user_id == 1, BookmarkNote.is_deleted == False)
+    )
+    total = await db.scalar(select(func.count()).select_from(query.subquery()))
+    result = await db.scalars(
+        query.order_by(BookmarkNote.created_at.desc(), BookmarkNote.id.desc()).limit(
+            size + 1
+        )
+    )
+    bookmark_notes = list(result.all())[:size]
+    response = {
+        "items": [BookmarkNoteResponse.model_validate(note) for note in bookmark_notes],
+        "total": total,
+        "page": 1,
+        "size": size,
+        "pages": math.ceil(total / size),
+    }
+    return json.dumps(
+        jsonable_encoder(response), ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+async def core_page(
+    db: AsyncSession,
+    size: int,
+    fields=tuple(BookmarkNoteResponse.model_fields),
+) -> bytes:
+    """Core SELECT 결과를 바로 직렬화하는 현재 경로"""
+    (
+        bookmark_notes,
+        total,
+        next_cursor,
+        has_more,
+    ) = await BookmarkController.get_bookmark_notes(
+        db, user_id=1, size=size, fields=fields
+    )
+    return dumps_json(
+        {
+            "items": bookmark_notes,
+            "total": total,
+            "page": 1,
+            "size": size,
+            "pages": math.ceil(total / size),
+            "has_more": has_more,
+            "next_cursor": next_cursor,
+        }
+    )
+
+
+async def run(bookmark_count: int, size: int, runs: int) -> dict:
+    """경로별 초당 처리 페이지 수"""
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{directory}/bench.db")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+        async with AsyncSession(engine) as db:
+            db.add(
+                User(
+                    id=1,
+                    email="bench@example.com",
+                    username="bench",
+                    provider=ProviderType.GITHUB,
+                    provider_id="bench",
+                    # 아래 다중 행 INSERT는 ORM 이벤트를 거치지 않으므로 북마크 수를 직접 지정
+                    bookmark_count=bookmark_count,
+                )
+            )
+            await db.commit()
+            for start in range(0, bookmark_count, SEED_BATCH_SIZE):
+                await db.execute(
+                    insert(BookmarkNote.__table__),
+                    [
+                        {
+                            "title": f"벤치마크 북마크 {n} - 파이썬 비동기 프로그래밍 정리",
+                            "url": f"https://example.com/article/{n}",
+                            "description": "FastAPI와 SQLAlchemy로 만든 북마크 서비스의 "
+                            "목록 조회 성능을 측정하기 위한 설명 문장입니다. " * 3,
+                            "category1": "기술",
+                            "category2": "프로그래밍",
+                            "user_id": 1,
+                            "is_deleted": False,
+                        }
+                        for n in range(
+                            start, min(start + SEED_BATCH_SIZE, bookmark_count)
+                        )
+                    ],
+                )
+            await db.commit()
+
+            # 두 경로가 같은 항목을 만드는지 확인 (키 순서와 공백은 무관)
+            orm_body = json.loads(await orm_page(db, size))
+            core_body = json.loads(await core_page(db, size))
+            orm_body["next_cursor"] = core_body["next_cursor"]
+            orm_body["has_more"] = core_body["has_more"]
+            assert orm_body == core_body, "두 경로의 응답이 다릅니다"
+
+            async def summary_page(db: AsyncSession, size: int) -> bytes:
+                return await core_page(db, size, BOOKMARK_NOTE_SUMMARY_FIELDS)
+
+            throughput = {}
+            for name, page in (
+                ("orm", orm_page),
+                ("core", core_page),
+                ("summary", summary_page),
+            ):
+                # 식별 맵에 남은 객체가 ORM 경로를 유리하게 만들지 않도록 매번 비움
+                db.expunge_all()
+                started = time.perf_counter()
+                for _ in range(runs):
+                    await page(db, size)
+                    db.expunge_all()
+                throughput[name] = runs / (time.perf_counter() - started)
+
+        await engine.dispose()
+        return throughput
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="북마크 목록 조회/직렬화 벤치마크")
+    parser.add_argument("--bookmarks", type=int, default=10_000, help="저장된 북마크 수")
+    parser.add_argument("--size", type=int, default=100, help="페이지 크기")
+    parser.add_argument("--runs", type=int, default=300, help="경로별 반복 횟수")
+    args = parser.parse_args()
+
+    throughput = asyncio.run(run(args.bookmarks, args.size, args.runs))
+
+    print(
+        f"북마크 {args.bookmarks}개, 페이지 크기 {args.size}, {args.runs}회 "
+        f"(JSON: {'orjson' if orjson else '표준 json'})"
+    )
+    for name, pages_per_second in throughput.items():
+        print(
+            f"{name:>7}: {pages_per_second:8.1f} pages/s "
+            f"({pages_per_second / throughput['orm']:.2f}x)"
+        )
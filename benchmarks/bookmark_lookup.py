@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+북마크 저장 여부 일괄 조회 벤치마크
+
+임시 SQLite 데이터베이스에 북마크를 채운 뒤 BookmarkController.lookup_bookmark_ids로
+URL 목록(절반은 저장된 URL)을 반복 조회해 요청당 지연 시간 분포(p50/p99)를 출력합니다.
+
+실행: uv run python -m benchmarks.bookmark_lookup [--bookmarks N] [--urls U] [--runs R]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+os.environ.setdefault("TESTING", "1")
+
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+
+from app.configs.database import Base  # noqa: E402
+from app.controllers.bookmark_controller import BookmarkController  # noqa: E402
+from app.models import user, url, bookmark, category  # noqa: E402, F401
+from app.models.bookmark import BookmarkNote  # noqa: E402
+from app.models.user import User, ProviderType  # noqa: E402
+from app.utils.url_canonicalizer import url_hash  # noqa: E402
+
+SEED_BATCH_SIZE = 5000
+
+
+async def run(bookmark_count: int, url_count: int, runs: int) -> list:
+    """조회 한 번당 지연 시간(밀리초) 목록"""
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{directory}/bench.db"
+        )
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+        async with AsyncSession(engine) as db:
+            db.add(
+                User(
+                    id=1,
+                    email="bench@example.com",
+                    username="bench",
+                    provider=ProviderType.GITHUB,
+                    provider_id="bench",
+                )
+            )
+            await db.commit()
+            for start in range(0, bookmark_count, SEED_BATCH_SIZE):
+                urls = [
+                    f"https://example.com/article/{n}"
+                    for n in range(start, min(start + SEED_BATCH_SIZE, bookmark_count))
+                ]
+                await db.execute(
+                    insert(BookmarkNote.__table__),
+                    [
+                        {
+                            "title": seed_url,
+                            "url": seed_url,
+                            "url_hash": url_hash(seed_url),
+                            "user_id": 1,
+                            "is_deleted": False,
+                        }
+                        for seed_url in urls
+                    ],
+                )
+            await db.commit()
+
+            # 절반은 저장된 URL(추적 파라미터 포함), 절반은 저장되지 않은 URL
+            lookup_urls = [
+                f"https://example.com/article/{n * 2}?utm_source=extension"
+                if n % 2
+                else f"https://example.com/unsaved/{n}"
+                for n in range(url_count)
+            ]
+            await BookmarkController.lookup_bookmark_ids(db, 1, lookup_urls)
+
+            timings = []
+            for _ in range(runs):
+                started = time.perf_counter()
+                await BookmarkController.lookup_bookmark_ids(db, 1, lookup_urls)
+                timings.append((time.perf_counter() - started) * 1000)
+
+        await engine.dispose()
+        return timings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="북마크 저장 여부 일괄 조회 벤치마크")
+    parser.add_argument("--bookmarks", type=int, default=100_000, help="저장된 북마크 수")
+    parser.add_argument("--urls", type=int, default=500, help="조회당 URL 수")
+    parser.add_argument("--runs", type=int, default=200, help="조회 횟수")
+    args = parser.parse_args()
+
+    timings = asyncio.run(run(args.bookmarks, args.urls, args.runs))
+    percentiles = statistics.quantiles(timings, n=100)
+
+    print(f"북마크 {args.bookmarks}개, 조회당 URL {args.urls}개, {args.runs}회")
+    print(f"p50: {percentiles[49]:8.2f} ms")
+    print(f"p99: {percentiles[98]:8.2f} ms")
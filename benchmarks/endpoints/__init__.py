@@ -0,0 +1,14 @@
+"""
+엔드포인트 지연 시간 벤치마크
+
+북마크 수별로 데이터베이스를 채운 뒤 실제 ASGI 앱에 동시 요청을 보내
+엔드포인트별 p50/p95/p99 지연 시간, 처리량, 요청당 쿼리 수를 측정합니다.
+결과는 JSON 기준선으로 저장하고, 이후 실행 결과와 비교해 회귀를 표시합니다.
+
+실행: uv run python -m benchmarks.endpoints [--bookmarks N ...] [--save PATH] [--compare PATH]
+"""
+
+import os
+
+# 앱을 import하기 전에 설정 (운영 DB 테이블 생성/보강 작업자 시작 방지)
+os.environ.setdefault("TESTING", "1")
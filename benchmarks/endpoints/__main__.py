@@ -0,0 +1,179 @@
+import argparse
+import asyncio
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.caches import bookmark_list_cache
+from app.configs.database import Base
+from app.models import user, url, bookmark, category, url_metadata  # noqa: F401
+from app.utils.json_response import orjson
+from benchmarks.endpoints.baseline import (
+    compare_reports,
+    load_baseline,
+    save_baseline,
+    setting_mismatches,
+)
+from benchmarks.endpoints.runner import run_scenarios
+from benchmarks.endpoints.seed import seed_database
+
+
+async def run_size(
+    database_url: Optional[str],
+    bookmark_count: int,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+) -> dict:
+    """북마크 수 하나에 대해 새 데이터베이스를 채우고 측정"""
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(
+            database_url or f"sqlite+aiosqlite:///{directory}/bench.db"
+        )
+        async with engine.begin() as connection:
+            existing = await connection.run_sync(
+                lambda sync_connection: inspect(sync_connection).get_table_names()
+            )
+            if set(existing) & set(Base.metadata.tables):
+                raise SystemExit(
+                    "벤치마크는 테이블이 없는 빈 데이터베이스에서만 실행합니다 "
+                    f"(이미 있는 테이블: {', '.join(sorted(existing))})"
+                )
+            await connection.run_sync(Base.metadata.create_all)
+
+        try:
+            started = time.perf_counter()
+            await seed_database(engine, bookmark_count)
+            print(
+                f"북마크 {bookmark_count}개 채움 ({time.perf_counter() - started:.1f}s)",
+                file=sys.stderr,
+            )
+            return await run_scenarios(engine, requests, concurrency, warmup)
+        finally:
+            # 외부 데이터베이스도 다음 크기를 빈 상태에서 시작하도록 만든 테이블을 지움
+            async with engine.begin() as connection:
+                await connection.run_sync(Base.metadata.drop_all)
+            await engine.dispose()
+
+
+def print_results(report: dict) -> None:
+    """북마크 수/시나리오별 측정 결과 표"""
+    print(
+        f"{'bookmarks':>9} {'scenario':<14} {'p50 ms':>9} {'p95 ms':>9} "
+        f"{'p99 ms':>9} {'req/s':>9} {'queries':>8} {'errors':>6}"
+    )
+    for size, scenarios in report["results"].items():
+        for name, metrics in scenarios.items():
+            print(
+                f"{size:>9} {name:<14} {metrics['p50_ms']:9.2f} {metrics['p95_ms']:9.2f} "
+                f"{metrics['p99_ms']:9.2f} {metrics['throughput_rps']:9.1f} "
+                f"{metrics['queries_per_request']:8.2f} {metrics['errors']:6d}"
+            )
+
+
+def print_comparison(rows: List[dict]) -> None:
+    """기준선 대비 변화율 (회귀 항목 표시)"""
+    print(
+        f"\n{'bookmarks':>9} {'scenario':<14} {'metric':<20} {'baseline':>10} "
+        f"{'current':>10} {'change':>8}"
+    )
+    for row in rows:
+        print(
+            f"{row['bookmarks']:>9} {row['scenario']:<14} {row['metric']:<20} "
+            f"{row['baseline']:10.2f} {row['current']:10.2f} {row['change']:+8.1%}"
+            + ("  REGRESSION" if row["regressed"] else "")
+        )
+
+
+async def main(args) -> int:
+    # 기본값은 응답 캐시를 끄고 매 요청의 조회 경로를 측정
+    bookmark_list_cache.enabled = args.response_cache
+    database = (
+        make_url(args.database_url).get_backend_name() if args.database_url else "sqlite"
+    )
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "settings": {
+            "database": database,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+            "response_cache": args.response_cache,
+            "json": "orjson" if orjson else "json",
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": {},
+    }
+    for bookmark_count in args.bookmarks:
+        report["results"][str(bookmark_count)] = await run_size(
+            args.database_url,
+            bookmark_count,
+            args.requests,
+            args.concurrency,
+            args.warmup,
+        )
+    print_results(report)
+
+    if args.save:
+        save_baseline(args.save, report)
+        print(f"\n기준선 저장: {args.save}")
+
+    if args.compare:
+        baseline = load_baseline(args.compare)
+        mismatches = setting_mismatches(baseline, report)
+        if mismatches:
+            print(f"\n주의: 기준선과 실행 조건이 다릅니다 ({', '.join(mismatches)})")
+        rows = compare_reports(baseline, report, args.threshold)
+        print_comparison(rows)
+        regressions = [row for row in rows if row["regressed"]]
+        if regressions:
+            print(f"\n회귀 {len(regressions)}건 (허용 범위 {args.threshold:.0%})")
+            return 1
+        print(f"\n회귀 없음 (허용 범위 {args.threshold:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="엔드포인트 지연 시간 벤치마크")
+    parser.add_argument(
+        "--bookmarks",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000],
+        help="사용자별 북마크 수 (여러 개 지정 가능, 예: 10000 100000 1000000)",
+    )
+    parser.add_argument("--requests", type=int, default=500, help="시나리오별 측정 요청 수")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 클라이언트 수")
+    parser.add_argument("--warmup", type=int, default=20, help="시나리오별 워밍업 요청 수")
+    parser.add_argument(
+        "--database-url",
+        help="비어 있는 외부 데이터베이스 (예: mysql+aiomysql://user:pw@localhost/bench). "
+        "없으면 임시 SQLite 파일",
+    )
+    parser.add_argument(
+        "--response-cache",
+        action="store_true",
+        help="목록 응답 캐시를 켠 상태로 측정",
+    )
+    parser.add_argument("--save", help="결과를 저장할 JSON 기준선 경로")
+    parser.add_argument("--compare", help="비교할 JSON 기준선 경로")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="회귀로 보는 지연 시간 증가/처리량 감소 비율 (기본 0.2 = 20%%)",
+    )
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args)))
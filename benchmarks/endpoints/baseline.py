@@ -0,0 +1,71 @@
+import json
+from typing import List
+
+# 비교 기준 (지연 시간은 커질수록, 처리량은 작아질수록 나쁨)
+LATENCY_METRICS = ("p50_ms", "p95_ms", "p99_ms")
+THROUGHPUT_METRIC = "throughput_rps"
+QUERY_METRIC = "queries_per_request"
+
+# 실행 조건이 다르면 수치를 비교할 수 없는 항목
+COMPARABLE_SETTINGS = ("database", "requests", "concurrency", "response_cache")
+
+
+def save_baseline(path: str, report: dict) -> None:
+    """측정 결과를 JSON 기준선으로 저장"""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+        file.write("\n")
+
+
+def load_baseline(path: str) -> dict:
+    """저장된 JSON 기준선 읽기"""
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def compare_reports(baseline: dict, current: dict, threshold: float) -> List[dict]:
+    """
+    기준선과 현재 결과를 북마크 수/시나리오/지표별로 비교
+
+    지연 시간이 threshold 비율보다 많이 늘거나 처리량이 그만큼 줄면 회귀로 표시합니다.
+    요청당 쿼리 수는 실행 환경과 관계없이 정해지므로 조금이라도 늘면 회귀입니다.
+    양쪽에 모두 있는 북마크 수와 시나리오만 비교합니다.
+    """
+    rows = []
+    for size, scenarios in current["results"].items():
+        baseline_scenarios = baseline["results"].get(size, {})
+        for name, metrics in scenarios.items():
+            baseline_metrics = baseline_scenarios.get(name)
+            if baseline_metrics is None:
+                continue
+            for metric in (*LATENCY_METRICS, THROUGHPUT_METRIC, QUERY_METRIC):
+                before = baseline_metrics[metric]
+                after = metrics[metric]
+                change = (after - before) / before if before else 0.0
+                if metric == QUERY_METRIC:
+                    regressed = after > before
+                elif metric == THROUGHPUT_METRIC:
+                    regressed = change < -threshold
+                else:
+                    regressed = change > threshold
+                rows.append(
+                    {
+                        "bookmarks": size,
+                        "scenario": name,
+                        "metric": metric,
+                        "baseline": before,
+                        "current": after,
+                        "change": change,
+                        "regressed": regressed,
+                    }
+                )
+    return rows
+
+
+def setting_mismatches(baseline: dict, current: dict) -> List[str]:
+    """기준선과 실행 조건이 다른 항목 이름"""
+    return [
+        key
+        for key in COMPARABLE_SETTINGS
+        if baseline["settings"].get(key) != current["settings"].get(key)
+    ]
@@ -0,0 +1,178 @@
+import asyncio
+import itertools
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+import httpx
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.caches import bookmark_list_cache, token_cache, user_cache
+from app.configs.database import get_db
+from app.controllers.auth_controller import AuthController
+from app.main import app
+from app.models.user import User, ProviderType
+from benchmarks.endpoints.seed import BENCH_USER_ID, SEED_TOPICS
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """측정할 요청 하나 (요청 번호로 본문/쿼리 문자열을 만들 수 있음)"""
+
+    name: str
+    method: str
+    path: str
+    params: Optional[Callable[[int], dict]] = None
+    json: Optional[Callable[[int], dict]] = None
+
+
+# 읽기 시나리오를 먼저, 데이터를 바꾸는 생성 시나리오를 마지막에 실행
+SCENARIOS: List[Scenario] = [
+    Scenario("me", "GET", "/auth/me"),
+    Scenario("list", "GET", "/api/bookmark/", params=lambda n: {"size": 20}),
+    Scenario(
+        "list_category",
+        "GET",
+        "/api/bookmark/",
+        params=lambda n: {"size": 20, "category": "데이터베이스"},
+    ),
+    Scenario(
+        "search",
+        "GET",
+        "/api/bookmark/",
+        params=lambda n: {"size": 20, "search": SEED_TOPICS[n % len(SEED_TOPICS)]},
+    ),
+    Scenario("categories", "GET", "/api/bookmark/categories/list"),
+    Scenario("category_tree", "GET", "/api/bookmark/categories/tree"),
+    Scenario(
+        "create",
+        "POST",
+        "/api/bookmark/",
+        json=lambda n: {"url": f"https://example.com/bench/new/{n}"},
+    ),
+]
+
+
+class QueryCounter:
+    """엔진이 실행한 SQL 문 수 (executemany도 한 번으로 셈)"""
+
+    def __init__(self, engine: AsyncEngine):
+        self.count = 0
+        self._engine = engine.sync_engine
+        event.listen(self._engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args) -> None:
+        self.count += 1
+
+    def close(self) -> None:
+        event.remove(self._engine, "before_cursor_execute", self._on_execute)
+
+
+def summarize(
+    latencies: List[float], elapsed: float, errors: int, queries: int
+) -> dict:
+    """지연 시간(밀리초) 목록을 백분위/처리량 요약으로 변환"""
+    # inclusive: 표본이 적어도 관측값 범위를 벗어나지 않음
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "p50_ms": round(percentiles[49], 3),
+        "p95_ms": round(percentiles[94], 3),
+        "p99_ms": round(percentiles[98], 3),
+        "mean_ms": round(statistics.fmean(latencies), 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "queries_per_request": round(queries / len(latencies), 2),
+    }
+
+
+async def drive(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    numbers,
+    requests: int,
+    concurrency: int,
+) -> tuple:
+    """클라이언트 concurrency개가 요청 requests개를 나눠 보냄 (지연 시간 목록, 오류 수)"""
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            n = next(numbers)
+            started = time.perf_counter()
+            response = await client.request(
+                scenario.method,
+                scenario.path,
+                params=scenario.params(n) if scenario.params else None,
+                json=scenario.json(n) if scenario.json else None,
+            )
+            latencies.append((time.perf_counter() - started) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors
+
+
+async def run_scenarios(
+    engine: AsyncEngine,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+    scenarios: List[Scenario] = SCENARIOS,
+) -> Dict[str, dict]:
+    """
+    채워진 데이터베이스로 앱을 띄워 시나리오별 측정 결과를 반환
+
+    시나리오는 하나씩 차례로 실행하므로 구간 동안 센 쿼리 수를 요청 수로 나누면 요청당 쿼리 수입니다.
+    """
+    token = AuthController.create_access_token(
+        User(
+            id=BENCH_USER_ID,
+            email="bench@example.com",
+            username="bench",
+            provider=ProviderType.GITHUB,
+            provider_id="bench",
+        )
+    )
+
+    async def override_get_db():
+        async with AsyncSession(bind=engine, expire_on_commit=False) as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    token_cache.clear()
+    user_cache.clear()
+    bookmark_list_cache.clear()
+    counter = QueryCounter(engine)
+    # 생성 시나리오의 URL이 워밍업과 측정 사이에서도 겹치지 않도록 번호를 이어서 사용
+    numbers = itertools.count()
+
+    results = {}
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://bench",
+            headers={"Authorization": f"Bearer {token}"},
+        ) as client:
+            for scenario in scenarios:
+                if warmup:
+                    await drive(client, scenario, numbers, warmup, concurrency)
+                counter.count = 0
+                started = time.perf_counter()
+                latencies, errors = await drive(
+                    client, scenario, numbers, requests, concurrency
+                )
+                elapsed = time.perf_counter() - started
+                results[scenario.name] = summarize(
+                    latencies, elapsed, errors, counter.count
+                )
+    finally:
+        counter.close()
+        app.dependency_overrides.pop(get_db, None)
+    return results
@@ -0,0 +1,140 @@
+from collections import Counter
+from typing import Dict, List, Tuple
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.models.bookmark import BookmarkNote
+from app.models.category import BookmarkCategory, Category, CategoryTreeNode
+from app.models.user import User, ProviderType
+from app.utils.url_canonicalizer import url_hash
+
+BENCH_USER_ID = 1
+
+SEED_BATCH_SIZE = 5000
+
+# 북마크에 돌아가며 붙이는 카테고리 경로 (category1 > category2)
+SEED_CATEGORY_PATHS: List[Tuple[str, str]] = [
+    (category1, category2)
+    for category1, children in (
+        ("기술", ("프로그래밍", "데이터베이스", "보안", "인프라")),
+        ("학습", ("영어", "수학", "역사")),
+        ("취미", ("요리", "여행", "음악")),
+        ("경제", ("투자", "부동산")),
+    )
+    for category2 in children
+]
+
+# 제목 주제 (검색 시나리오가 전체의 일부만 찾도록 돌아가며 사용)
+SEED_TOPICS = [
+    "파이썬 비동기 프로그래밍",
+    "쿠버네티스 배포 전략",
+    "관계형 데이터베이스 인덱스",
+    "웹 보안 취약점 점검",
+    "자료구조와 알고리즘",
+    "러스트 소유권 모델",
+    "분산 시스템 합의 알고리즘",
+    "프런트엔드 성능 최적화",
+    "머신러닝 모델 서빙",
+    "리눅스 커널 스케줄러",
+]
+
+
+def seed_rows(start: int, stop: int) -> List[dict]:
+    """번호 범위의 북마크 노트 행 (id는 번호 + 1)"""
+    rows = []
+    for n in range(start, stop):
+        category1, category2 = SEED_CATEGORY_PATHS[n % len(SEED_CATEGORY_PATHS)]
+        url = f"https://example.com/article/{n}"
+        rows.append(
+            {
+                "id": n + 1,
+                "title": f"{SEED_TOPICS[n % len(SEED_TOPICS)]} 정리 {n}",
+                "url": url,
+                "url_hash": url_hash(url),
+                "description": "FastAPI와 SQLAlchemy로 만든 북마크 서비스의 "
+                "엔드포인트 지연 시간을 측정하기 위한 설명 문장입니다.",
+                "category1": category1,
+                "category2": category2,
+                "user_id": BENCH_USER_ID,
+                "is_deleted": False,
+                "change_seq": 1,
+            }
+        )
+    return rows
+
+
+async def seed_database(engine: AsyncEngine, bookmark_count: int) -> None:
+    """
+    벤치마크 사용자와 북마크를 채움 (빈 스키마 가정)
+
+    다중 행 INSERT는 ORM 이벤트를 거치지 않으므로 카테고리 연결, 카테고리 트리 카운트,
+    사용자별 북마크 수와 컬렉션 버전을 API로 만든 것과 같은 상태가 되도록 직접 채웁니다.
+    """
+    async with AsyncSession(engine) as db:
+        db.add(
+            User(
+                id=BENCH_USER_ID,
+                email="bench@example.com",
+                username="bench",
+                provider=ProviderType.GITHUB,
+                provider_id="bench",
+                bookmark_version=1,
+                bookmark_count=bookmark_count,
+            )
+        )
+        await db.commit()
+
+        names = sorted({name for path in SEED_CATEGORY_PATHS for name in path})
+        await db.execute(
+            insert(Category.__table__),
+            [{"user_id": BENCH_USER_ID, "name": name} for name in names],
+        )
+        category_ids: Dict[str, int] = dict(
+            (await db.execute(select(Category.name, Category.id))).all()
+        )
+
+        for start in range(0, bookmark_count, SEED_BATCH_SIZE):
+            rows = seed_rows(start, min(start + SEED_BATCH_SIZE, bookmark_count))
+            await db.execute(insert(BookmarkNote.__table__), rows)
+            await db.execute(
+                insert(BookmarkCategory.__table__),
+                [
+                    {
+                        "bookmark_id": row["id"],
+                        "position": position,
+                        "category_id": category_ids[row[column]],
+                    }
+                    for row in rows
+                    for column, position in (("category1", 1), ("category2", 2))
+                ],
+            )
+            await db.commit()
+
+        # 경로별 북마크 수 (상위 노드는 하위 경로 수의 합)
+        counts = Counter()
+        for index, (category1, category2) in enumerate(SEED_CATEGORY_PATHS):
+            count = len(range(index, bookmark_count, len(SEED_CATEGORY_PATHS)))
+            counts[(category1,)] += count
+            counts[(category1, category2)] += count
+        await db.execute(
+            insert(CategoryTreeNode.__table__),
+            [
+                {
+                    "user_id": BENCH_USER_ID,
+                    "category1": path[0],
+                    "category2": path[1] if len(path) > 1 else "",
+                    "category3": "",
+                    "depth": len(path),
+                    "bookmark_count": count,
+                }
+                for path, count in counts.items()
+                if count
+            ],
+        )
+        await db.commit()
+
+        seeded = await db.scalar(
+            select(func.count()).select_from(BookmarkNote.__table__)
+        )
+        assert seeded == bookmark_count, "채운 북마크 수가 다릅니다"
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+애플리케이션 import 시간(콜드 스타트) 프로파일
+
+새 인터프리터에서 `python -X importtime -c "import app.main"`을 여러 번 실행해
+모듈 import 시간의 중앙값과 가장 느린 import(자기 시간 기준), 최상위 패키지별 합계를 출력합니다.
+워커 시작과 테스트 수집은 모두 이 시간을 그대로 냅니다.
+import가 DB 연결 없이 끝나야 하므로 TESTING 환경변수 없이 실행합니다.
+
+실행: uv run python -m benchmarks.startup [--module app.main] [--runs R] [--top N] [--budget-ms MS]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass
+class ImportRecord:
+    """-X importtime 한 줄 (시간은 마이크로초)"""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """-X importtime 출력(stderr)을 모듈별 기록으로 변환 (그 외 줄은 무시)"""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # 머리글 줄
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        records.append(
+            ImportRecord(
+                module=module,
+                self_us=int(fields[0]),
+                cumulative_us=int(fields[1]),
+                depth=(len(name) - len(module) - 1) // 2,
+            )
+        )
+    return records
+
+
+def profile_once(module: str) -> Tuple[float, List[ImportRecord]]:
+    """새 인터프리터에서 모듈을 한 번 import (프로세스 전체 시간(ms), import 기록)"""
+    env = {key: value for key, value in os.environ.items() if key != "TESTING"}
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} import 실패:\n{result.stderr[-2000:]}")
+    return elapsed_ms, parse_importtime(result.stderr)
+
+
+def summarize(module: str, runs: List[List[ImportRecord]], top: int) -> dict:
+    """
+    여러 번 실행한 결과의 중앙값 요약
+
+    - import_ms: 대상 모듈의 누적 import 시간
+    - slowest: 자기 시간(하위 import 제외)이 가장 긴 모듈
+    - packages: 최상위 패키지별 자기 시간 합계
+    """
+    self_times: Dict[str, List[int]] = defaultdict(list)
+    import_us = []
+    for records in runs:
+        for record in records:
+            self_times[record.module].append(record.self_us)
+            if record.module == module:
+                import_us.append(record.cumulative_us)
+
+    median_self = {
+        name: statistics.median(values) for name, values in self_times.items()
+    }
+    packages: Dict[str, float] = defaultdict(float)
+    for name, value in median_self.items():
+        packages[name.split(".")[0]] += value
+
+    def ranked(values: Dict[str, float]) -> List[Tuple[str, float]]:
+        return [
+            (name, round(us / 1000, 1))
+            for name, us in sorted(values.items(), key=lambda item: -item[1])[:top]
+        ]
+
+    return {
+        "import_ms": round(statistics.median(import_us) / 1000, 1) if import_us else None,
+        "slowest": ranked(median_self),
+        "packages": ranked(packages),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="애플리케이션 import 시간 프로파일")
+    parser.add_argument("--module", default="app.main", help="import할 모듈")
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수 (중앙값 사용)")
+    parser.add_argument("--top", type=int, default=15, help="출력할 모듈/패키지 수")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        help="import 시간 중앙값이 이 값을 넘으면 종료 코드 1",
+    )
+    args = parser.parse_args()
+
+    # 첫 실행은 .pyc 생성/디스크 캐시 때문에 느리므로 버림
+    profile_once(args.module)
+    process_ms = []
+    runs = []
+    for _ in range(args.runs):
+        elapsed_ms, records = profile_once(args.module)
+        process_ms.append(elapsed_ms)
+        runs.append(records)
+    summary = summarize(args.module, runs, args.top)
+
+    print(
+        f"{args.module} import {summary['import_ms']}ms "
+        f"(인터프리터 포함 프로세스 {statistics.median(process_ms):.1f}ms, {args.runs}회 중앙값)"
+    )
+    print("\n가장 느린 import (자기 시간, ms)")
+    for name, ms in summary["slowest"]:
+        print(f"  {ms:>8.1f}  {name}")
+    print("\n최상위 패키지별 합계 (자기 시간, ms)")
+    for name, ms in summary["packages"]:
+        print(f"  {ms:>8.1f}  {name}")
+
+    if args.budget_ms is not None and summary["import_ms"] > args.budget_ms:
+        print(f"\nimport 시간이 예산 {args.budget_ms}ms를 넘었습니다")
+        sys.exit(1)
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+토큰 검증 마이크로벤치마크
+
+같은 토큰을 반복 검증할 때 AuthController.verify_token의 호출당 CPU 시간을
+토큰 캐시 비활성화(매번 jwt.decode)와 활성화(캐시 적중) 상태로 비교합니다.
+
+실행: uv run python -m benchmarks.verify_token [--number N] [--repeat R]
+"""
+
+import argparse
+import os
+import time
+import timeit
+
+os.environ.setdefault("TESTING", "1")
+
+from app.caches.token_cache import token_cache  # noqa: E402
+from app.controllers.auth_controller import AuthController  # noqa: E402
+from app.models import user, url, bookmark, category  # noqa: E402, F401
+from app.models.user import User, ProviderType  # noqa: E402
+
+
+def measure(token: str, enabled: bool, number: int, repeat: int) -> float:
+    """호출당 최소 CPU 시간(마이크로초)"""
+    token_cache.clear()
+    token_cache.enabled = enabled
+    AuthController.verify_token(token)  # 캐시 워밍업
+
+    timer = timeit.Timer(
+        lambda: AuthController.verify_token(token), timer=time.process_time
+    )
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1_000_000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="토큰 검증 마이크로벤치마크")
+    parser.add_argument("--number", type=int, default=20000, help="반복당 호출 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    args = parser.parse_args()
+
+    token = AuthController.create_access_token(
+        User(
+            id=1,
+            email="bench@example.com",
+            username="bench",
+            provider=ProviderType.GITHUB,
+            provider_id="bench",
+        )
+    )
+
+    before = measure(token, False, args.number, args.repeat)
+    after = measure(token, True, args.number, args.repeat)
+    token_cache.enabled = True
+
+    print(f"캐시 비활성화 (jwt.decode): {before:8.2f} µs/요청")
+    print(f"캐시 활성화   (캐시 적중):  {after:8.2f} µs/요청")
+    print(f"개선 배율: {before / after:.1f}x")
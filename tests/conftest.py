@@ -1,9 +1,15 @@
 import pytest
+import pytest_asyncio
 import asyncio
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from fastapi.testclient import TestClient
 from app.configs.database import get_db, Base
+from app.caches.user_cache import user_cache
+from app.caches.response_cache import bookmark_list_cache
+from app.metrics.query_diagnostics import query_diagnostics
 from app.models.user import User
 import os
 import tempfile
@@ -16,6 +22,7 @@ from app.main import app
 
 # 테스트용 데이터베이스 URL (SQLite 사용)
 TEST_DATABASE_URL = "sqlite:///./test.db"
+TEST_ASYNC_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 
 
 @pytest.fixture(scope="session")
@@ -37,6 +44,10 @@ def test_db():
     # 테이블 생성
     Base.metadata.create_all(bind=engine)
 
+    # 테스트마다 사용자 ID가 재사용되므로 이전 테스트의 사용자/응답 캐시를 비움
+    user_cache.clear()
+    bookmark_list_cache.clear()
+
     # 세션 생성
     TestingSessionLocal = sessionmaker(
         autocommit=False, autoflush=False, bind=engine
@@ -51,21 +62,40 @@ def test_db():
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest_asyncio.fixture(scope="function")
+async def async_test_db(test_db):
+    """테스트용 비동기 데이터베이스 세션 (test_db와 같은 SQLite 파일 사용)"""
+    engine = create_async_engine(TEST_ASYNC_DATABASE_URL, poolclass=NullPool)
+    session = AsyncSession(bind=engine, expire_on_commit=False)
+    try:
+        yield session
+    finally:
+        await session.close()
+        await engine.dispose()
+
+
 @pytest.fixture(scope="function")
 def client(test_db):
     """테스트 클라이언트"""
+    # 요청마다 앱의 이벤트 루프 안에서 비동기 세션을 연다
+    engine = create_async_engine(TEST_ASYNC_DATABASE_URL, poolclass=NullPool)
 
-    def override_get_db():
-        try:
-            yield test_db
-        finally:
-            pass
+    async def override_get_db():
+        async with AsyncSession(bind=engine, expire_on_commit=False) as session:
+            yield session
 
     app.dependency_overrides[get_db] = override_get_db
 
+    # 라우트별 쿼리 예산을 넘는 요청은 QueryBudgetExceeded로 테스트 실패
+    previous = (query_diagnostics.enabled, query_diagnostics.enforce_budgets)
+    query_diagnostics.install(engine)
+    query_diagnostics.enabled = True
+    query_diagnostics.enforce_budgets = True
+
     with TestClient(app) as test_client:
         yield test_client
 
+    query_diagnostics.enabled, query_diagnostics.enforce_budgets = previous
     app.dependency_overrides.clear()
 
 
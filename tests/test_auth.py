@@ -1,8 +1,16 @@
+import asyncio
 import pytest
+import pytest_asyncio
+import httpx
 from unittest.mock import patch, AsyncMock
 import json
+from fastapi.testclient import TestClient
+from app.main import app
+from app.configs import http_client
+from app.routers.auth import _get_github_user_info, _get_google_user_info
 from app.models.user import User, ProviderType
 from app.controllers.auth_controller import AuthController
+from app.caches.user_cache import user_cache
 
 
 class TestAuthAPI:
@@ -26,12 +34,12 @@ class TestAuthAPI:
         assert response.status_code == 200
         assert response.json() == {"status": "healthy"}
 
-    @patch("app.routers.auth.oauth.create_client")
-    def test_login_github_redirect(self, mock_create_client, client):
+    @patch("app.routers.auth.get_oauth")
+    def test_login_github_redirect(self, mock_get_oauth, client):
         """GitHub 로그인 리다이렉트 테스트"""
         # Given
         mock_client = AsyncMock()
-        mock_create_client.return_value = mock_client
+        mock_get_oauth.return_value.create_client.return_value = mock_client
         mock_client.authorize_redirect = AsyncMock(
             return_value="https://github.com/login/oauth/authorize?..."
         )
@@ -47,12 +55,12 @@ class TestAuthAPI:
             500,
         ]  # OAuth 설정 이슈로 500도 허용
 
-    @patch("app.routers.auth.oauth.create_client")
-    def test_login_google_redirect(self, mock_create_client, client):
+    @patch("app.routers.auth.get_oauth")
+    def test_login_google_redirect(self, mock_get_oauth, client):
         """Google 로그인 리다이렉트 테스트"""
         # Given
         mock_client = AsyncMock()
-        mock_create_client.return_value = mock_client
+        mock_get_oauth.return_value.create_client.return_value = mock_client
         mock_client.authorize_redirect = AsyncMock(
             return_value="https://accounts.google.com/o/oauth2/auth?..."
         )
@@ -148,6 +156,72 @@ class TestAuthAPI:
         assert data["full_name"] == "Token User"
         assert data["provider"] == "github"
 
+    def test_get_current_user_uses_user_cache(self, client, test_db):
+        """두 번째 인증 요청부터 사용자 캐시를 사용하는지 테스트"""
+        # Given
+        user = User(
+            email="cached_user@example.com",
+            username="cacheduser",
+            provider=ProviderType.GITHUB,
+            provider_id="cached123",
+        )
+        test_db.add(user)
+        test_db.commit()
+        test_db.refresh(user)
+        headers = {"Authorization": f"Bearer {AuthController.create_access_token(user)}"}
+
+        # When
+        first = client.get("/auth/me", headers=headers)
+        second = client.get("/auth/me", headers=headers)
+        bookmark = client.post(
+            "/api/bookmark/",
+            json={"url": "https://example.com/cached"},
+            headers=headers,
+        )
+
+        # Then - 캐시된 사용자로도 동일한 응답과 정상적인 쓰기 요청
+        assert first.json() == second.json()
+        assert bookmark.status_code == 200
+        assert bookmark.json()["user_id"] == user.id
+        stats = user_cache.stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+
+    def test_get_current_user_conditional_request(self, client, test_db):
+        """/auth/me가 updated_at 기준 ETag와 Last-Modified로 304를 반환하는지 테스트"""
+        # Given
+        user = User(
+            email="etag_user@example.com",
+            username="etaguser",
+            provider=ProviderType.GITHUB,
+            provider_id="etag123",
+        )
+        test_db.add(user)
+        test_db.commit()
+        test_db.refresh(user)
+        headers = {"Authorization": f"Bearer {AuthController.create_access_token(user)}"}
+
+        # When
+        first = client.get("/auth/me", headers=headers)
+        by_etag = client.get(
+            "/auth/me", headers={**headers, "If-None-Match": first.headers["etag"]}
+        )
+        by_date = client.get(
+            "/auth/me",
+            headers={**headers, "If-Modified-Since": first.headers["last-modified"]},
+        )
+        stale = client.get(
+            "/auth/me", headers={**headers, "If-None-Match": '"stale"'}
+        )
+
+        # Then
+        assert first.status_code == 200
+        assert by_etag.status_code == 304
+        assert by_date.status_code == 304
+        assert by_etag.headers["etag"] == first.headers["etag"]
+        assert stale.status_code == 200
+        assert stale.json() == first.json()
+
     def test_get_current_user_with_non_existent_user_token(
         self, client, test_db
     ):
@@ -190,3 +264,118 @@ class TestAuthAPI:
         # Then
         assert response.status_code == 401
         assert "인증 토큰이 필요합니다" in response.json()["detail"]
+
+
+class TestOAuthUserInfoClient:
+    """OAuth 사용자 정보 조회용 공유 HTTP 클라이언트 테스트 (모의 전송 계층 사용)"""
+
+    @pytest_asyncio.fixture
+    async def mock_api(self):
+        """요청 경로별 응답 함수를 등록할 수 있는 모의 외부 API"""
+        handlers = {}
+        requests = []
+
+        async def dispatch(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return await handlers[request.url.path](request)
+
+        await http_client.close_http_client()
+        await http_client.init_http_client(transport=httpx.MockTransport(dispatch))
+        try:
+            yield handlers, requests
+        finally:
+            await http_client.close_http_client()
+
+    @pytest.mark.asyncio
+    async def test_github_user_and_emails_fetched_concurrently(
+        self, mock_api, github_user_api_response, github_emails_api_response
+    ):
+        """GitHub /user와 /user/emails를 동시에 조회하는지 테스트"""
+        # Given - /user 응답은 /user/emails 요청이 도착해야만 반환 (순차 호출이면 타임아웃)
+        handlers, requests = mock_api
+        emails_requested = asyncio.Event()
+
+        async def user_handler(request):
+            await asyncio.wait_for(emails_requested.wait(), timeout=1)
+            return httpx.Response(200, json=github_user_api_response)
+
+        async def emails_handler(request):
+            emails_requested.set()
+            return httpx.Response(200, json=github_emails_api_response)
+
+        handlers["/user"] = user_handler
+        handlers["/user/emails"] = emails_handler
+
+        # When
+        user_info = await _get_github_user_info({"access_token": "gho_test_token"})
+
+        # Then
+        assert user_info.email == "test@example.com"
+        assert user_info.username == "testuser"
+        assert user_info.provider_id == "12345"
+        assert all(
+            request.headers["Authorization"] == "Bearer gho_test_token"
+            for request in requests
+        )
+
+    @pytest.mark.asyncio
+    async def test_google_user_info_retries_transient_error(
+        self, mock_api, google_user_api_response
+    ):
+        """일시적인 5xx 응답 후 재시도로 성공하는지 테스트"""
+        # Given
+        handlers, requests = mock_api
+        responses = [
+            httpx.Response(503),
+            httpx.Response(200, json=google_user_api_response),
+        ]
+
+        async def userinfo_handler(request):
+            return responses.pop(0)
+
+        handlers["/oauth2/v2/userinfo"] = userinfo_handler
+
+        # When
+        user_info = await _get_google_user_info({"access_token": "ya29.test"})
+
+        # Then
+        assert user_info.email == "test@gmail.com"
+        assert user_info.username == "Test"
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_hedged_get_uses_first_response(self, mock_api):
+        """첫 요청이 늦으면 헤징 요청의 응답을 사용하는지 테스트"""
+        # Given
+        handlers, requests = mock_api
+
+        async def slow_then_fast(request):
+            if len(requests) == 1:
+                await asyncio.sleep(5)
+                return httpx.Response(200, json={"from": "first"})
+            return httpx.Response(200, json={"from": "hedge"})
+
+        handlers["/slow"] = slow_then_fast
+
+        # When
+        response = await asyncio.wait_for(
+            http_client.hedged_get("https://api.example.com/slow", hedge_delay=0.05),
+            timeout=1,
+        )
+
+        # Then
+        assert response.json() == {"from": "hedge"}
+        assert len(requests) == 2
+
+    def test_shared_client_managed_by_lifespan(self, test_db):
+        """애플리케이션 시작/종료에 맞춰 공유 클라이언트가 생성/종료되는지 테스트"""
+        # When
+        with TestClient(app):
+            shared_client = http_client.get_http_client()
+            is_same = http_client.get_http_client() is shared_client
+
+        # Then
+        assert is_same
+        assert shared_client.is_closed
+        with pytest.raises(RuntimeError):
+            http_client.get_http_client()
@@ -1,14 +1,18 @@
+from datetime import datetime, timedelta
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 from app.main import app
 
 # 모든 모델을 import (SQLAlchemy 관계 설정을 위해)
 from app.models import user, url, bookmark
 from app.models.bookmark import BookmarkNote
+from app.schemas.bookmark import BookmarkNoteListResponse
 from app.models.user import User, ProviderType
 from app.controllers.auth_controller import AuthController
-from app.schemas.user import OAuthUserInfo
+from app.caches.response_cache import bookmark_list_cache
 from tests.conftest import test_db
 
 
@@ -18,14 +22,17 @@ class TestBookmarkAPI:
     @pytest.fixture
     def test_user(self, test_db: Session):
         """테스트용 사용자 생성"""
-        user_data = OAuthUserInfo(
+        user = User(
             email="bookmark_test@example.com",
             username="bookmark_user",
             full_name="Bookmark Test User",
             provider=ProviderType.GITHUB,
             provider_id="bookmark123",
+            is_verified=True,
         )
-        user = AuthController.create_user(test_db, user_data)
+        test_db.add(user)
+        test_db.commit()
+        test_db.refresh(user)
         return user
 
     @pytest.fixture
@@ -58,6 +65,93 @@ class TestBookmarkAPI:
         assert data["user_id"] is not None
         assert data["created_at"] is not None
 
+    def test_create_bookmark_note_duplicate_returns_existing(
+        self, client, test_db: Session, auth_headers: dict
+    ):
+        """정규화 URL이 같은 북마크는 새로 만들지 않고 기존 노트 반환 테스트"""
+        # Given
+        first = client.post(
+            "/api/bookmark/",
+            json={"url": "https://example.com/article"},
+            headers=auth_headers,
+        ).json()
+
+        # When - 추적 파라미터, 대소문자, 끝 슬래시만 다른 URL
+        second = client.post(
+            "/api/bookmark/",
+            json={"url": "https://Example.com/article/?utm_source=newsletter"},
+            headers=auth_headers,
+        )
+
+        # Then
+        assert second.status_code == 200
+        assert second.json()["id"] == first["id"]
+        assert test_db.query(BookmarkNote).count() == 1
+
+    def test_create_bookmark_note_after_delete(self, client, auth_headers: dict):
+        """삭제한 북마크와 같은 URL은 새로 저장되는지 테스트"""
+        # Given
+        data = {"url": "https://youtu.be/dQw4w9WgXcQ"}
+        first = client.post("/api/bookmark/", json=data, headers=auth_headers).json()
+        client.delete(f"/api/bookmark/{first['id']}", headers=auth_headers)
+
+        # When
+        second = client.post(
+            "/api/bookmark/",
+            json={"url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42"},
+            headers=auth_headers,
+        ).json()
+
+        # Then
+        assert second["id"] != first["id"]
+
+    def test_lookup_bookmarks(self, client, test_db: Session, auth_headers: dict):
+        """URL 목록의 저장 여부를 정규화 URL 기준으로 한 번에 조회하는 테스트"""
+        # Given
+        saved = client.post(
+            "/api/bookmark/",
+            json={"url": "https://example.com/saved"},
+            headers=auth_headers,
+        ).json()
+        deleted = client.post(
+            "/api/bookmark/",
+            json={"url": "https://example.com/deleted"},
+            headers=auth_headers,
+        ).json()
+        client.delete(f"/api/bookmark/{deleted['id']}", headers=auth_headers)
+        urls = [
+            "https://example.com/saved",
+            "https://EXAMPLE.com/saved/?utm_source=extension",
+            "https://example.com/deleted",
+            "https://example.com/unsaved",
+            "not a url",
+        ]
+
+        # When
+        response = client.post(
+            "/api/bookmark/lookup", json={"urls": urls}, headers=auth_headers
+        )
+
+        # Then
+        assert response.status_code == 200
+        assert response.json()["results"] == {
+            "https://example.com/saved": saved["id"],
+            "https://EXAMPLE.com/saved/?utm_source=extension": saved["id"],
+            "https://example.com/deleted": None,
+            "https://example.com/unsaved": None,
+            "not a url": None,
+        }
+
+    def test_lookup_bookmarks_too_many_urls(self, client, auth_headers: dict):
+        """조회 URL 수 제한 초과 시 422 테스트"""
+        urls = [f"https://example.com/{n}" for n in range(5001)]
+
+        response = client.post(
+            "/api/bookmark/lookup", json={"urls": urls}, headers=auth_headers
+        )
+
+        assert response.status_code == 422
+
     def test_create_bookmark_note_unauthorized(
         self, client, sample_bookmark_data: dict
     ):
@@ -114,6 +208,112 @@ class TestBookmarkAPI:
         data = response.json()
         assert len(data["items"]) == 2
         assert data["total"] == 2
+        # Core 조회 결과를 바로 직렬화해도 응답 스키마와 같은 형식
+        assert (
+            BookmarkNoteListResponse.model_validate(data).model_dump(mode="json")
+            == data
+        )
+
+    def test_get_bookmark_notes_fields(
+        self, client, test_db: Session, test_user: User, auth_headers: dict
+    ):
+        """기본 요약 필드와 fields로 고른 컬럼만 조회/응답하는지 테스트"""
+        test_db.add_all(
+            BookmarkNote(
+                title=f"필드 {i}",
+                url=f"https://example.com/fields/{i}",
+                description="목록에서는 보이지 않는 긴 설명 " * 20,
+                user_id=test_user.id,
+            )
+            for i in range(3)
+        )
+        test_db.commit()
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if "FROM bookmark_notes" in statement:
+                statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", capture)
+        try:
+            summary = client.get("/api/bookmark/", headers=auth_headers)
+        finally:
+            event.remove(Engine, "before_cursor_execute", capture)
+        full = client.get(
+            "/api/bookmark/?fields=description,title,id,url,category1,category2,"
+            "category3,canonical_url,user_id,created_at,updated_at,deleted_at",
+            headers=auth_headers,
+        )
+        titles = client.get(
+            "/api/bookmark/?size=2&fields=title", headers=auth_headers
+        ).json()
+
+        # 기본 응답은 description을 읽지도 보내지도 않음
+        assert "description" not in summary.json()["items"][0]
+        assert not any("description" in statement for statement in statements)
+        assert full.json()["items"][0]["description"].startswith("목록에서는")
+        assert len(summary.content) < len(full.content) / 2
+        # 지정한 필드와 id만 포함, 커서는 그대로 동작
+        assert [set(item) for item in titles["items"]] == [{"id", "title"}] * 2
+        rest = client.get(
+            f"/api/bookmark/?size=2&fields=title&cursor={titles['next_cursor']}",
+            headers=auth_headers,
+        ).json()
+        assert [item["title"] for item in rest["items"]] == ["필드 0"]
+
+    def test_get_bookmark_notes_unknown_field(self, client, auth_headers: dict):
+        """알 수 없는 필드 지정 시 400 테스트"""
+        response = client.get(
+            "/api/bookmark/?fields=title,password", headers=auth_headers
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "알 수 없는 필드입니다: password"
+
+    def test_get_bookmark_notes_total_modes(
+        self, client, test_db: Session, test_user: User, auth_headers: dict
+    ):
+        """필터 없는 total은 사용자별 북마크 수, include_total=false는 COUNT 없이 has_more만 반환"""
+        bookmark_ids = [
+            client.post(
+                "/api/bookmark/",
+                json={"url": f"https://example.com/total/{i}"},
+                headers=auth_headers,
+            ).json()["id"]
+            for i in range(3)
+        ]
+        client.put(
+            f"/api/bookmark/{bookmark_ids[0]}/categories",
+            json={"category1": "기술"},
+            headers=auth_headers,
+        )
+        client.delete(f"/api/bookmark/{bookmark_ids[1]}", headers=auth_headers)
+        test_db.expire_all()
+        assert test_db.get(User, test_user.id).bookmark_count == 2
+
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", capture)
+        try:
+            unfiltered = client.get("/api/bookmark/?size=1", headers=auth_headers)
+            filtered = client.get(
+                "/api/bookmark/?size=1&category=기술&include_total=false",
+                headers=auth_headers,
+            )
+        finally:
+            event.remove(Engine, "before_cursor_execute", capture)
+
+        assert unfiltered.json()["total"] == 2
+        assert unfiltered.json()["pages"] == 2
+        assert unfiltered.json()["has_more"] is True
+        assert filtered.json()["total"] is None
+        assert filtered.json()["pages"] is None
+        assert filtered.json()["has_more"] is False
+        assert [item["id"] for item in filtered.json()["items"]] == [bookmark_ids[0]]
+        assert not any("count(" in statement.lower() for statement in statements)
 
     def test_get_bookmark_notes_pagination(
         self, client, test_db: Session, test_user: User, auth_headers: dict
@@ -142,6 +342,100 @@ class TestBookmarkAPI:
         assert data["size"] == 2
         assert data["pages"] == 3  # 실제 응답 필드명
 
+    def test_get_bookmark_notes_cursor_pagination(
+        self, client, test_db: Session, test_user: User, auth_headers: dict
+    ):
+        """커서(키셋) 페이지네이션 테스트"""
+        # 같은 시각에 생성된 5개의 테스트 데이터 (id로 순서 보장)
+        for i in range(5):
+            bookmark = BookmarkNote(
+                title=f"커서 북마크 {i+1}",
+                url=f"https://example.com/cursor/{i+1}",
+                user_id=test_user.id,
+            )
+            test_db.add(bookmark)
+        test_db.commit()
+
+        # 첫 페이지는 기존 방식으로 조회하고 next_cursor로 이어서 조회
+        response = client.get("/api/bookmark/?size=2", headers=auth_headers)
+        data = response.json()
+        collected_ids = [item["id"] for item in data["items"]]
+        assert data["next_cursor"] is not None
+
+        while data["next_cursor"]:
+            response = client.get(
+                "/api/bookmark/",
+                params={"size": 2, "cursor": data["next_cursor"]},
+                headers=auth_headers,
+            )
+            assert response.status_code == 200
+            data = response.json()
+            collected_ids.extend(item["id"] for item in data["items"])
+
+        # 중복/누락 없이 최신순(id 내림차순)으로 모두 조회되어야 함
+        assert len(collected_ids) == 5
+        assert collected_ids == sorted(collected_ids, reverse=True)
+
+    @pytest.mark.parametrize("stored_format", ["fractional", "whole_second"])
+    def test_get_bookmark_notes_cursor_across_same_second(
+        self,
+        client,
+        test_db: Session,
+        test_user: User,
+        auth_headers: dict,
+        stored_format: str,
+    ):
+        """같은 정각(초 단위) created_at을 가진 여러 행을 커서로 넘길 때 중복/누락이 없는지 테스트"""
+        # 직접 넣은 값은 '.000000'까지, CURRENT_TIMESTAMP 기본값은 소수 초 없이 저장됨
+        tied_at = datetime(2024, 1, 1, 12, 0, 0)
+        created_times = [tied_at + timedelta(seconds=1)] + [tied_at] * 5 + [
+            tied_at - timedelta(seconds=1)
+        ]
+        bookmarks = [
+            BookmarkNote(
+                title=f"정각 북마크 {i}",
+                url=f"https://example.com/same-second/{i}",
+                user_id=test_user.id,
+                created_at=created_at,
+            )
+            for i, created_at in enumerate(created_times)
+        ]
+        test_db.add_all(bookmarks)
+        test_db.commit()
+        if stored_format == "whole_second":
+            test_db.execute(
+                text(
+                    "UPDATE bookmark_notes SET created_at = "
+                    "substr(created_at, 1, 19) WHERE user_id = :user_id"
+                ),
+                {"user_id": test_user.id},
+            )
+            test_db.commit()
+
+        collected_ids = []
+        params = {"size": 2}
+        while True:
+            response = client.get("/api/bookmark/", params=params, headers=auth_headers)
+            assert response.status_code == 200
+            data = response.json()
+            collected_ids.extend(item["id"] for item in data["items"])
+            if not data["next_cursor"]:
+                break
+            params = {"size": 2, "cursor": data["next_cursor"]}
+
+        # 최신 → 같은 시각 5개(id 내림차순) → 가장 오래된 순서로 한 번씩
+        tied_ids = sorted((bookmark.id for bookmark in bookmarks[1:6]), reverse=True)
+        assert collected_ids == [bookmarks[0].id, *tied_ids, bookmarks[6].id]
+
+    def test_get_bookmark_notes_invalid_cursor(self, client, auth_headers: dict):
+        """잘못된 커서로 조회 시 400 반환 테스트"""
+        response = client.get(
+            "/api/bookmark/?cursor=not-a-cursor", headers=auth_headers
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "유효하지 않은 커서입니다"
+
     def test_get_bookmark_notes_category_filter(
         self, client, test_db: Session, test_user: User, auth_headers: dict
     ):
@@ -171,6 +465,152 @@ class TestBookmarkAPI:
         assert len(data["items"]) == 1
         assert data["items"][0]["category1"] == "기술"
 
+    def test_get_bookmark_notes_category_filter_partial_match(
+        self, client, test_db: Session, test_user: User, auth_headers: dict
+    ):
+        """카테고리 필터는 이름 일부와 대소문자가 달라도 일치 (category1~3 모두)"""
+        test_db.add_all(
+            [
+                BookmarkNote(
+                    title="FastAPI 문서",
+                    url="https://example.com/fastapi",
+                    category1="Backend",
+                    category2="FastAPI",
+                    user_id=test_user.id,
+                ),
+                BookmarkNote(
+                    title="Django 문서",
+                    url="https://example.com/django",
+                    category1="Backend",
+                    category3="fastapi-compare",
+                    user_id=test_user.id,
+                ),
+                BookmarkNote(
+                    title="디자인 북마크",
+                    url="https://example.com/design",
+                    category1="디자인",
+                    user_id=test_user.id,
+                ),
+            ]
+        )
+        test_db.commit()
+
+        fastapi = client.get("/api/bookmark/?category=fastapi", headers=auth_headers)
+        backend = client.get("/api/bookmark/?category=END", headers=auth_headers)
+
+        assert {item["url"] for item in fastapi.json()["items"]} == {
+            "https://example.com/fastapi",
+            "https://example.com/django",
+        }
+        assert fastapi.json()["total"] == 2
+        # 같은 북마크가 여러 카테고리에 일치해도 한 번만 반환
+        assert backend.json()["total"] == 2
+
+    def test_get_bookmark_notes_search(
+        self, client, test_db: Session, test_user: User, auth_headers: dict
+    ):
+        """제목/설명 전문 검색 테스트"""
+        bookmarks = [
+            BookmarkNote(
+                title="파이썬 비동기 프로그래밍",
+                url="https://example.com/async",
+                user_id=test_user.id,
+            ),
+            BookmarkNote(
+                title="요리 레시피",
+                url="https://example.com/recipe",
+                description="비동기 처리와는 무관한 김치찌개 만들기",
+                user_id=test_user.id,
+            ),
+            BookmarkNote(
+                title="여행 기록",
+                url="https://example.com/travel",
+                user_id=test_user.id,
+            ),
+        ]
+        test_db.add_all(bookmarks)
+        test_db.commit()
+
+        # 전문 검색 (제목 또는 설명)
+        response = client.get(
+            "/api/bookmark/?search=비동기", headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        assert {item["url"] for item in data["items"]} == {
+            "https://example.com/async",
+            "https://example.com/recipe",
+        }
+
+        # 짧은 검색어도 검색되어야 함
+        response = client.get("/api/bookmark/?search=여행", headers=auth_headers)
+        assert response.json()["total"] == 1
+
+    def test_get_bookmark_notes_search_after_update(
+        self, client, test_db: Session, test_user: User, auth_headers: dict
+    ):
+        """제목 변경 후 검색 색인이 갱신되는지 테스트"""
+        bookmark = BookmarkNote(
+            title="변경 전 제목입니다",
+            url="https://example.com/rename",
+            user_id=test_user.id,
+        )
+        test_db.add(bookmark)
+        test_db.commit()
+
+        bookmark.title = "새로운 제목입니다"
+        test_db.commit()
+
+        old = client.get("/api/bookmark/?search=변경 전", headers=auth_headers)
+        new = client.get("/api/bookmark/?search=새로운 제목", headers=auth_headers)
+        assert old.json()["total"] == 0
+        assert new.json()["total"] == 1
+
+    def test_get_bookmark_notes_search_relevance_sort(
+        self, client, test_db: Session, test_user: User, auth_headers: dict
+    ):
+        """관련도순 정렬 테스트"""
+        # 나중에 생성된 북마크가 관련도는 더 낮음
+        test_db.add(
+            BookmarkNote(
+                title="FastAPI FastAPI 튜토리얼",
+                url="https://example.com/fastapi-twice",
+                description="FastAPI 입문",
+                user_id=test_user.id,
+            )
+        )
+        test_db.commit()
+        test_db.add(
+            BookmarkNote(
+                title="웹 프레임워크 비교",
+                url="https://example.com/frameworks",
+                description="Django, Flask, FastAPI",
+                user_id=test_user.id,
+            )
+        )
+        test_db.commit()
+
+        response = client.get(
+            "/api/bookmark/?search=FastAPI&sort=relevance", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        assert data["items"][0]["url"] == "https://example.com/fastapi-twice"
+
+    def test_get_bookmark_notes_relevance_sort_with_cursor(
+        self, client, auth_headers: dict
+    ):
+        """관련도순 정렬에서 커서 사용 시 400 반환 테스트"""
+        response = client.get(
+            "/api/bookmark/?search=FastAPI&sort=relevance&cursor=abc",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 400
+
     def test_get_bookmark_note_by_id(
         self, client, test_db: Session, test_user: User, auth_headers: dict
     ):
@@ -230,6 +670,40 @@ class TestBookmarkAPI:
         assert data["category2"] == "새로운 카테고리2"
         assert data["category3"] == "새로운 카테고리3"
 
+    def test_update_bookmark_categories_reflected_in_filter(
+        self, client, test_db: Session, test_user: User, auth_headers: dict
+    ):
+        """카테고리 변경이 필터링과 카테고리 목록에 반영되는지 테스트"""
+        bookmark = BookmarkNote(
+            title="카테고리 변경 테스트",
+            url="https://example.com/recategorize",
+            category1="기존 카테고리",
+            user_id=test_user.id,
+        )
+        test_db.add(bookmark)
+        test_db.commit()
+        test_db.refresh(bookmark)
+
+        client.put(
+            f"/api/bookmark/{bookmark.id}/categories",
+            json={"category1": "새 카테고리", "category2": "하위 카테고리"},
+            headers=auth_headers,
+        )
+
+        old_filter = client.get(
+            "/api/bookmark/?category=기존 카테고리", headers=auth_headers
+        )
+        new_filter = client.get(
+            "/api/bookmark/?category=하위 카테고리", headers=auth_headers
+        )
+        categories = client.get(
+            "/api/bookmark/categories/list", headers=auth_headers
+        ).json()
+
+        assert old_filter.json()["total"] == 0
+        assert new_filter.json()["total"] == 1
+        assert categories == ["새 카테고리", "하위 카테고리"]
+
     def test_delete_bookmark_note(
         self, client, test_db: Session, test_user: User, auth_headers: dict
     ):
@@ -298,16 +772,279 @@ class TestBookmarkAPI:
         # 중복 제거 확인
         assert categories.count("프로그래밍") == 1
 
+    def test_get_category_tree(self, client, auth_headers: dict):
+        """카테고리 트리 증분 갱신 테스트 (생성/카테고리 변경/삭제)"""
+        bookmark_ids = [
+            client.post(
+                "/api/bookmark/",
+                json={"url": f"https://example.com/tree-{index}"},
+                headers=auth_headers,
+            ).json()["id"]
+            for index in range(3)
+        ]
+        category_updates = [
+            {"category1": "기술", "category2": "프로그래밍", "category3": "Python"},
+            {"category1": "기술", "category2": "프로그래밍"},
+            {"category1": "디자인"},
+        ]
+        for bookmark_id, category_data in zip(bookmark_ids, category_updates):
+            client.put(
+                f"/api/bookmark/{bookmark_id}/categories",
+                json=category_data,
+                headers=auth_headers,
+            )
+
+        response = client.get("/api/bookmark/categories/tree", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {
+                "name": "기술",
+                "bookmark_count": 2,
+                "children": [
+                    {
+                        "name": "프로그래밍",
+                        "bookmark_count": 2,
+                        "children": [
+                            {"name": "Python", "bookmark_count": 1, "children": []}
+                        ],
+                    }
+                ],
+            },
+            {"name": "디자인", "bookmark_count": 1, "children": []},
+        ]
+
+        # 카테고리 이동과 삭제가 카운트에 반영되고 빈 노드는 사라짐
+        # (지정하지 않은 하위 카테고리는 유지되므로 Python 노드도 함께 이동)
+        client.put(
+            f"/api/bookmark/{bookmark_ids[0]}/categories",
+            json={"category1": "디자인"},
+            headers=auth_headers,
+        )
+        client.delete(f"/api/bookmark/{bookmark_ids[2]}", headers=auth_headers)
+
+        tree = client.get("/api/bookmark/categories/tree", headers=auth_headers).json()
+
+        assert tree == [
+            {
+                "name": "기술",
+                "bookmark_count": 1,
+                "children": [
+                    {"name": "프로그래밍", "bookmark_count": 1, "children": []}
+                ],
+            },
+            {
+                "name": "디자인",
+                "bookmark_count": 1,
+                "children": [
+                    {
+                        "name": "프로그래밍",
+                        "bookmark_count": 1,
+                        "children": [
+                            {"name": "Python", "bookmark_count": 1, "children": []}
+                        ],
+                    }
+                ],
+            },
+        ]
+
+    def test_conditional_get_returns_not_modified(
+        self, client, test_db: Session, test_user: User, auth_headers: dict
+    ):
+        """ETag가 같으면 북마크 테이블을 읽지 않고 304 반환 테스트"""
+        test_db.add(
+            BookmarkNote(
+                title="조건부 요청",
+                url="https://example.com/etag",
+                category1="기술",
+                user_id=test_user.id,
+            )
+        )
+        test_db.commit()
+
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        for path in (
+            "/api/bookmark/",
+            "/api/bookmark/categories/list",
+            "/api/bookmark/categories/tree",
+        ):
+            first = client.get(path, headers=auth_headers)
+            etag = first.headers["etag"]
+            assert first.status_code == 200
+            assert first.headers["cache-control"] == "private, no-cache"
+
+            statements.clear()
+            event.listen(Engine, "before_cursor_execute", capture)
+            try:
+                second = client.get(
+                    path, headers={**auth_headers, "If-None-Match": etag}
+                )
+            finally:
+                event.remove(Engine, "before_cursor_execute", capture)
+
+            assert second.status_code == 304
+            assert second.headers["etag"] == etag
+            assert second.content == b""
+            assert not any("bookmark_notes" in statement for statement in statements)
+            assert not any("categories" in statement for statement in statements)
+
+        # 쿼리 문자열이 다르면 다른 응답이므로 ETag도 다름
+        page = client.get("/api/bookmark/?size=5", headers=auth_headers)
+        assert page.headers["etag"] != client.get(
+            "/api/bookmark/", headers=auth_headers
+        ).headers["etag"]
+
+    def test_conditional_get_invalidated_by_writes(
+        self, client, auth_headers: dict
+    ):
+        """생성/카테고리 변경/삭제 후에는 이전 ETag로 304가 나오지 않는지 테스트"""
+
+        def list_etag():
+            response = client.get("/api/bookmark/", headers=auth_headers)
+            assert response.status_code == 200
+            return response.headers["etag"]
+
+        etags = [list_etag()]
+        bookmark_id = client.post(
+            "/api/bookmark/",
+            json={"url": "https://example.com/versioned"},
+            headers=auth_headers,
+        ).json()["id"]
+        etags.append(list_etag())
+        client.put(
+            f"/api/bookmark/{bookmark_id}/categories",
+            json={"category1": "기술"},
+            headers=auth_headers,
+        )
+        etags.append(list_etag())
+        client.delete(f"/api/bookmark/{bookmark_id}", headers=auth_headers)
+        etags.append(list_etag())
+
+        assert len(set(etags)) == 4
+        stale = client.get(
+            "/api/bookmark/", headers={**auth_headers, "If-None-Match": etags[0]}
+        )
+        assert stale.status_code == 200
+        assert stale.json()["total"] == 0
+
+    def test_get_changes_since_cursor(self, client, auth_headers: dict):
+        """변경 피드가 커서 이후의 생성/카테고리 변경/삭제만 반환하는지 테스트"""
+        bookmark_ids = [
+            client.post(
+                "/api/bookmark/",
+                json={"url": f"https://example.com/sync/{i}"},
+                headers=auth_headers,
+            ).json()["id"]
+            for i in range(3)
+        ]
+
+        # 첫 동기화는 limit 단위로 나누어 받음
+        first = client.get("/api/bookmark/changes?limit=2", headers=auth_headers)
+        assert first.status_code == 200
+        first = first.json()
+        assert [item["id"] for item in first["items"]] == bookmark_ids[:2]
+        assert first["has_more"] is True
+        rest = client.get(
+            f"/api/bookmark/changes?since={first['next_cursor']}&limit=2",
+            headers=auth_headers,
+        ).json()
+        assert [item["id"] for item in rest["items"]] == bookmark_ids[2:]
+        assert rest["has_more"] is False
+
+        # 바뀐 것이 없으면 빈 목록과 같은 커서
+        cursor = rest["next_cursor"]
+        unchanged = client.get(
+            f"/api/bookmark/changes?since={cursor}", headers=auth_headers
+        ).json()
+        assert unchanged == {"items": [], "next_cursor": cursor, "has_more": False}
+
+        # 카테고리 변경과 삭제는 바뀐 순서대로, 삭제는 삭제 기록으로 전달
+        client.put(
+            f"/api/bookmark/{bookmark_ids[2]}/categories",
+            json={"category1": "기술"},
+            headers=auth_headers,
+        )
+        client.delete(f"/api/bookmark/{bookmark_ids[0]}", headers=auth_headers)
+        changes = client.get(
+            f"/api/bookmark/changes?since={cursor}", headers=auth_headers
+        ).json()
+        assert [
+            (item["id"], item["is_deleted"], item["category1"])
+            for item in changes["items"]
+        ] == [(bookmark_ids[2], False, "기술"), (bookmark_ids[0], True, None)]
+        assert changes["items"][1]["deleted_at"] is not None
+
+        # 처음부터 동기화하는 클라이언트에는 삭제 기록을 보내지 않음
+        initial = client.get("/api/bookmark/changes", headers=auth_headers).json()
+        assert sorted(item["id"] for item in initial["items"]) == bookmark_ids[1:]
+
+    def test_get_changes_invalid_cursor(self, client, auth_headers: dict):
+        """잘못된 변경 피드 커서 테스트"""
+        response = client.get(
+            "/api/bookmark/changes?since=not-a-cursor", headers=auth_headers
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "유효하지 않은 커서입니다"
+
+    def test_list_response_cache(self, client, auth_headers: dict):
+        """같은 조건의 목록은 응답 캐시에서 반환하고 쓰기 후에는 새로 조회하는지 테스트"""
+        client.post(
+            "/api/bookmark/",
+            json={"url": "https://example.com/cached-list"},
+            headers=auth_headers,
+        )
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        # 빈 검색어와 검색어 없는 정렬 조건은 같은 키로 정규화
+        first = client.get("/api/bookmark/?size=5", headers=auth_headers)
+        event.listen(Engine, "before_cursor_execute", capture)
+        try:
+            second = client.get(
+                "/api/bookmark/?size=5&search=&sort=relevance", headers=auth_headers
+            )
+        finally:
+            event.remove(Engine, "before_cursor_execute", capture)
+
+        assert second.status_code == 200
+        assert second.json() == first.json()
+        assert second.headers["etag"] != first.headers["etag"]
+        assert not any("bookmark_notes" in statement for statement in statements)
+        assert bookmark_list_cache.stats()["hits"] == 1
+
+        # 쓰기로 컬렉션 버전이 바뀌면 이전 응답을 쓰지 않음
+        client.post(
+            "/api/bookmark/",
+            json={"url": "https://example.com/cached-list-2"},
+            headers=auth_headers,
+        )
+        third = client.get("/api/bookmark/?size=5", headers=auth_headers)
+        assert third.json()["total"] == 2
+        assert bookmark_list_cache.stats()["hits"] == 1
+
+        stats = client.get("/health/caches").json()
+        assert stats["bookmark_list"]["hits"] == 1
+        assert stats["bookmark_list"]["misses"] == 2
+
     def test_user_isolation(self, client, test_db: Session, auth_headers: dict):
         """사용자별 데이터 격리 테스트"""
         # 다른 사용자 생성
-        other_user_data = OAuthUserInfo(
+        other_user = User(
             email="other@example.com",
             username="other_user",
             provider=ProviderType.GOOGLE,
             provider_id="other123",
         )
-        other_user = AuthController.create_user(test_db, other_user_data)
+        test_db.add(other_user)
+        test_db.commit()
+        test_db.refresh(other_user)
 
         # 다른 사용자의 북마크 생성
         other_bookmark = BookmarkNote(
@@ -0,0 +1,142 @@
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy.orm import Session
+from app.controllers import bookmark_export_controller
+from app.controllers.auth_controller import AuthController
+from app.models.bookmark import BookmarkNote
+from app.models.user import User, ProviderType
+
+
+class TestBookmarkExportAPI:
+    """북마크 내보내기 API 테스트"""
+
+    @pytest.fixture
+    def test_user(self, test_db: Session):
+        user = User(
+            email="export@example.com",
+            username="exportuser",
+            provider=ProviderType.GITHUB,
+            provider_id="export123",
+        )
+        test_db.add(user)
+        test_db.commit()
+        test_db.refresh(user)
+        return user
+
+    @pytest.fixture
+    def auth_headers(self, test_user: User):
+        token = AuthController.create_access_token(test_user)
+        return {"Authorization": f"Bearer {token}"}
+
+    @pytest.fixture
+    def bookmarks(self, test_db: Session, test_user: User):
+        """오래된 순으로 북마크 5개 (마지막은 삭제됨) + 다른 사용자 북마크 1개"""
+        other_user = User(
+            email="other@example.com",
+            username="otheruser",
+            provider=ProviderType.GOOGLE,
+            provider_id="other123",
+        )
+        test_db.add(other_user)
+        test_db.commit()
+
+        base_time = datetime(2024, 1, 1)
+        notes = [
+            BookmarkNote(
+                title=f"북마크 {n}, \"따옴표\"",
+                url=f"https://example.com/{n}",
+                category1="개발" if n % 2 else None,
+                user_id=test_user.id,
+                is_deleted=n == 4,
+                created_at=base_time + timedelta(minutes=n),
+            )
+            for n in range(5)
+        ]
+        notes.append(
+            BookmarkNote(
+                title="다른 사용자",
+                url="https://example.com/other",
+                user_id=other_user.id,
+                created_at=base_time,
+            )
+        )
+        test_db.add_all(notes)
+        test_db.commit()
+        return notes[:4]
+
+    def test_export_ndjson(self, client, auth_headers: dict, bookmarks):
+        """NDJSON 내보내기 테스트 (삭제된 북마크와 다른 사용자 북마크 제외, 오래된 순)"""
+        # When
+        response = client.get("/api/bookmark/export", headers=auth_headers)
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert "bookmarks.ndjson" in response.headers["content-disposition"]
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["id"] for row in rows] == [bookmark.id for bookmark in bookmarks]
+        assert rows[1]["title"] == '북마크 1, "따옴표"'
+        assert rows[1]["category1"] == "개발"
+        assert rows[0]["category1"] is None
+        assert rows[0]["created_at"] == "2024-01-01T00:00:00"
+
+    def test_export_csv(self, client, auth_headers: dict, bookmarks):
+        """CSV 내보내기 테스트 (헤더 행, 쉼표/따옴표 이스케이프)"""
+        # When
+        response = client.get(
+            "/api/bookmark/export", params={"format": "csv"}, headers=auth_headers
+        )
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert list(rows[0].keys()) == list(bookmark_export_controller.EXPORT_COLUMNS)
+        assert [row["url"] for row in rows] == [
+            bookmark.url for bookmark in bookmarks
+        ]
+        assert rows[3]["title"] == '북마크 3, "따옴표"'
+
+    def test_export_gzip_across_batches(
+        self, client, auth_headers: dict, bookmarks, monkeypatch
+    ):
+        """gzip 압축 전송과 여러 배치에 걸친 스트리밍 테스트"""
+        # Given - 배치 하나에 북마크 하나씩
+        monkeypatch.setattr(bookmark_export_controller, "EXPORT_BATCH_SIZE", 1)
+
+        # When
+        with client.stream(
+            "GET",
+            "/api/bookmark/export",
+            params={"gzip": "true"},
+            headers=auth_headers,
+        ) as response:
+            assert response.headers["content-encoding"] == "gzip"
+            body = b"".join(response.iter_raw())
+
+        # Then
+        lines = gzip.decompress(body).decode().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [
+            bookmark.id for bookmark in bookmarks
+        ]
+
+    def test_export_empty(self, client, auth_headers: dict):
+        """북마크가 없으면 CSV 헤더만 반환 테스트"""
+        response = client.get(
+            "/api/bookmark/export", params={"format": "csv"}, headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert response.text.splitlines() == [
+            ",".join(bookmark_export_controller.EXPORT_COLUMNS)
+        ]
+
+    def test_export_requires_auth(self, client):
+        """인증 없이 내보내기 요청 시 401 테스트"""
+        response = client.get("/api/bookmark/export")
+
+        assert response.status_code == 401
@@ -0,0 +1,429 @@
+import io
+import json
+from datetime import datetime
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+from app.controllers import bookmark_import_controller
+from app.controllers.auth_controller import AuthController
+from app.controllers.bookmark_controller import BookmarkController
+from app.controllers.bookmark_import_controller import BookmarkImportController
+from app.models.bookmark import BookmarkNote
+from app.models.url_metadata import UrlMetadata, UrlFetchStatus
+from app.models.user import User, ProviderType
+from app.schemas.bookmark import BookmarkImportFormat
+from app.utils.url_canonicalizer import url_hash
+
+CHROME_BOOKMARKS_HTML = """<!DOCTYPE NETSCAPE-Bookmark-file-1>
+<META HTTP-EQUIV="Content-Type" CONTENT="text/html; charset=UTF-8">
+<TITLE>Bookmarks</TITLE>
+<H1>Bookmarks</H1>
+<DL><p>
+    <DT><H3 ADD_DATE="1700000000">개발</H3>
+    <DL><p>
+        <DT><A HREF="https://fastapi.tiangolo.com/" ADD_DATE="1700000001">FastAPI &amp; 문서</A>
+        <DT><A HREF="https://docs.sqlalchemy.org/" ADD_DATE="1700000002">SQLAlchemy</A>
+        <DT><A HREF="http://insecure.example.com/" ADD_DATE="1700000003">HTTP 링크</A>
+        <DT><A HREF="https://fastapi.tiangolo.com/" ADD_DATE="1700000004">중복</A>
+        <DT><A HREF="https://existing.example.com/" ADD_DATE="1700000005">기존</A>
+    </DL><p>
+</DL><p>
+"""
+
+POCKET_CSV = """title,url,time_added,tags,status
+"Python, 3.12 릴리스",https://www.python.org/downloads/,1700000000,python,unread
+,https://example.com/untitled,1700000001,,archive
+잘못된 URL,not-a-url,1700000002,,unread
+"""
+
+
+class TestBookmarkImportAPI:
+    """북마크 가져오기 API 테스트"""
+
+    @pytest.fixture
+    def test_user(self, test_db: Session):
+        user = User(
+            email="import@example.com",
+            username="importuser",
+            provider=ProviderType.GITHUB,
+            provider_id="import123",
+        )
+        test_db.add(user)
+        test_db.commit()
+        test_db.refresh(user)
+        return user
+
+    @pytest.fixture
+    def auth_headers(self, test_user: User):
+        token = AuthController.create_access_token(test_user)
+        return {"Authorization": f"Bearer {token}"}
+
+    def _upload(self, client, auth_headers, filename, content, **params):
+        return client.post(
+            "/api/bookmark/import",
+            params=params,
+            files={"file": (filename, content.encode(), "application/octet-stream")},
+            headers=auth_headers,
+        )
+
+    def test_import_chrome_bookmarks_html(
+        self, client, test_db: Session, test_user: User, auth_headers: dict
+    ):
+        """Chrome 북마크 HTML 가져오기 테스트 (검증, 파일 내 중복, 기존 북마크 중복)"""
+        # Given
+        existing = BookmarkNote(
+            title="기존", url="https://existing.example.com/", user_id=test_user.id
+        )
+        test_db.add(existing)
+        test_db.commit()
+
+        # When
+        response = self._upload(
+            client, auth_headers, "bookmarks.html", CHROME_BOOKMARKS_HTML
+        )
+
+        # Then
+        assert response.status_code == 200
+        data = response.json()
+        assert data["format"] == "html"
+        assert data["summary"] == {
+            "total": 5,
+            "created": 2,
+            "duplicates": 2,
+            "invalid": 1,
+            "enrichment_skipped": 0,
+        }
+        statuses = [(item["url"], item["status"]) for item in data["items"]]
+        assert statuses == [
+            ("https://fastapi.tiangolo.com/", "created"),
+            ("https://docs.sqlalchemy.org/", "created"),
+            ("http://insecure.example.com/", "invalid"),
+            ("https://fastapi.tiangolo.com/", "duplicate"),
+            ("https://existing.example.com/", "duplicate"),
+        ]
+        assert data["items"][3]["bookmark_id"] == data["items"][0]["bookmark_id"]
+        assert data["items"][4]["bookmark_id"] == existing.id
+        assert data["items"][2]["error"] == "HTTPS URL만 허용됩니다"
+        # 다중 행 INSERT도 사용자별 북마크 수에 반영 (기존 1 + 생성 2)
+        listed = client.get("/api/bookmark/", headers=auth_headers).json()
+        assert listed["total"] == 3
+
+        created = client.get(
+            f"/api/bookmark/{data['items'][0]['bookmark_id']}", headers=auth_headers
+        ).json()
+        assert created["title"] == "FastAPI & 문서"
+
+    def test_import_pocket_csv(self, client, auth_headers: dict):
+        """Pocket CSV 가져오기 테스트 (제목 없는 항목은 임시 제목)"""
+        # When
+        response = self._upload(client, auth_headers, "pocket.csv", POCKET_CSV)
+
+        # Then
+        data = response.json()
+        assert data["format"] == "pocket_csv"
+        assert data["summary"]["created"] == 2
+        assert data["summary"]["invalid"] == 1
+        untitled = client.get(
+            f"/api/bookmark/{data['items'][1]['bookmark_id']}", headers=auth_headers
+        ).json()
+        assert untitled["title"].startswith("북마크 -")
+
+    def test_import_takeout_json_in_small_reads(
+        self, client, auth_headers: dict, monkeypatch
+    ):
+        """Takeout 시청 기록 JSON을 작은 조각으로 나눠 읽어도 항목을 모두 찾는지 테스트"""
+        # Given
+        monkeypatch.setattr(bookmark_import_controller, "IMPORT_READ_SIZE", 7)
+        history = [
+            {
+                "header": "YouTube",
+                "title": f"Watched 영상 {n}",
+                "titleUrl": f"https://www.youtube.com/watch?v=video{n}",
+                "time": "2024-01-01T00:00:00.000Z",
+            }
+            for n in range(3)
+        ] + [{"header": "YouTube", "title": "Watched a video that has been removed"}]
+
+        # When
+        response = self._upload(
+            client,
+            auth_headers,
+            "watch-history.json",
+            json.dumps(history, ensure_ascii=False, indent=2),
+        )
+
+        # Then
+        data = response.json()
+        assert data["format"] == "takeout_json"
+        assert data["summary"] == {
+            "total": 4,
+            "created": 3,
+            "duplicates": 0,
+            "invalid": 1,
+            "enrichment_skipped": 0,
+        }
+        first = client.get(
+            f"/api/bookmark/{data['items'][0]['bookmark_id']}", headers=auth_headers
+        ).json()
+        assert first["title"] == "영상 0"
+
+    def test_import_dedupes_canonical_urls(
+        self, client, test_db: Session, test_user: User, auth_headers: dict
+    ):
+        """정규화 URL이 같은 항목은 기존 북마크와 파일 안 모두에서 중복 처리 테스트"""
+        # Given
+        existing = BookmarkNote(
+            title="기존", url="https://existing.example.com/post", user_id=test_user.id
+        )
+        test_db.add(existing)
+        test_db.commit()
+        html = """<DL><p>
+        <DT><A HREF="https://existing.example.com/post/?utm_source=rss">기존</A>
+        <DT><A HREF="https://youtu.be/abc123">영상</A>
+        <DT><A HREF="https://www.youtube.com/watch?v=abc123&t=10">같은 영상</A>
+        </DL><p>"""
+
+        # When
+        response = self._upload(client, auth_headers, "bookmarks.html", html)
+
+        # Then
+        items = response.json()["items"]
+        assert [item["status"] for item in items] == [
+            "duplicate",
+            "created",
+            "duplicate",
+        ]
+        assert items[0]["bookmark_id"] == existing.id
+        assert items[2]["bookmark_id"] == items[1]["bookmark_id"]
+
+    def test_import_uses_shared_metadata(
+        self, client, test_db: Session, auth_headers: dict
+    ):
+        """제목 없는 항목은 공유 메타데이터가 있으면 그 제목으로 바로 채우는지 테스트"""
+        # Given
+        metadata = UrlMetadata(
+            url_hash=url_hash("https://example.com/untitled"),
+            url="https://example.com/untitled",
+            title="공유 제목",
+            fetch_status=UrlFetchStatus.OK,
+            fetched_at=datetime.utcnow(),
+        )
+        test_db.add(metadata)
+        test_db.commit()
+
+        # When
+        response = self._upload(client, auth_headers, "pocket.csv", POCKET_CSV)
+
+        # Then
+        bookmark_id = response.json()["items"][1]["bookmark_id"]
+        bookmark = test_db.get(BookmarkNote, bookmark_id)
+        assert bookmark.title == "공유 제목"
+        assert bookmark.url_metadata_id == metadata.id
+
+    def test_import_malformed_json(self, client, auth_headers: dict):
+        """깨진 JSON 파일은 400 반환 테스트"""
+        response = self._upload(
+            client, auth_headers, "watch-history.json", '[{"titleUrl": "https://a'
+        )
+
+        assert response.status_code == 400
+
+    def test_import_requires_auth(self, client):
+        """인증 없이 가져오기 요청 시 401 테스트"""
+        response = self._upload(client, {}, "bookmarks.html", CHROME_BOOKMARKS_HTML)
+
+        assert response.status_code == 401
+
+
+class TestBookmarkImportController:
+    """북마크 가져오기 컨트롤러 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_large_import_uses_chunked_multi_row_inserts(
+        self, async_test_db, monkeypatch
+    ):
+        """대량 가져오기가 청크별 INSERT 한 번씩으로 처리되는지 테스트"""
+        # Given
+        user = User(
+            email="bulk@example.com",
+            username="bulkuser",
+            provider=ProviderType.GITHUB,
+            provider_id="bulk123",
+        )
+        async_test_db.add(user)
+        await async_test_db.commit()
+        monkeypatch.setattr(bookmark_import_controller, "IMPORT_CHUNK_SIZE", 400)
+        links = "".join(
+            f'<DT><A HREF="https://example.com/bulk/{n}">링크 {n}</A>\n'
+            for n in range(1000)
+        )
+        inserts = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT INTO bookmark_notes"):
+                inserts.append(executemany)
+
+        sync_engine = async_test_db.bind.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", capture)
+
+        # When
+        try:
+            result = await BookmarkImportController.import_bookmarks(
+                async_test_db,
+                user.id,
+                io.BytesIO(f"<DL><p>\n{links}</DL>".encode()),
+                BookmarkImportFormat.AUTO,
+            )
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", capture)
+
+        # Then - 1000건을 400/400/200 세 번의 다중 행 INSERT로 저장
+        assert result["summary"]["created"] == 1000
+        assert inserts == [False, False, False]
+        assert await async_test_db.scalar(
+            select(func.count()).select_from(BookmarkNote)
+        ) == 1000
+
+    @pytest.mark.asyncio
+    async def test_parse_error_after_first_chunk_writes_nothing(
+        self, async_test_db, monkeypatch
+    ):
+        """첫 청크 이후에 파일이 깨져 있어도 400이면 아무것도 저장하지 않음"""
+        # Given - 청크 크기보다 많은 항목 뒤에 잘린 JSON
+        user = User(
+            email="partial@example.com",
+            username="partialuser",
+            provider=ProviderType.GITHUB,
+            provider_id="partial123",
+        )
+        async_test_db.add(user)
+        await async_test_db.commit()
+        monkeypatch.setattr(bookmark_import_controller, "IMPORT_CHUNK_SIZE", 10)
+        entries = ",".join(
+            json.dumps(
+                {
+                    "title": f"Watched 영상 {n}",
+                    "titleUrl": f"https://youtube.com/watch?v={n}",
+                }
+            )
+            for n in range(25)
+        )
+        truncated = f'[{entries}, {{"titleUrl": "https://youtube.com/watch?v=broken'
+
+        # When
+        with pytest.raises(HTTPException) as error:
+            await BookmarkImportController.import_bookmarks(
+                async_test_db,
+                user.id,
+                io.BytesIO(truncated.encode()),
+                BookmarkImportFormat.AUTO,
+            )
+
+        # Then
+        assert error.value.status_code == 400
+        assert await async_test_db.scalar(
+            select(func.count()).select_from(BookmarkNote)
+        ) == 0
+        await async_test_db.refresh(user)
+        assert user.bookmark_count == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_create_in_later_chunk_is_reported_as_duplicate(
+        self, async_test_db, monkeypatch
+    ):
+        """다른 요청이 같은 URL을 먼저 저장해 충돌하면 그 청크만 다시 저장하고 중복으로 표시"""
+        # Given - 두 번째 청크를 저장하기 직전에 같은 URL이 먼저 커밋됨
+        user = User(
+            email="race@example.com",
+            username="raceuser",
+            provider=ProviderType.GITHUB,
+            provider_id="race123",
+        )
+        async_test_db.add(user)
+        await async_test_db.commit()
+        monkeypatch.setattr(bookmark_import_controller, "IMPORT_CHUNK_SIZE", 3)
+        insert_bookmark_rows = BookmarkController.insert_bookmark_rows
+        calls = []
+
+        async def insert_after_concurrent_create(db, user_id, rows):
+            calls.append(len(rows))
+            if len(calls) == 2:
+                await db.rollback()
+                db.add(
+                    BookmarkNote(
+                        title="먼저 저장", url="https://example.com/race/4", user_id=user_id
+                    )
+                )
+                await db.commit()
+            return await insert_bookmark_rows(db, user_id, rows)
+
+        monkeypatch.setattr(
+            BookmarkController, "insert_bookmark_rows", insert_after_concurrent_create
+        )
+        csv_rows = "".join(f"링크 {n},https://example.com/race/{n},,,\n" for n in range(6))
+
+        # When
+        result = await BookmarkImportController.import_bookmarks(
+            async_test_db,
+            user.id,
+            io.BytesIO(f"title,url,time_added,tags,status\n{csv_rows}".encode()),
+            BookmarkImportFormat.POCKET_CSV,
+        )
+
+        # Then - 앞 청크는 그대로, 충돌한 청크는 먼저 저장된 항목만 중복
+        assert calls == [3, 3, 2]
+        assert result["summary"]["created"] == 5
+        assert result["summary"]["duplicates"] == 1
+        duplicate = result["items"][4]
+        assert duplicate["status"] == "duplicate"
+        assert duplicate["bookmark_id"] is not None
+        assert await async_test_db.scalar(
+            select(func.count()).select_from(BookmarkNote)
+        ) == 6
+        await async_test_db.refresh(user)
+        assert user.bookmark_count == 6
+
+    @pytest.mark.asyncio
+    async def test_reports_items_not_queued_for_enrichment(
+        self, async_test_db, monkeypatch
+    ):
+        """보강 대기열이 가득 차면 더 넣지 않고 넣지 못한 항목 수를 요약에 반영"""
+        # Given - 대기열에 3개만 들어가는 작업자
+        user = User(
+            email="queue@example.com",
+            username="queueuser",
+            provider=ProviderType.GITHUB,
+            provider_id="queue123",
+        )
+        async_test_db.add(user)
+        await async_test_db.commit()
+        queued = []
+        calls = []
+
+        class FullQueueWorker:
+            def enqueue(self, bookmark_id, url):
+                calls.append(bookmark_id)
+                if len(queued) >= 3:
+                    return False
+                queued.append(bookmark_id)
+                return True
+
+        monkeypatch.setattr(
+            bookmark_import_controller, "bookmark_enrichment_worker", FullQueueWorker()
+        )
+        csv_rows = "".join(f",https://example.com/untitled/{n},,,\n" for n in range(10))
+
+        # When
+        result = await BookmarkImportController.import_bookmarks(
+            async_test_db,
+            user.id,
+            io.BytesIO(f"title,url,time_added,tags,status\n{csv_rows}".encode()),
+            BookmarkImportFormat.POCKET_CSV,
+        )
+
+        # Then - 첫 실패 후에는 더 넣지 않음
+        assert result["summary"]["created"] == 10
+        assert result["summary"]["enrichment_skipped"] == 7
+        assert len(queued) == 3
+        assert len(calls) == 4
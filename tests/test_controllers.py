@@ -1,16 +1,41 @@
 import pytest
+import pytest_asyncio
+import threading
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from jose import jwt
+from sqlalchemy import select
+from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
 from app.controllers.auth_controller import AuthController
+from app.caches.response_cache import (
+    InMemorySharedClient,
+    LocalResponseCacheBackend,
+    ResponseCache,
+    SharedResponseCacheBackend,
+)
+from app.caches.token_cache import TokenCache, token_cache
+from app.caches.user_cache import user_cache
+from app.controllers.bookmark_controller import BookmarkController
+from app.controllers.bookmark_search_controller import BookmarkSearchController
+from app.controllers.category_tree_controller import CategoryTreeController
+from app.models.bookmark import BookmarkNote
+from app.models.category import CategoryTreeNode
 from app.models.user import User, ProviderType
 from app.schemas.user import OAuthUserInfo
+from app.utils.url_canonicalizer import url_hash
 from app.configs.oauth import JWT_SECRET_KEY, JWT_ALGORITHM
+from app.scripts import rebuild_category_tree
+from tests.conftest import TEST_ASYNC_DATABASE_URL
 
 
 class TestAuthController:
     """인증 컨트롤러 테스트"""
 
-    def test_get_user_by_email_existing_user(self, test_db):
+    @pytest.mark.asyncio
+    async def test_get_user_by_email_existing_user(self, async_test_db):
         """이메일로 기존 사용자 조회 테스트"""
         # Given
         user = User(
@@ -19,12 +44,12 @@ class TestAuthController:
             provider=ProviderType.GITHUB,
             provider_id="123",
         )
-        test_db.add(user)
-        test_db.commit()
+        async_test_db.add(user)
+        await async_test_db.commit()
 
         # When
-        found_user = AuthController.get_user_by_email(
-            test_db, "existing@example.com"
+        found_user = await AuthController.get_user_by_email(
+            async_test_db, "existing@example.com"
         )
 
         # Then
@@ -32,17 +57,19 @@ class TestAuthController:
         assert found_user.email == "existing@example.com"
         assert found_user.username == "existinguser"
 
-    def test_get_user_by_email_non_existing_user(self, test_db):
+    @pytest.mark.asyncio
+    async def test_get_user_by_email_non_existing_user(self, async_test_db):
         """이메일로 존재하지 않는 사용자 조회 테스트"""
         # When
-        found_user = AuthController.get_user_by_email(
-            test_db, "nonexistent@example.com"
+        found_user = await AuthController.get_user_by_email(
+            async_test_db, "nonexistent@example.com"
         )
 
         # Then
         assert found_user is None
 
-    def test_get_user_by_provider_existing_user(self, test_db):
+    @pytest.mark.asyncio
+    async def test_get_user_by_provider_existing_user(self, async_test_db):
         """OAuth 제공자로 기존 사용자 조회 테스트"""
         # Given
         user = User(
@@ -51,12 +78,12 @@ class TestAuthController:
             provider=ProviderType.GITHUB,
             provider_id="github123",
         )
-        test_db.add(user)
-        test_db.commit()
+        async_test_db.add(user)
+        await async_test_db.commit()
 
         # When
-        found_user = AuthController.get_user_by_provider(
-            test_db, ProviderType.GITHUB, "github123"
+        found_user = await AuthController.get_user_by_provider(
+            async_test_db, ProviderType.GITHUB, "github123"
         )
 
         # Then
@@ -64,17 +91,19 @@ class TestAuthController:
         assert found_user.provider == ProviderType.GITHUB
         assert found_user.provider_id == "github123"
 
-    def test_get_user_by_provider_non_existing_user(self, test_db):
+    @pytest.mark.asyncio
+    async def test_get_user_by_provider_non_existing_user(self, async_test_db):
         """OAuth 제공자로 존재하지 않는 사용자 조회 테스트"""
         # When
-        found_user = AuthController.get_user_by_provider(
-            test_db, ProviderType.GITHUB, "nonexistent123"
+        found_user = await AuthController.get_user_by_provider(
+            async_test_db, ProviderType.GITHUB, "nonexistent123"
         )
 
         # Then
         assert found_user is None
 
-    def test_create_user(self, test_db):
+    @pytest.mark.asyncio
+    async def test_create_user(self, async_test_db):
         """새 사용자 생성 테스트"""
         # Given
         oauth_user = OAuthUserInfo(
@@ -87,7 +116,9 @@ class TestAuthController:
         )
 
         # When
-        created_user = AuthController.create_user(test_db, oauth_user)
+        created_user = await AuthController.create_user(
+            async_test_db, oauth_user
+        )
 
         # Then
         assert created_user.id is not None
@@ -99,7 +130,8 @@ class TestAuthController:
         assert created_user.provider_id == "new123"
         assert created_user.is_verified is True  # OAuth 사용자는 기본 인증됨
 
-    def test_update_last_login(self, test_db):
+    @pytest.mark.asyncio
+    async def test_update_last_login(self, async_test_db):
         """마지막 로그인 시간 업데이트 테스트"""
         # Given
         user = User(
@@ -108,21 +140,24 @@ class TestAuthController:
             provider=ProviderType.GITHUB,
             provider_id="login123",
         )
-        test_db.add(user)
-        test_db.commit()
-        test_db.refresh(user)
+        async_test_db.add(user)
+        await async_test_db.commit()
+        await async_test_db.refresh(user)
 
         initial_login_time = user.last_login_at
 
         # When
-        updated_user = AuthController.update_last_login(test_db, user)
+        updated_user = await AuthController.update_last_login(
+            async_test_db, user
+        )
 
         # Then
         assert updated_user.last_login_at is not None
         assert updated_user.last_login_at != initial_login_time
         assert isinstance(updated_user.last_login_at, datetime)
 
-    def test_create_access_token(self, test_db):
+    @pytest.mark.asyncio
+    async def test_create_access_token(self, async_test_db):
         """JWT 액세스 토큰 생성 테스트"""
         # Given
         user = User(
@@ -132,9 +167,9 @@ class TestAuthController:
             provider=ProviderType.GITHUB,
             provider_id="token123",
         )
-        test_db.add(user)
-        test_db.commit()
-        test_db.refresh(user)
+        async_test_db.add(user)
+        await async_test_db.commit()
+        await async_test_db.refresh(user)
 
         # When
         token = AuthController.create_access_token(user)
@@ -149,7 +184,8 @@ class TestAuthController:
         assert payload["email"] == user.email
         assert "exp" in payload
 
-    def test_verify_valid_token(self, test_db):
+    @pytest.mark.asyncio
+    async def test_verify_valid_token(self, async_test_db):
         """유효한 JWT 토큰 검증 테스트"""
         # Given
         user = User(
@@ -159,9 +195,9 @@ class TestAuthController:
             provider=ProviderType.GITHUB,
             provider_id="verify123",
         )
-        test_db.add(user)
-        test_db.commit()
-        test_db.refresh(user)
+        async_test_db.add(user)
+        await async_test_db.commit()
+        await async_test_db.refresh(user)
 
         token = AuthController.create_access_token(user)
 
@@ -202,7 +238,8 @@ class TestAuthController:
         # Then
         assert payload is None
 
-    def test_get_or_create_user_existing_user(self, test_db):
+    @pytest.mark.asyncio
+    async def test_get_or_create_user_existing_user(self, async_test_db):
         """기존 사용자 조회 또는 생성 테스트 - 기존 사용자"""
         # Given
         existing_user = User(
@@ -213,9 +250,9 @@ class TestAuthController:
             provider=ProviderType.GITHUB,
             provider_id="existing123",
         )
-        test_db.add(existing_user)
-        test_db.commit()
-        test_db.refresh(existing_user)
+        async_test_db.add(existing_user)
+        await async_test_db.commit()
+        await async_test_db.refresh(existing_user)
 
         oauth_user = OAuthUserInfo(
             email="existing@example.com",
@@ -227,14 +264,17 @@ class TestAuthController:
         )
 
         # When
-        user = AuthController.get_or_create_user(test_db, oauth_user)
+        user = await AuthController.get_or_create_user(
+            async_test_db, oauth_user
+        )
 
         # Then
         assert user.id == existing_user.id
         assert user.full_name == "Updated Name"  # 업데이트됨
         assert user.avatar_url == "https://new-avatar.com"  # 업데이트됨
 
-    def test_get_or_create_user_new_user(self, test_db):
+    @pytest.mark.asyncio
+    async def test_get_or_create_user_new_user(self, async_test_db):
         """기존 사용자 조회 또는 생성 테스트 - 새 사용자"""
         # Given
         oauth_user = OAuthUserInfo(
@@ -247,7 +287,9 @@ class TestAuthController:
         )
 
         # When
-        user = AuthController.get_or_create_user(test_db, oauth_user)
+        user = await AuthController.get_or_create_user(
+            async_test_db, oauth_user
+        )
 
         # Then
         assert user.id is not None
@@ -256,3 +298,471 @@ class TestAuthController:
         assert user.provider == ProviderType.GOOGLE
         assert user.provider_id == "new123"
         assert user.is_verified is True
+
+
+class TestAuthenticatedUserCache:
+    """인증 사용자 캐시 테스트"""
+
+    @pytest_asyncio.fixture
+    async def cached_user(self, async_test_db):
+        """DB에 저장하고 캐시에 올린 사용자"""
+        user = User(
+            email="cache@example.com",
+            username="cacheuser",
+            full_name="Before",
+            provider=ProviderType.GITHUB,
+            provider_id="cache123",
+        )
+        async_test_db.add(user)
+        await async_test_db.commit()
+        await AuthController.get_authenticated_user(async_test_db, user.id)
+        return user
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_returns_session_bound_user(
+        self, async_test_db, cached_user
+    ):
+        """캐시 적중 시 SELECT 없이 세션에 연결된 사용자 반환 테스트"""
+        # Given
+        async_test_db.expunge_all()
+
+        # When
+        user = await AuthController.get_authenticated_user(
+            async_test_db, cached_user.id
+        )
+
+        # Then
+        assert user.email == "cache@example.com"
+        assert user in async_test_db
+        assert user_cache.stats()["hits"] == 1
+        assert user_cache.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_or_create_user_invalidates_cache(
+        self, async_test_db, cached_user
+    ):
+        """사용자 정보 갱신 시 캐시 무효화 테스트"""
+        # When
+        await AuthController.get_or_create_user(
+            async_test_db,
+            OAuthUserInfo(
+                email="cache@example.com",
+                username="cacheuser",
+                full_name="After",
+                provider=ProviderType.GITHUB,
+                provider_id="cache123",
+            ),
+        )
+        async_test_db.expunge_all()
+        user = await AuthController.get_authenticated_user(
+            async_test_db, cached_user.id
+        )
+
+        # Then
+        assert user.full_name == "After"
+        assert user_cache.stats()["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_update_last_login_invalidates_cache(
+        self, async_test_db, cached_user
+    ):
+        """마지막 로그인 시간 갱신 시 캐시 무효화 테스트"""
+        # When
+        await AuthController.update_last_login(async_test_db, cached_user)
+
+        # Then
+        assert user_cache.stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_expires_and_evicts(self, async_test_db, cached_user):
+        """TTL 만료와 최대 크기 초과 시 제거 테스트"""
+        # Given
+        original_ttl, original_max_size = user_cache.ttl_seconds, user_cache.max_size
+        try:
+            # When - TTL이 지난 항목은 실패로 처리
+            user_cache.ttl_seconds = 0
+            user_cache.set_user(cached_user)
+            expired = await user_cache.get_user(async_test_db, cached_user.id)
+
+            # When - 최대 크기를 넘으면 가장 오래된 항목부터 제거
+            user_cache.ttl_seconds = 60
+            user_cache.max_size = 1
+            user_cache.set_user(cached_user)
+            other_user = User(
+                id=cached_user.id + 1,
+                email="other-cache@example.com",
+                username="othercache",
+                provider=ProviderType.GOOGLE,
+                provider_id="other-cache",
+            )
+            user_cache.set_user(other_user)
+            evicted = await user_cache.get_user(async_test_db, cached_user.id)
+        finally:
+            user_cache.ttl_seconds = original_ttl
+            user_cache.max_size = original_max_size
+
+        # Then
+        assert expired is None
+        assert evicted is None
+        assert user_cache.stats()["size"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_queries(self, async_test_db, cached_user):
+        """캐시 비활성화 시 항상 DB 조회 테스트"""
+        user_cache.enabled = False
+        try:
+            user = await AuthController.get_authenticated_user(
+                async_test_db, cached_user.id
+            )
+            stats = user_cache.stats()
+        finally:
+            user_cache.enabled = True
+
+        assert user.id == cached_user.id
+        assert stats["enabled"] is False
+        assert stats["hits"] == 0
+
+
+class TestTokenCache:
+    """검증 토큰 캐시 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def clear_token_cache(self):
+        token_cache.clear()
+        yield
+        token_cache.clear()
+
+    def _encode(self, **claims) -> str:
+        return jwt.encode(
+            {"sub": "1", **claims}, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM
+        )
+
+    def test_verify_token_uses_cache(self):
+        """같은 토큰의 두 번째 검증부터 캐시 적중 테스트"""
+        # Given
+        token = self._encode(exp=int(time.time()) + 60)
+
+        # When
+        first = AuthController.verify_token(token)
+        first["sub"] = "변경"  # 반환값 수정이 캐시에 영향을 주지 않아야 함
+        second = AuthController.verify_token(token)
+
+        # Then
+        assert second["sub"] == "1"
+        assert token_cache.stats()["hits"] == 1
+        assert token_cache.stats()["misses"] == 1
+
+    def test_cached_token_expires_at_exp(self):
+        """exp 시각이 지나면 캐시 항목도 제거되고 만료 토큰으로 처리되는지 테스트"""
+        # Given - 캐시에 저장된 뒤 exp가 지난 상황
+        token = self._encode(exp=int(time.time()) + 60)
+        payload = AuthController.verify_token(token)
+        token_cache.set_payload(token, {**payload, "exp": time.time() - 1})
+
+        # When
+        result = AuthController.verify_token(token)
+
+        # Then - 캐시 만료 후 jwt.decode 결과를 그대로 사용
+        assert result == payload
+        assert token_cache.stats()["hits"] == 0
+
+    def test_invalid_tokens_are_not_cached(self):
+        """검증 실패 토큰과 exp 없는 토큰은 캐시하지 않는지 테스트"""
+        # Given
+        expired_token = self._encode(exp=int(time.time()) - 1)
+        forged_token = jwt.encode(
+            {"sub": "1", "exp": int(time.time()) + 60},
+            "wrong-secret",
+            algorithm=JWT_ALGORITHM,
+        )
+        no_exp_token = self._encode()
+
+        # When
+        for token in (expired_token, forged_token, no_exp_token):
+            AuthController.verify_token(token)
+
+        # Then
+        assert AuthController.verify_token(forged_token) is None
+        assert token_cache.stats()["size"] == 0
+
+    def test_bounded_under_concurrent_access(self):
+        """여러 스레드에서 동시에 사용해도 최대 크기를 넘지 않는지 테스트"""
+        # Given
+        cache = TokenCache(max_size=50)
+        exp = time.time() + 60
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(500):
+                    token = f"token-{offset}-{i}"
+                    cache.set_payload(token, {"sub": token, "exp": exp})
+                    payload = cache.get_payload(token)
+                    assert payload is None or payload["sub"] == token
+            except Exception as e:
+                errors.append(e)
+
+        # When
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Then
+        assert errors == []
+        assert cache.stats()["size"] == 50
+
+
+class TestResponseCache:
+    """응답 캐시 저장소 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_local_backend_counts_hits_and_evicts(self):
+        """프로세스 안 LRU 저장소의 적중률 집계와 최대 크기 테스트"""
+        # Given
+        cache = ResponseCache(LocalResponseCacheBackend(max_size=2), ttl_seconds=60)
+        keys = [cache.make_key("list", 1, 0, [page]) for page in range(3)]
+
+        # When
+        for key in keys:
+            await cache.set(key, key.encode())
+        values = [await cache.get(key) for key in keys]
+
+        # Then - 가장 오래된 항목이 제거됨
+        assert values == [None, keys[1].encode(), keys[2].encode()]
+        assert cache.stats()["hits"] == 2
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hit_ratio"] == pytest.approx(2 / 3)
+
+    @pytest.mark.asyncio
+    async def test_shared_backend_is_visible_across_workers(self):
+        """공유 저장소는 다른 워커가 저장한 응답도 적중하는지 테스트"""
+        # Given - 같은 저장소를 쓰는 두 워커
+        store = InMemorySharedClient()
+        worker_a = ResponseCache(SharedResponseCacheBackend(store), ttl_seconds=60)
+        worker_b = ResponseCache(SharedResponseCacheBackend(store), ttl_seconds=60)
+        key = ResponseCache.make_key("list", 1, 3, [1, 20, None])
+
+        # When
+        await worker_a.set(key, b"{}")
+
+        # Then - 세대가 바뀐 키는 적중하지 않음
+        assert await worker_b.get(key) == b"{}"
+        assert await worker_b.get(ResponseCache.make_key("list", 1, 4, [1, 20, None])) is None
+        assert worker_b.stats()["backend"] == "SharedResponseCacheBackend"
+
+    @pytest.mark.asyncio
+    async def test_shared_backend_expires_entries(self):
+        """공유 저장소 항목의 TTL 만료 테스트"""
+        # Given
+        now = [0.0]
+        store = InMemorySharedClient(clock=lambda: now[0])
+        cache = ResponseCache(SharedResponseCacheBackend(store), ttl_seconds=0.5)
+        await cache.set("key", b"value")
+
+        # When - 1초 단위로 올림한 TTL이 지난 뒤
+        now[0] = 1.0
+
+        # Then
+        assert await cache.get("key") is None
+
+
+class TestCategoryTreeController:
+    """카테고리 트리 컨트롤러 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_rebuild_category_tree(self, async_test_db):
+        """증분 갱신을 거치지 않은 데이터로 트리 재구성 테스트"""
+        # Given
+        user = User(
+            email="tree@example.com",
+            username="treeuser",
+            provider=ProviderType.GITHUB,
+            provider_id="tree123",
+        )
+        async_test_db.add(user)
+        await async_test_db.commit()
+
+        async_test_db.add_all(
+            [
+                BookmarkNote(
+                    title="A",
+                    url="https://example.com/a",
+                    user_id=user.id,
+                    category1="기술",
+                    category2="백엔드",
+                ),
+                BookmarkNote(
+                    title="B",
+                    url="https://example.com/b",
+                    user_id=user.id,
+                    category1="기술",
+                    category3="FastAPI",
+                ),
+                BookmarkNote(
+                    title="C",
+                    url="https://example.com/c",
+                    user_id=user.id,
+                    category1="기술",
+                    is_deleted=True,
+                ),
+            ]
+        )
+        await async_test_db.commit()
+        assert await CategoryTreeController.get_category_tree(
+            async_test_db, user.id
+        ) == []
+
+        # When
+        created = await CategoryTreeController.rebuild_category_tree(
+            async_test_db, [user.id]
+        )
+        await async_test_db.commit()
+        tree = await CategoryTreeController.get_category_tree(async_test_db, user.id)
+
+        # Then - 비어 있는 중간 단계는 건너뛰고 삭제된 북마크는 제외
+        assert created == 3
+        assert tree == [
+            {
+                "name": "기술",
+                "bookmark_count": 2,
+                "children": [
+                    {"name": "FastAPI", "bookmark_count": 1, "children": []},
+                    {"name": "백엔드", "bookmark_count": 1, "children": []},
+                ],
+            }
+        ]
+
+
+    def test_rebuild_script(self, test_db, monkeypatch, capsys):
+        """python -m app.scripts.rebuild_category_tree 진입점으로 지정한 사용자의 트리 재구성"""
+        # Given
+        users = [
+            User(
+                email=f"script{index}@example.com",
+                username=f"scriptuser{index}",
+                provider=ProviderType.GITHUB,
+                provider_id=f"script{index}",
+            )
+            for index in range(2)
+        ]
+        test_db.add_all(users)
+        test_db.commit()
+        test_db.add_all(
+            BookmarkNote(
+                title="A",
+                url="https://example.com/a",
+                user_id=user.id,
+                category1="기술",
+            )
+            for user in users
+        )
+        test_db.commit()
+        test_db.query(CategoryTreeNode).delete()
+        test_db.commit()
+
+        @asynccontextmanager
+        async def test_session():
+            engine = create_async_engine(TEST_ASYNC_DATABASE_URL, poolclass=NullPool)
+            async with AsyncSession(bind=engine) as session:
+                yield session
+                await session.commit()
+            await engine.dispose()
+
+        monkeypatch.setattr(rebuild_category_tree, "safe_async_session", test_session)
+
+        # When
+        created = rebuild_category_tree.main(["--user-id", str(users[0].id)])
+
+        # Then - 지정한 사용자만 재구성
+        assert created == 1
+        assert "카테고리 트리 노드 1개를 재구성했습니다" in capsys.readouterr().out
+        assert [
+            (node.user_id, node.category1, node.bookmark_count)
+            for node in test_db.query(CategoryTreeNode).all()
+        ] == [(users[0].id, "기술", 1)]
+
+
+class TestBookmarkController:
+    """북마크 노트 컨트롤러 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_insert_bookmark_rows_writes_category_links(self, async_test_db):
+        """다중 행 INSERT로 저장한 북마크도 카테고리 연결과 트리에 반영"""
+        # Given
+        user = User(
+            email="bulk@example.com",
+            username="bulkuser",
+            provider=ProviderType.GITHUB,
+            provider_id="bulk123",
+        )
+        async_test_db.add(user)
+        await async_test_db.commit()
+        async_test_db.add(
+            BookmarkNote(
+                title="기존",
+                url="https://example.com/existing",
+                user_id=user.id,
+                category1="기술",
+            )
+        )
+        await async_test_db.commit()
+        rows = [
+            {
+                "title": title,
+                "url": url,
+                "url_hash": url_hash(url),
+                "user_id": user.id,
+                "is_deleted": False,
+                **categories,
+            }
+            for title, url, categories in [
+                ("A", "https://example.com/a", {"category1": "기술", "category2": "백엔드"}),
+                ("B", "https://example.com/b", {"category1": "여행"}),
+                ("C", "https://example.com/c", {}),
+            ]
+        ]
+
+        # When
+        created_ids = await BookmarkController.insert_bookmark_rows(
+            async_test_db, user.id, rows
+        )
+        await async_test_db.commit()
+
+        # Then - 기존 카테고리는 재사용하고 새 카테고리는 생성
+        items, total, _, _ = await BookmarkController.get_bookmark_notes(
+            async_test_db, user.id, category="백엔드"
+        )
+        assert [item["id"] for item in items] == [
+            created_ids[url_hash("https://example.com/a")]
+        ]
+        assert await BookmarkController.get_categories(async_test_db, user.id) == [
+            "기술",
+            "백엔드",
+            "여행",
+        ]
+        tree = await CategoryTreeController.get_category_tree(async_test_db, user.id)
+        assert [(node["name"], node["bookmark_count"]) for node in tree] == [
+            ("기술", 1),
+            ("여행", 1),
+        ]
+        assert tree[0]["children"][0]["name"] == "백엔드"
+
+class TestBookmarkSearchController:
+    """북마크 검색 컨트롤러 테스트"""
+
+    @pytest.mark.parametrize(
+        "search, uses_fulltext", [("가", False), ("파이", True), ("FastAPI", True)]
+    )
+    def test_mysql_short_search_falls_back_to_like(self, search, uses_fulltext):
+        """MySQL에서 ngram 토큰보다 짧은 검색어는 FULLTEXT 대신 LIKE로 검색"""
+        # When
+        query, _ = BookmarkSearchController.apply_search_filter(
+            select(BookmarkNote.id), search, "mysql"
+        )
+        sql = str(query.compile(dialect=mysql.dialect()))
+
+        # Then
+        assert ("MATCH" in sql) is uses_fulltext
+        assert ("LIKE" in sql) is not uses_fulltext
@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.configs.database import Base
+from benchmarks.endpoints.baseline import compare_reports, setting_mismatches
+from benchmarks.endpoints.runner import SCENARIOS, run_scenarios
+from benchmarks.endpoints.seed import seed_database
+
+
+def _report(metrics: dict, **settings) -> dict:
+    return {
+        "settings": {"database": "sqlite", "requests": 100, **settings},
+        "results": {"10000": {"list": metrics}},
+    }
+
+
+def _metrics(p50=10.0, throughput=100.0, queries=3.0) -> dict:
+    return {
+        "p50_ms": p50,
+        "p95_ms": p50 * 2,
+        "p99_ms": p50 * 3,
+        "throughput_rps": throughput,
+        "queries_per_request": queries,
+    }
+
+
+def test_compare_reports_flags_regressions():
+    """허용 범위를 넘는 지연 시간 증가/처리량 감소와 쿼리 수 증가만 회귀"""
+    baseline = _report(_metrics())
+
+    within = compare_reports(baseline, _report(_metrics(p50=11.0, throughput=90.0)), 0.2)
+    assert not any(row["regressed"] for row in within)
+
+    slower = compare_reports(baseline, _report(_metrics(p50=13.0)), 0.2)
+    assert {row["metric"] for row in slower if row["regressed"]} == {
+        "p50_ms",
+        "p95_ms",
+        "p99_ms",
+    }
+
+    fewer = compare_reports(baseline, _report(_metrics(throughput=70.0)), 0.2)
+    assert [row["metric"] for row in fewer if row["regressed"]] == ["throughput_rps"]
+
+    more_queries = compare_reports(baseline, _report(_metrics(queries=4.0)), 0.2)
+    assert [row["metric"] for row in more_queries if row["regressed"]] == [
+        "queries_per_request"
+    ]
+
+
+def test_compare_reports_skips_missing_and_reports_setting_mismatch():
+    """기준선에 없는 북마크 수/시나리오는 비교하지 않고, 다른 실행 조건은 알림"""
+    baseline = _report(_metrics())
+    current = _report(_metrics(), requests=500)
+    current["results"]["100000"] = {"list": _metrics(p50=100.0)}
+    current["results"]["10000"]["search"] = _metrics(p50=100.0)
+
+    rows = compare_reports(baseline, current, 0.2)
+    assert {(row["bookmarks"], row["scenario"]) for row in rows} == {("10000", "list")}
+    assert setting_mismatches(baseline, current) == ["requests"]
+
+
+@pytest.mark.asyncio
+async def test_run_scenarios_against_seeded_database(tmp_path):
+    """채운 데이터베이스로 모든 시나리오가 오류 없이 측정됨"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/bench.db")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    try:
+        await seed_database(engine, 50)
+        results = await run_scenarios(engine, requests=4, concurrency=2, warmup=1)
+    finally:
+        await engine.dispose()
+
+    assert list(results) == [scenario.name for scenario in SCENARIOS]
+    for name, metrics in results.items():
+        assert metrics["requests"] == 4
+        assert metrics["errors"] == 0, name
+        assert metrics["p50_ms"] <= metrics["p95_ms"] <= metrics["p99_ms"]
+        assert metrics["queries_per_request"] > 0 or name == "me"
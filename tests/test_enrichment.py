@@ -0,0 +1,647 @@
+import asyncio
+import ipaddress
+import socket
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.controllers.bookmark_controller import BookmarkController
+from app.models.bookmark import BookmarkNote
+from app.models.url_metadata import UrlMetadata, UrlFetchStatus
+from app.models.user import User, ProviderType
+from app.schemas.bookmark import BookmarkNoteCreate
+from app.workers import bookmark_enrichment
+from app.workers.bookmark_enrichment import (
+    BookmarkEnrichmentWorker,
+    UnsafeUrlError,
+    bookmark_enrichment_worker,
+    check_fetch_url,
+    create_enrichment_http_client,
+    fetch_head_metadata,
+    sniff_meta_charset,
+)
+from app.utils.url_canonicalizer import url_hash
+from tests.conftest import TEST_ASYNC_DATABASE_URL
+
+ARTICLE_HTML = """<!doctype html>
+<html>
+<head>
+  <meta charset="utf-8">
+  <title>문서 제목</title>
+  <meta property="og:title" content="OG 제목 &amp; 부제">
+  <meta property="og:description" content="OG 설명">
+  <meta property="og:image" content="/images/cover.png">
+  <link rel="canonical" href="/canonical/article">
+</head>
+<body>{body}</body>
+</html>"""
+
+
+class LocalSite:
+    """경로별 HTML을 돌려주는 로컬 HTTP 서버 (경로별 요청 수와 동시 요청 수 기록)"""
+
+    def __init__(self):
+        self.pages = {}
+        self.content_types = {}
+        self.redirects = {}
+        self.hosts = Counter()
+        self.delay = 0.0
+        self.active = 0
+        self.max_active = 0
+        self.hits = Counter()
+        self.stopped = threading.Event()
+        self._lock = threading.Lock()
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with site._lock:
+                    site.hits[self.path] += 1
+                    site.hosts[self.headers.get("Host")] += 1
+                    site.active += 1
+                    site.max_active = max(site.max_active, site.active)
+                try:
+                    time.sleep(site.delay)
+                    if self.path == "/endless":
+                        self._send_endless()
+                        return
+                    location = site.redirects.get(self.path)
+                    if location is not None:
+                        self.send_response(302)
+                        self.send_header("Location", location)
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    body = site.pages.get(self.path)
+                    if body is None:
+                        self.send_response(404)
+                        self.end_headers()
+                        return
+                    payload = body if isinstance(body, bytes) else body.encode()
+                    self.send_response(200)
+                    self.send_header(
+                        "Content-Type",
+                        site.content_types.get(self.path, "text/html; charset=utf-8"),
+                    )
+                    self.send_header("Content-Length", str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                finally:
+                    with site._lock:
+                        site.active -= 1
+
+            def _send_endless(self):
+                """<head> 뒤로 클라이언트가 끊을 때까지 본문을 계속 보냄"""
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.end_headers()
+                self.wfile.write(ARTICLE_HTML.split("<body>")[0].encode())
+                self.wfile.write(b"<body>")
+                while not site.stopped.is_set():
+                    self.wfile.write(b"x" * 8192)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def url(self, path: str) -> str:
+        return f"{self.base_url}{path}"
+
+
+@pytest.fixture
+def local_site(monkeypatch):
+    # 테스트 서버(루프백)만 예외로 허용
+    monkeypatch.setattr(
+        bookmark_enrichment,
+        "ENRICHMENT_ALLOWED_NETWORKS",
+        (ipaddress.ip_network("127.0.0.1/32"),),
+    )
+    site = LocalSite()
+    site._thread.start()
+    try:
+        yield site
+    finally:
+        site.stopped.set()
+        site.server.shutdown()
+        site.server.server_close()
+
+
+@pytest_asyncio.fixture
+async def fetch_client():
+    client = create_enrichment_http_client()
+    try:
+        yield client
+    finally:
+        await client.aclose()
+
+
+@pytest.fixture
+def fake_dns(monkeypatch):
+    """호스트 이름별 getaddrinfo 응답을 차례로 돌려주는 가짜 DNS (조회 횟수 기록)"""
+    answers = {}
+    lookups = Counter()
+    real_getaddrinfo = asyncio.BaseEventLoop.getaddrinfo
+
+    async def getaddrinfo(loop, host, port, *args, **kwargs):
+        if host not in answers:
+            return await real_getaddrinfo(loop, host, port, *args, **kwargs)
+        lookups[host] += 1
+        address = answers[host][min(lookups[host], len(answers[host])) - 1]
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (address, port or 0))]
+
+    monkeypatch.setattr(asyncio.BaseEventLoop, "getaddrinfo", getaddrinfo)
+    return answers, lookups
+
+
+@pytest_asyncio.fixture
+async def session_factory(test_db):
+    engine = create_async_engine(TEST_ASYNC_DATABASE_URL, poolclass=NullPool)
+    try:
+        yield async_sessionmaker(engine, expire_on_commit=False)
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture
+def test_user(test_db):
+    user = User(
+        email="enrich@example.com",
+        username="enrichuser",
+        provider=ProviderType.GITHUB,
+        provider_id="enrich123",
+    )
+    test_db.add(user)
+    test_db.commit()
+    return user
+
+
+class TestFetchHeadMetadata:
+    """<head> 메타데이터 추출 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_extracts_og_tags_and_canonical(self, local_site, fetch_client):
+        """og:title, og:description, canonical URL 추출 테스트"""
+        # Given
+        local_site.pages["/article"] = ARTICLE_HTML.format(body="본문")
+
+        # When
+        metadata = await fetch_head_metadata(
+            fetch_client, local_site.url("/article")
+        )
+
+        # Then - og 값이 <title>보다 우선, canonical은 절대 URL로 변환
+        assert metadata.title == "OG 제목 & 부제"
+        assert metadata.description == "OG 설명"
+        assert metadata.canonical_url == local_site.url("/canonical/article")
+        assert metadata.thumbnail_url == local_site.url("/images/cover.png")
+        assert metadata.content_type == "text/html"
+
+    @pytest.mark.asyncio
+    async def test_stops_reading_after_head(self, local_site, fetch_client):
+        """</head> 이후 본문은 받지 않는지 테스트"""
+        # When - 본문이 끝나지 않는 페이지 (본문까지 읽으면 시간 초과)
+        metadata = await asyncio.wait_for(
+            fetch_head_metadata(fetch_client, local_site.url("/endless")),
+            timeout=5,
+        )
+
+        # Then
+        assert metadata.title == "OG 제목 & 부제"
+
+    @pytest.mark.asyncio
+    async def test_byte_cap_without_head_end(self, local_site, fetch_client):
+        """</head>가 없어도 최대 바이트에서 멈추는지 테스트"""
+        # Given
+        local_site.pages["/no-head-end"] = (
+            "<html><head><title>제목</title>" + "<meta name='x'>" * 100_000
+        )
+
+        # When
+        metadata = await fetch_head_metadata(
+            fetch_client, local_site.url("/no-head-end"), max_bytes=1024
+        )
+
+        # Then
+        assert metadata.title == "제목"
+        assert metadata.canonical_url is None
+
+    @pytest.mark.asyncio
+    async def test_error_response_returns_none(self, local_site, fetch_client):
+        """오류 응답은 None 반환 테스트"""
+        assert (
+            await fetch_head_metadata(fetch_client, local_site.url("/missing"))
+            is None
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "http://127.0.0.1:8000/admin",
+            "http://10.0.0.5/",
+            "http://169.254.169.254/latest/meta-data/",
+            "http://[::1]/",
+            "http://[::ffff:192.168.0.1]/",
+            "http://localhost/",
+            "file:///etc/passwd",
+        ],
+    )
+    async def test_rejects_non_public_urls(self, url):
+        """http/https가 아니거나 전역 주소가 아닌 곳으로 가는 URL은 거부"""
+        with pytest.raises(UnsafeUrlError):
+            await check_fetch_url(url)
+
+    @pytest.mark.asyncio
+    async def test_private_ip_url_is_not_fetched(self, local_site, fetch_client, monkeypatch):
+        """허용 목록이 없으면 내부 주소는 연결하지 않고 거부"""
+        # Given
+        monkeypatch.setattr(bookmark_enrichment, "ENRICHMENT_ALLOWED_NETWORKS", ())
+        local_site.pages["/internal"] = ARTICLE_HTML.format(body="내부")
+
+        # When / Then
+        with pytest.raises(UnsafeUrlError):
+            await fetch_head_metadata(fetch_client, local_site.url("/internal"))
+        assert local_site.hits["/internal"] == 0
+
+    @pytest.mark.asyncio
+    async def test_follows_redirects_with_check_on_every_hop(
+        self, local_site, fetch_client
+    ):
+        """리다이렉트는 직접 따라가고, 내부 주소로 가는 리다이렉트는 거부"""
+        # Given
+        local_site.pages["/article"] = ARTICLE_HTML.format(body="본문")
+        local_site.redirects["/moved"] = "/article"
+        local_site.redirects["/metadata"] = "http://169.254.169.254/latest/meta-data/"
+        local_site.redirects["/loop"] = "/loop"
+
+        # When / Then
+        metadata = await fetch_head_metadata(fetch_client, local_site.url("/moved"))
+        assert metadata.title == "OG 제목 & 부제"
+        with pytest.raises(UnsafeUrlError):
+            await fetch_head_metadata(fetch_client, local_site.url("/metadata"))
+        assert await fetch_head_metadata(fetch_client, local_site.url("/loop")) is None
+        assert local_site.hits["/loop"] == bookmark_enrichment.ENRICHMENT_MAX_REDIRECTS + 1
+
+    @pytest.mark.asyncio
+    async def test_connects_to_checked_address_with_original_host(
+        self, local_site, fetch_client, fake_dns
+    ):
+        """연결 시 해석한 주소로 접속하고 Host 헤더는 원래 호스트 이름 유지"""
+        # Given
+        answers, lookups = fake_dns
+        answers["pinned.test"] = ["127.0.0.1"]
+        local_site.pages["/article"] = ARTICLE_HTML.format(body="본문")
+        port = local_site.server.server_address[1]
+
+        # When
+        metadata = await fetch_head_metadata(
+            fetch_client, f"http://pinned.test:{port}/article"
+        )
+
+        # Then
+        assert metadata.title == "OG 제목 & 부제"
+        assert local_site.hosts[f"pinned.test:{port}"] == 1
+
+    @pytest.mark.asyncio
+    async def test_dns_rebinding_after_check_is_not_connected(
+        self, local_site, fetch_client, fake_dns, monkeypatch
+    ):
+        """검사할 때는 전역 주소였다가 연결할 때 내부 주소로 바뀌면 연결하지 않음"""
+        # Given - 첫 조회(검사)는 전역 주소, 두 번째 조회(연결)는 루프백
+        monkeypatch.setattr(bookmark_enrichment, "ENRICHMENT_ALLOWED_NETWORKS", ())
+        answers, lookups = fake_dns
+        answers["rebind.test"] = ["93.184.216.34", "127.0.0.1"]
+        local_site.pages["/internal"] = ARTICLE_HTML.format(body="내부")
+        port = local_site.server.server_address[1]
+
+        # When / Then
+        with pytest.raises(UnsafeUrlError):
+            await fetch_head_metadata(
+                fetch_client, f"http://rebind.test:{port}/internal"
+            )
+        assert lookups["rebind.test"] == 2
+        assert local_site.hits["/internal"] == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "declaration",
+        [
+            '<meta charset="euc-kr">',
+            "<meta http-equiv='Content-Type' content='text/html; charset=EUC-KR'>",
+        ],
+    )
+    async def test_decodes_with_meta_charset(self, local_site, fetch_client, declaration):
+        """Content-Type에 charset이 없으면 <meta> 선언 인코딩으로 디코딩"""
+        # Given
+        local_site.pages["/legacy"] = (
+            f"<html><head>{declaration}<title>한글 제목</title></head><body></body></html>"
+        ).encode("euc-kr")
+        local_site.content_types["/legacy"] = "text/html"
+
+        # When
+        metadata = await fetch_head_metadata(fetch_client, local_site.url("/legacy"))
+
+        # Then
+        assert metadata.title == "한글 제목"
+
+    def test_sniff_meta_charset(self):
+        """<meta> charset 선언 추출 (Content-Type 헤더의 charset이 우선)"""
+        assert sniff_meta_charset(b'<head><meta charset="Shift_JIS">') == "shift_jis"
+        assert sniff_meta_charset(b"<meta charset=utf-8>") == "utf-8"
+        assert sniff_meta_charset(b'<meta charset="no-such-charset">') is None
+        assert sniff_meta_charset(b"<title>charset=euc-kr</title>") is None
+
+
+class TestBookmarkEnrichmentWorker:
+    """북마크 메타데이터 보강 작업자 테스트"""
+
+    def _add_bookmarks(self, test_db, test_user, urls):
+        bookmarks = [
+            BookmarkNote(title=f"북마크 - {url[:50]}...", url=url, user_id=test_user.id)
+            for url in urls
+        ]
+        test_db.add_all(bookmarks)
+        test_db.commit()
+        return [bookmark.id for bookmark in bookmarks]
+
+    @pytest.mark.asyncio
+    async def test_enriches_in_batched_update_and_drains_on_stop(
+        self, test_db, test_user, local_site, session_factory
+    ):
+        """결과를 한 번의 UPDATE로 쓰고 종료 시 남은 작업을 마저 처리하는지 테스트"""
+        # Given
+        paths = [f"/article-{n}" for n in range(5)]
+        for path in paths:
+            local_site.pages[path] = ARTICLE_HTML.format(body=path)
+        urls = [local_site.url(path) for path in paths]
+        bookmark_ids = self._add_bookmarks(test_db, test_user, urls)
+
+        updates = []
+        engine = session_factory.kw["bind"].sync_engine
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("UPDATE bookmark_notes"):
+                updates.append(executemany)
+
+        event.listen(engine, "before_cursor_execute", capture)
+        worker = BookmarkEnrichmentWorker(flush_interval=60)
+        await worker.start(session_factory)
+
+        # When - 주기적 쓰기 전에 종료해도 결과가 반영되어야 함
+        for bookmark_id, url in zip(bookmark_ids, urls):
+            assert worker.enqueue(bookmark_id, url)
+        await worker.stop()
+        event.remove(engine, "before_cursor_execute", capture)
+
+        # Then
+        test_db.expire_all()
+        for bookmark_id in bookmark_ids:
+            bookmark = test_db.get(BookmarkNote, bookmark_id)
+            assert bookmark.title == "OG 제목 & 부제"
+            assert bookmark.description == "OG 설명"
+            assert bookmark.canonical_url == local_site.url("/canonical/article")
+        assert updates == [True]
+        assert not worker.enqueue(bookmark_ids[0], urls[0])
+
+    @pytest.mark.asyncio
+    async def test_per_host_concurrency_limit(
+        self, test_db, test_user, local_site, session_factory
+    ):
+        """같은 호스트로의 동시 요청 수 제한 테스트"""
+        # Given
+        local_site.delay = 0.1
+        paths = [f"/page-{n}" for n in range(6)]
+        for path in paths:
+            local_site.pages[path] = ARTICLE_HTML.format(body=path)
+        urls = [local_site.url(path) for path in paths]
+        bookmark_ids = self._add_bookmarks(test_db, test_user, urls)
+        worker = BookmarkEnrichmentWorker(concurrency=10, per_host_concurrency=2)
+        await worker.start(session_factory)
+
+        # When
+        for bookmark_id, url in zip(bookmark_ids, urls):
+            worker.enqueue(bookmark_id, url)
+        await worker.stop()
+
+        # Then
+        assert local_site.max_active == 2
+        assert worker._host_limits == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_keeps_placeholder(
+        self, test_db, test_user, local_site, session_factory
+    ):
+        """가져오기에 실패한 북마크는 임시 제목을 유지하는지 테스트"""
+        # Given
+        url = local_site.url("/missing")
+        [bookmark_id] = self._add_bookmarks(test_db, test_user, [url])
+        worker = BookmarkEnrichmentWorker()
+        await worker.start(session_factory)
+
+        # When
+        worker.enqueue(bookmark_id, url)
+        await worker.stop()
+
+        # Then - 실패도 기록해 재시도 간격 안에서는 다시 가져오지 않음
+        test_db.expire_all()
+        bookmark = test_db.get(BookmarkNote, bookmark_id)
+        assert bookmark.title.startswith("북마크 -")
+        assert bookmark.url_metadata.fetch_status == UrlFetchStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_skips_url_redirecting_to_private_address(
+        self, test_db, test_user, local_site, session_factory
+    ):
+        """내부 주소로 리다이렉트되는 북마크는 보강하지 않음"""
+        # Given
+        local_site.redirects["/redirect"] = "http://10.0.0.1/secret"
+        url = local_site.url("/redirect")
+        [bookmark_id] = self._add_bookmarks(test_db, test_user, [url])
+        worker = BookmarkEnrichmentWorker()
+        await worker.start(session_factory)
+
+        # When
+        worker.enqueue(bookmark_id, url)
+        await worker.stop()
+
+        # Then
+        test_db.expire_all()
+        bookmark = test_db.get(BookmarkNote, bookmark_id)
+        assert bookmark.title.startswith("북마크 -")
+        assert bookmark.url_metadata is None
+        assert test_db.query(UrlMetadata).count() == 0
+
+    @pytest.mark.asyncio
+    async def test_same_page_fetched_once_across_users(
+        self, test_db, test_user, local_site, session_factory
+    ):
+        """여러 사용자가 같은 페이지를 저장해도 한 번만 가져와 공유하는지 테스트"""
+        # Given - 두 사용자가 같은 페이지를 다른 URL로 저장
+        local_site.delay = 0.1
+        local_site.pages["/shared"] = ARTICLE_HTML.format(body="본문")
+        other_user = User(
+            email="enrich-other@example.com",
+            username="enrichother",
+            provider=ProviderType.GOOGLE,
+            provider_id="enrich456",
+        )
+        test_db.add(other_user)
+        test_db.commit()
+        first = BookmarkNote(
+            title="임시", url=local_site.url("/shared"), user_id=test_user.id
+        )
+        second = BookmarkNote(
+            title="임시",
+            url=local_site.url("/shared/?utm_source=feed"),
+            user_id=other_user.id,
+        )
+        test_db.add_all([first, second])
+        test_db.commit()
+        worker = BookmarkEnrichmentWorker()
+        await worker.start(session_factory)
+
+        # When
+        worker.enqueue(first.id, first.url)
+        worker.enqueue(second.id, second.url)
+        await worker.stop()
+
+        # Then
+        assert local_site.hits["/shared"] == 1
+        [metadata] = test_db.query(UrlMetadata).all()
+        assert metadata.fetch_status == UrlFetchStatus.OK
+        assert metadata.thumbnail_url == local_site.url("/images/cover.png")
+        test_db.expire_all()
+        for bookmark_id in (first.id, second.id):
+            bookmark = test_db.get(BookmarkNote, bookmark_id)
+            assert bookmark.title == "OG 제목 & 부제"
+            assert bookmark.url_metadata_id == metadata.id
+
+    @pytest.mark.parametrize(
+        "age, fetched", [(timedelta(days=1), False), (timedelta(days=31), True)]
+    )
+    @pytest.mark.asyncio
+    async def test_uses_shared_metadata_until_stale(
+        self,
+        test_db,
+        test_user,
+        local_site,
+        session_factory,
+        age,
+        fetched,
+    ):
+        """저장된 메타데이터가 최신이면 가져오지 않고, 오래됐으면 다시 가져오는지 테스트"""
+        # Given
+        url = local_site.url("/cached")
+        local_site.pages["/cached"] = ARTICLE_HTML.format(body="본문")
+        test_db.add(
+            UrlMetadata(
+                url_hash=url_hash(url),
+                url=url,
+                title="저장된 제목",
+                fetch_status=UrlFetchStatus.OK,
+                fetched_at=datetime.utcnow() - age,
+            )
+        )
+        test_db.commit()
+        [bookmark_id] = self._add_bookmarks(test_db, test_user, [url])
+        worker = BookmarkEnrichmentWorker()
+        await worker.start(session_factory)
+
+        # When
+        worker.enqueue(bookmark_id, url)
+        await worker.stop()
+
+        # Then
+        assert local_site.hits["/cached"] == (1 if fetched else 0)
+        test_db.expire_all()
+        assert test_db.get(BookmarkNote, bookmark_id).title == (
+            "OG 제목 & 부제" if fetched else "저장된 제목"
+        )
+
+    @pytest.mark.asyncio
+    async def test_create_bookmark_uses_shared_metadata(
+        self,
+        async_test_db,
+        test_db,
+        test_user,
+        local_site,
+        monkeypatch,
+    ):
+        """공유 메타데이터가 있는 페이지는 생성 즉시 제목이 채워지고 가져오지 않는지 테스트"""
+        # Given
+        url = local_site.url("/popular")
+        metadata = UrlMetadata(
+            url_hash=url_hash(url),
+            url=url,
+            title="인기 영상",
+            description="설명",
+            fetch_status=UrlFetchStatus.OK,
+            fetched_at=datetime.utcnow(),
+        )
+        test_db.add(metadata)
+        test_db.commit()
+        enqueued = []
+        monkeypatch.setattr(
+            bookmark_enrichment_worker, "enqueue", lambda *args: enqueued.append(args)
+        )
+
+        # When
+        bookmark = await BookmarkController.create_bookmark_note(
+            async_test_db,
+            BookmarkNoteCreate.model_construct(url=url),
+            test_user.id,
+        )
+
+        # Then
+        assert bookmark.title == "인기 영상"
+        assert bookmark.description == "설명"
+        assert bookmark.url_metadata_id == metadata.id
+        assert enqueued == []
+        assert local_site.hits["/popular"] == 0
+
+    @pytest.mark.asyncio
+    async def test_create_bookmark_returns_before_enrichment(
+        self,
+        async_test_db,
+        test_db,
+        test_user,
+        local_site,
+        session_factory,
+    ):
+        """북마크 생성은 바로 반환되고 제목은 백그라운드에서 채워지는지 테스트"""
+        # Given
+        local_site.delay = 0.3
+        local_site.pages["/slow"] = ARTICLE_HTML.format(body="본문")
+        await bookmark_enrichment_worker.start(session_factory)
+        try:
+            # When
+            started = time.monotonic()
+            bookmark = await BookmarkController.create_bookmark_note(
+                async_test_db,
+                BookmarkNoteCreate.model_construct(url=local_site.url("/slow")),
+                test_user.id,
+            )
+            elapsed = time.monotonic() - started
+        finally:
+            await bookmark_enrichment_worker.stop()
+            bookmark_enrichment_worker.session_factory = None
+
+        # Then
+        assert elapsed < 0.3
+        assert bookmark.title.startswith("북마크 -")
+        test_db.expire_all()
+        assert test_db.get(BookmarkNote, bookmark.id).title == "OG 제목 & 부제"
@@ -0,0 +1,179 @@
+import pytest
+from sqlalchemy import event
+from app.controllers.bookmark_controller import BookmarkController
+from app.controllers.category_tree_controller import CategoryTreeController
+from app.models.bookmark import BookmarkNote
+from app.models.user import User, ProviderType
+from app.utils.url_canonicalizer import url_hash
+
+
+class TestBookmarkIndexUsage:
+    """북마크 조회 쿼리의 복합 인덱스 사용 여부 테스트 (SQLite EXPLAIN QUERY PLAN)"""
+
+    @pytest.fixture
+    def test_user(self, test_db):
+        """테스트용 사용자와 북마크 생성"""
+        user = User(
+            email="index@example.com",
+            username="indexuser",
+            provider=ProviderType.GITHUB,
+            provider_id="index123",
+        )
+        test_db.add(user)
+        test_db.commit()
+        test_db.add_all(
+            BookmarkNote(
+                title=f"인덱스 북마크 {i}",
+                url=f"https://example.com/index/{i}",
+                category1="기술",
+                user_id=user.id,
+            )
+            for i in range(3)
+        )
+        test_db.commit()
+        return user
+
+    async def _explain_controller_queries(self, async_test_db, controller_call):
+        """컨트롤러가 실행한 SELECT 문마다 쿼리 플랜을 수집"""
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append((statement, parameters))
+
+        sync_engine = async_test_db.bind.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", capture)
+        try:
+            await controller_call()
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", capture)
+
+        connection = await async_test_db.connection()
+        plans = []
+        for statement, parameters in statements:
+            result = await connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            )
+            plans.append(" / ".join(row[-1] for row in result))
+        return plans
+
+    @pytest.mark.asyncio
+    async def test_get_bookmark_notes_uses_composite_index(
+        self, async_test_db, test_user
+    ):
+        """목록 조회가 복합 인덱스로 검색/정렬하는지 테스트"""
+        # When
+        plans = await self._explain_controller_queries(
+            async_test_db,
+            lambda: BookmarkController.get_bookmark_notes(
+                async_test_db, user_id=test_user.id
+            ),
+        )
+
+        # Then - total은 users 기본 키 조회, 목록 SELECT는 복합 인덱스 사용, 별도 정렬 없음
+        assert len(plans) == 2
+        assert "users USING INTEGER PRIMARY KEY" in plans[0]
+        assert "ix_bookmark_notes_user_active_created" in plans[1]
+        assert "TEMP B-TREE" not in plans[1]
+
+    @pytest.mark.asyncio
+    async def test_category_filter_uses_link_indexes(
+        self, async_test_db, test_user
+    ):
+        """카테고리 필터가 연결 테이블 인덱스로 동등 조건 조회하는지 테스트"""
+        # When
+        plans = await self._explain_controller_queries(
+            async_test_db,
+            lambda: BookmarkController.get_bookmark_notes(
+                async_test_db, user_id=test_user.id, category="기술"
+            ),
+        )
+
+        # Then
+        for plan in plans:
+            assert "ix_categories_user_id_name" in plan
+            assert "ix_bookmark_categories_category_bookmark" in plan
+
+    @pytest.mark.asyncio
+    async def test_get_categories_uses_category_indexes(
+        self, async_test_db, test_user
+    ):
+        """카테고리 목록 조회가 카테고리/연결 테이블 인덱스를 사용하는지 테스트"""
+        # When
+        plans = await self._explain_controller_queries(
+            async_test_db,
+            lambda: BookmarkController.get_categories(
+                async_test_db, user_id=test_user.id
+            ),
+        )
+
+        # Then - 카테고리 수에 비례하는 단일 쿼리
+        assert len(plans) == 1
+        assert "ix_categories_user_id_name" in plans[0]
+        assert "ix_bookmark_categories_category_bookmark" in plans[0]
+
+    @pytest.mark.asyncio
+    async def test_get_category_tree_uses_path_index(self, async_test_db, test_user):
+        """카테고리 트리 조회가 경로 인덱스 한 번으로 끝나는지 테스트"""
+        # When
+        plans = await self._explain_controller_queries(
+            async_test_db,
+            lambda: CategoryTreeController.get_category_tree(
+                async_test_db, user_id=test_user.id
+            ),
+        )
+
+        # Then - 북마크 테이블을 읽지 않고 별도 정렬도 없음
+        assert len(plans) == 1
+        assert "ix_category_tree_nodes_user_path" in plans[0]
+        assert "bookmark_notes" not in plans[0]
+        assert "TEMP B-TREE" not in plans[0]
+
+    @pytest.mark.asyncio
+    async def test_url_hash_lookup_uses_unique_index(self, async_test_db, test_user):
+        """정규화 URL 조회가 사용자별 고유 인덱스를 사용하는지 테스트"""
+        # When - 단건 조회와 일괄 조회
+        plans = await self._explain_controller_queries(
+            async_test_db,
+            lambda: BookmarkController.get_bookmark_note_by_url_hash(
+                async_test_db,
+                test_user.id,
+                url_hash("https://example.com/index/0"),
+            ),
+        )
+        plans += await self._explain_controller_queries(
+            async_test_db,
+            lambda: BookmarkController.lookup_bookmark_ids(
+                async_test_db,
+                test_user.id,
+                [f"https://example.com/index/{i}" for i in range(100)],
+            ),
+        )
+
+        # Then - 일괄 조회도 URL 수와 관계없이 IN 쿼리 한 번
+        assert len(plans) == 2
+        for plan in plans:
+            assert "ux_bookmark_notes_user_url_hash" in plan
+
+    @pytest.mark.asyncio
+    async def test_get_changes_uses_change_seq_index(self, async_test_db, test_user):
+        """변경 피드가 (user_id, change_seq, id) 인덱스 순서로 읽는지 테스트"""
+        # When - 첫 동기화와 커서 이후 조회
+        plans = await self._explain_controller_queries(
+            async_test_db,
+            lambda: BookmarkController.get_changes(async_test_db, test_user.id),
+        )
+        plans += await self._explain_controller_queries(
+            async_test_db,
+            lambda: BookmarkController.get_changes(
+                async_test_db,
+                test_user.id,
+                since=BookmarkController._encode_change_cursor(0, 1),
+            ),
+        )
+
+        # Then - 별도 정렬 없이 인덱스 사용
+        assert len(plans) == 2
+        for plan in plans:
+            assert "ix_bookmark_notes_user_change_seq" in plan
+            assert "TEMP B-TREE" not in plan
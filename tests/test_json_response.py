@@ -0,0 +1,66 @@
+import json
+from datetime import datetime, timezone
+import pytest
+from app.schemas.bookmark import BookmarkNoteResponse
+from app.utils import json_response
+from app.utils.json_response import FastJSONResponse, dumps_json
+
+
+class TestDumpsJSON:
+    """검증 없이 바로 직렬화하는 응답 본문 테스트"""
+
+    @pytest.fixture(params=["orjson", "json"])
+    def encoder(self, request, monkeypatch):
+        """orjson 설치 여부와 관계없이 두 경로 모두 확인"""
+        if request.param == "orjson":
+            if json_response.orjson is None:
+                pytest.skip("orjson이 설치되어 있지 않음")
+        else:
+            monkeypatch.setattr(json_response, "orjson", None)
+        return request.param
+
+    @pytest.mark.parametrize(
+        "created_at",
+        [
+            datetime(2026, 10, 17, 9, 30, 0, 123456),
+            datetime(2026, 10, 17, 9, 30, tzinfo=timezone.utc),
+        ],
+    )
+    def test_matches_pydantic_serialization(self, encoder, created_at):
+        """response_model 직렬화와 같은 JSON 값을 만드는지 테스트"""
+        # Given
+        fields = {
+            "id": 1,
+            "title": "한글 제목",
+            "url": "https://example.com/",
+            "category1": "기술",
+            "category2": None,
+            "category3": None,
+            "description": None,
+            "canonical_url": None,
+            "user_id": 1,
+            "created_at": created_at,
+            "updated_at": created_at,
+            "deleted_at": None,
+        }
+
+        # When
+        body = dumps_json(fields)
+
+        # Then
+        expected = BookmarkNoteResponse(**fields).model_dump_json()
+        assert json.loads(body) == json.loads(expected)
+        assert "한글 제목".encode() in body
+
+    def test_response_class(self, encoder):
+        """FastJSONResponse 본문과 헤더 테스트"""
+        response = FastJSONResponse({"items": []}, headers={"ETag": '"v1"'})
+
+        assert response.body == b'{"items":[]}'
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["etag"] == '"v1"'
+
+    def test_rejects_unknown_types(self, encoder):
+        """직렬화할 수 없는 값은 TypeError"""
+        with pytest.raises(TypeError):
+            dumps_json({"value": object()})
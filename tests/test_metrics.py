@@ -0,0 +1,170 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import Session
+from app.metrics import InstrumentedAsyncAdaptedQueuePool, metrics_registry
+from app.metrics.database import (
+    db_pool_checkout_seconds,
+    db_pool_checkout_timeouts_total,
+)
+from app.metrics.http import (
+    http_request_db_statements,
+    http_request_duration_seconds,
+)
+from app.metrics.registry import Counter, Histogram, MetricsRegistry
+from app.models.user import User, ProviderType
+from app.controllers.auth_controller import AuthController
+
+
+class TestMetricsRegistry:
+    """Prometheus 텍스트 형식 출력 테스트"""
+
+    def test_render_counter_and_histogram(self):
+        """히스토그램은 누적 구간 카운트와 합계/개수를 출력"""
+        registry = MetricsRegistry()
+        counter = registry.register(
+            Counter("jobs_total", "Jobs", label_names=("queue",))
+        )
+        histogram = registry.register(
+            Histogram("job_seconds", "Job time", buckets=(0.1, 1.0))
+        )
+        counter.inc(labels=("a",))
+        counter.inc(2, labels=("a",))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(3)
+
+        assert registry.render().splitlines() == [
+            "# HELP jobs_total Jobs",
+            "# TYPE jobs_total counter",
+            'jobs_total{queue="a"} 3',
+            "# HELP job_seconds Job time",
+            "# TYPE job_seconds histogram",
+            'job_seconds_bucket{le="0.1"} 1',
+            'job_seconds_bucket{le="1"} 2',
+            'job_seconds_bucket{le="+Inf"} 3',
+            "job_seconds_sum 3.55",
+            "job_seconds_count 3",
+        ]
+
+    def test_render_escapes_label_values(self):
+        """레이블 값의 따옴표/역슬래시/줄바꿈은 이스케이프"""
+        counter = Counter("weird_total", "Weird", label_names=("value",))
+        counter.inc(labels=('a"b\\c\nd',))
+
+        assert counter.render()[-1] == 'weird_total{value="a\\"b\\\\c\\nd"} 1'
+
+
+class TestMetricsEndpoint:
+    """지표 미들웨어와 /metrics 엔드포인트 테스트"""
+
+    @pytest.fixture
+    def auth_headers(self, test_db: Session):
+        user = User(
+            email="metrics@example.com",
+            username="metrics_user",
+            provider=ProviderType.GITHUB,
+            provider_id="metrics123",
+        )
+        test_db.add(user)
+        test_db.commit()
+        test_db.refresh(user)
+        return {"Authorization": f"Bearer {AuthController.create_access_token(user)}"}
+
+    def test_route_label_uses_path_template(self, client, auth_headers):
+        """경로 파라미터 값 대신 라우트 템플릿으로 집계하고, 매칭되지 않은 경로는 하나로 모음"""
+        labels = ("GET", "/api/bookmark/{bookmark_id}", "404")
+        unmatched = ("GET", "unmatched", "404")
+        before = http_request_duration_seconds.count(labels)
+        before_unmatched = http_request_duration_seconds.count(unmatched)
+
+        for bookmark_id in (101, 102, 103):
+            response = client.get(f"/api/bookmark/{bookmark_id}", headers=auth_headers)
+            assert response.status_code == 404
+        client.get("/no/such/path/12345")
+
+        assert http_request_duration_seconds.count(labels) == before + 3
+        assert http_request_duration_seconds.count(unmatched) == before_unmatched + 1
+
+        body = client.get("/metrics").text
+        assert 'route="/api/bookmark/{bookmark_id}"' in body
+        assert "/api/bookmark/101" not in body
+        assert "/no/such/path" not in body
+
+    def test_route_label_includes_router_prefix(self, client, auth_headers):
+        """include_router(prefix=...)로 등록한 라우트도 prefix를 포함한 템플릿으로 집계"""
+        labels = ("GET", "/auth/me", "200")
+        before = http_request_duration_seconds.count(labels)
+
+        assert client.get("/auth/me", headers=auth_headers).status_code == 200
+
+        assert http_request_duration_seconds.count(labels) == before + 1
+
+    def test_records_sql_statements_per_request(self, client, auth_headers):
+        """요청 안에서 실행한 SQL 문 수를 라우트별로 기록"""
+        labels = ("GET", "/api/bookmark/")
+        before_count = http_request_db_statements.count(labels)
+        before_sum = http_request_db_statements.sum(labels)
+
+        response = client.get("/api/bookmark/", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert http_request_db_statements.count(labels) == before_count + 1
+        # 컬렉션 버전, 사용자별 북마크 수, 목록 SELECT
+        assert http_request_db_statements.sum(labels) - before_sum >= 3
+
+    def test_metrics_endpoint_format(self, client):
+        """Prometheus 텍스트 형식으로 HTTP/SQL/커넥션 풀 지표를 노출"""
+        client.get("/health")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        body = response.text
+        for name in (
+            "http_request_duration_seconds",
+            "http_request_db_statements",
+            "http_request_db_seconds",
+            "db_statements_total",
+            "db_statement_duration_seconds",
+            "db_pool_checkout_seconds",
+            "db_pool_checked_out",
+            "db_pool_overflow",
+        ):
+            assert f"# TYPE {name} " in body
+        assert (
+            'http_request_duration_seconds_count{method="GET",route="/health",status="200"}'
+            in body
+        )
+
+
+@pytest.mark.asyncio
+async def test_instrumented_pool_records_checkout_and_overflow(tmp_path):
+    """풀 체크아웃 시간, 오버플로 사용량, 타임아웃을 기록"""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path}/pool.db",
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.1,
+    )
+    before_checkouts = db_pool_checkout_seconds.count()
+    before_timeouts = db_pool_checkout_timeouts_total.value()
+    try:
+        async with engine.connect() as first, engine.connect() as second:
+            await first.execute(text("SELECT 1"))
+            await second.execute(text("SELECT 1"))
+            body = metrics_registry.render()
+            assert "db_pool_checked_out 2" in body
+            assert "db_pool_overflow 1" in body
+
+            with pytest.raises(PoolTimeoutError):
+                async with engine.connect() as third:
+                    await third.execute(text("SELECT 1"))
+    finally:
+        await engine.dispose()
+
+    assert db_pool_checkout_seconds.count() == before_checkouts + 3
+    assert db_pool_checkout_timeouts_total.value() == before_timeouts + 1
@@ -1,6 +1,8 @@
 import pytest
 from datetime import datetime
 from app.models.user import User, ProviderType
+from app.models.bookmark import BookmarkNote
+from app.models.category import Category, BookmarkCategory
 from sqlalchemy.exc import IntegrityError
 
 
@@ -151,3 +153,54 @@ class TestUserModel:
         assert user.full_name is None
         assert user.avatar_url is None
         assert user.last_login_at is None
+
+
+class TestBookmarkCategoryModel:
+    """북마크 노트-카테고리 연결 모델 테스트"""
+
+    def test_category_columns_sync_to_link_table(self, test_db):
+        """category1~3 값이 연결 테이블과 동기화되는지 테스트"""
+        # Given
+        user = User(
+            email="category@example.com",
+            username="categoryuser",
+            provider=ProviderType.GITHUB,
+            provider_id="category123",
+        )
+        test_db.add(user)
+        test_db.commit()
+
+        # When - 같은 카테고리를 쓰는 북마크 두 개 생성
+        first = BookmarkNote(
+            title="첫 번째",
+            url="https://example.com/first",
+            category1="기술",
+            category2="파이썬",
+            user_id=user.id,
+        )
+        second = BookmarkNote(
+            title="두 번째",
+            url="https://example.com/second",
+            category1="기술",
+            user_id=user.id,
+        )
+        test_db.add_all([first, second])
+        test_db.commit()
+
+        # Then - 카테고리는 사용자별로 한 번만 생성됨
+        assert test_db.query(Category).filter_by(user_id=user.id).count() == 2
+        assert [
+            (link.position, link.category.name) for link in first.category_links
+        ] == [(1, "기술"), (2, "파이썬")]
+
+        # When - 카테고리 변경
+        first.category1 = "디자인"
+        first.category2 = None
+        test_db.commit()
+        test_db.expire_all()
+
+        # Then
+        assert [
+            (link.position, link.category.name) for link in first.category_links
+        ] == [(1, "디자인")]
+        assert test_db.query(BookmarkCategory).count() == 2
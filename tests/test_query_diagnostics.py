@@ -0,0 +1,142 @@
+import logging
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from app.metrics.database import (
+    RequestDatabaseStats,
+    current_request_stats,
+    install_sql_metrics,
+)
+from app.metrics.query_diagnostics import (
+    QueryBudgetExceeded,
+    QueryDiagnostics,
+    RequestQueryLog,
+    current_query_log,
+    fingerprint,
+    query_diagnostics,
+)
+from app.models.user import User, ProviderType
+from app.controllers.auth_controller import AuthController
+
+LOGGER_NAME = "app.metrics.query_diagnostics"
+
+
+@pytest.fixture
+def diagnostics():
+    """메모리 SQLite 엔진에 등록한 진단 객체"""
+    instance = QueryDiagnostics(
+        enabled=True, slow_query_ms=10_000, repeated_threshold=3, budgets={}
+    )
+    engine = create_engine("sqlite://")
+    instance.install(engine)
+    with engine.connect() as connection:
+        connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        connection.execute(text("CREATE INDEX ix_items_name ON items (name)"))
+        yield instance, connection
+    engine.dispose()
+
+
+def test_fingerprint_ignores_values_and_in_list_length():
+    """값과 IN 목록 길이만 다른 쿼리는 같은 형태"""
+    assert fingerprint(
+        "SELECT * FROM items\n  WHERE id IN (?, ?, ?) AND name = 'a''b' LIMIT 20"
+    ) == fingerprint("SELECT * FROM items WHERE id IN (?) AND name = 'x' LIMIT 5")
+    assert fingerprint("SELECT * FROM items WHERE id = %s") == fingerprint(
+        "SELECT * FROM items WHERE id = :id_1"
+    )
+    assert fingerprint("SELECT * FROM items") != fingerprint("SELECT id FROM items")
+
+
+def test_repeated_statements_are_reported(diagnostics, caplog):
+    """한 요청에서 같은 형태의 쿼리가 반복되면 경고"""
+    instance, connection = diagnostics
+    query_log = RequestQueryLog()
+    token = current_query_log.set(query_log)
+    try:
+        for item_id in range(4):
+            connection.execute(
+                text("SELECT name FROM items WHERE id = :id"), {"id": item_id}
+            )
+        connection.execute(text("SELECT count(*) FROM items"))
+    finally:
+        current_query_log.reset(token)
+
+    with caplog.at_level(logging.WARNING, logger=LOGGER_NAME):
+        instance.finish_request("GET", "/items", query_log)
+
+    assert query_log.statements == 5
+    messages = [record.getMessage() for record in caplog.records]
+    assert len(messages) == 1
+    assert "반복 쿼리 감지 (GET /items, 4회)" in messages[0]
+    assert "SELECT name FROM items WHERE id = ?" in messages[0]
+
+
+def test_slow_statement_is_logged_with_plan(diagnostics, caplog):
+    """임계값을 넘은 조회는 실행 계획과 함께 기록 (EXPLAIN 자체는 진단/지표 모두 집계하지 않음)"""
+    instance, connection = diagnostics
+    instance.slow_query_ms = 0
+    install_sql_metrics()
+    query_log = RequestQueryLog()
+    stats = RequestDatabaseStats()
+    token = current_query_log.set(query_log)
+    stats_token = current_request_stats.set(stats)
+    try:
+        with caplog.at_level(logging.WARNING, logger=LOGGER_NAME):
+            connection.execute(
+                text("SELECT id FROM items WHERE name = :name"), {"name": "a"}
+            )
+    finally:
+        current_request_stats.reset(stats_token)
+        current_query_log.reset(token)
+
+    assert query_log.statements == 1
+    assert stats.statements == 1
+    message = caplog.records[0].getMessage()
+    assert message.startswith("느린 쿼리")
+    assert "실행 계획:" in message
+    assert "ix_items_name" in message
+
+
+def test_budget_warns_unless_enforced(caplog):
+    """예산을 넘으면 경고하고, enforce_budgets가 켜져 있으면 예외"""
+    instance = QueryDiagnostics(
+        enabled=True,
+        slow_query_ms=10_000,
+        repeated_threshold=100,
+        budgets={("GET", "/items"): 1},
+    )
+    query_log = RequestQueryLog()
+    query_log.statements = 2
+    query_log.fingerprints.update(["SELECT ?", "SELECT ? FROM items"])
+
+    with caplog.at_level(logging.WARNING, logger=LOGGER_NAME):
+        instance.finish_request("GET", "/items", query_log)
+        instance.finish_request("GET", "/other", query_log)
+    assert len(caplog.records) == 1
+    assert caplog.records[0].getMessage().startswith(
+        "GET /items 요청이 SQL 문 2개를 실행했습니다 (예산 1개)"
+    )
+
+    instance.enforce_budgets = True
+    with pytest.raises(QueryBudgetExceeded):
+        instance.finish_request("GET", "/items", query_log)
+
+
+def test_client_requests_are_checked_against_budget(client, test_db: Session, monkeypatch):
+    """테스트 클라이언트 요청이 라우트 예산을 넘으면 테스트가 실패"""
+    user = User(
+        email="budget@example.com",
+        username="budget_user",
+        provider=ProviderType.GITHUB,
+        provider_id="budget123",
+    )
+    test_db.add(user)
+    test_db.commit()
+    test_db.refresh(user)
+    headers = {"Authorization": f"Bearer {AuthController.create_access_token(user)}"}
+
+    assert client.get("/api/bookmark/", headers=headers).status_code == 200
+
+    monkeypatch.setitem(query_diagnostics.budgets, ("GET", "/api/bookmark/"), 1)
+    with pytest.raises(QueryBudgetExceeded, match="GET /api/bookmark/"):
+        client.get("/api/bookmark/", headers=headers, params={"size": 5})
@@ -0,0 +1,45 @@
+import importlib
+import pytest
+from app.models.category import CategoryTreeNode
+from app.utils.upsert import upsert_statement
+
+
+class TestUpsertStatement:
+    """방언별 업서트 구문 생성 테스트"""
+
+    @staticmethod
+    def _compile(dialect_name: str) -> str:
+        statement = upsert_statement(
+            dialect_name,
+            CategoryTreeNode.__table__,
+            ["user_id", "category1", "category2", "category3"],
+            lambda new: {
+                "bookmark_count": CategoryTreeNode.bookmark_count
+                + new.bookmark_count
+            },
+        )
+        dialect = importlib.import_module(
+            f"sqlalchemy.dialects.{dialect_name}"
+        ).dialect()
+        return str(statement.compile(dialect=dialect))
+
+    def test_mysql_uses_on_duplicate_key_update(self):
+        sql = self._compile("mysql")
+        assert "ON DUPLICATE KEY UPDATE" in sql
+        assert "VALUES(bookmark_count)" in sql
+
+    @pytest.mark.parametrize("dialect_name", ["postgresql", "sqlite"])
+    def test_on_conflict_targets_index_elements(self, dialect_name):
+        sql = self._compile(dialect_name)
+        assert (
+            "ON CONFLICT (user_id, category1, category2, category3) DO UPDATE" in sql
+        )
+        assert "excluded.bookmark_count" in sql
+
+    def test_unsupported_dialect_returns_none(self):
+        assert (
+            upsert_statement(
+                "mssql", CategoryTreeNode.__table__, ["user_id"], lambda new: {}
+            )
+            is None
+        )
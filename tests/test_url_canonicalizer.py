@@ -0,0 +1,60 @@
+import pytest
+from app.utils.url_canonicalizer import canonicalize_url, url_hash, URL_HASH_LENGTH
+
+
+class TestCanonicalizeURL:
+    """중복 판별용 URL 정규화 테스트"""
+
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            # 스킴/호스트 대소문자, 기본 포트
+            ("HTTPS://Example.COM:443/Path", "https://example.com/Path"),
+            ("https://example.com:8443/a", "https://example.com:8443/a"),
+            # IPv6 리터럴은 대괄호 유지
+            ("https://[::1]:8443/", "https://[::1]:8443/"),
+            ("https://[2001:DB8::1]:443/a", "https://[2001:db8::1]/a"),
+            # 끝 슬래시, 빈 경로
+            ("https://example.com/a/b/", "https://example.com/a/b"),
+            ("https://example.com", "https://example.com/"),
+            # 추적 파라미터 제거, 나머지 파라미터 정렬
+            (
+                "https://example.com/?utm_source=x&b=2&fbclid=y&a=1&UTM_Medium=z",
+                "https://example.com/?a=1&b=2",
+            ),
+            # 프래그먼트 제거 (해시 라우팅은 유지)
+            ("https://example.com/doc#section", "https://example.com/doc"),
+            ("https://example.com/#/inbox", "https://example.com/#/inbox"),
+        ],
+    )
+    def test_canonicalize_url(self, url, expected):
+        assert canonicalize_url(url) == expected
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://youtu.be/dQw4w9WgXcQ?si=share",
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://m.youtube.com/watch?feature=share&v=dQw4w9WgXcQ&t=42s",
+            "https://youtube.com/shorts/dQw4w9WgXcQ",
+            "https://www.youtube.com/embed/dQw4w9WgXcQ",
+        ],
+    )
+    def test_youtube_urls_are_equivalent(self, url):
+        """YouTube 영상 URL 형식 통일 테스트"""
+        assert canonicalize_url(url) == "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+    def test_youtube_non_video_pages_kept(self):
+        """영상이 아닌 YouTube 페이지는 일반 규칙 적용 테스트"""
+        assert (
+            canonicalize_url("https://www.youtube.com/@channel/videos/")
+            == "https://www.youtube.com/@channel/videos"
+        )
+
+    def test_url_hash(self):
+        """정규화 URL이 같으면 같은 고정 길이 해시 테스트"""
+        digest = url_hash("https://example.com/a?utm_campaign=x")
+
+        assert len(digest) == URL_HASH_LENGTH
+        assert digest == url_hash("https://EXAMPLE.com/a/")
+        assert digest != url_hash("https://example.com/b")